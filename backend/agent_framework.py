@@ -3,11 +3,63 @@ Agent Framework for Code Generation using Ollama LLM
 Provides SimpleAgent class with planning and execution capabilities.
 """
 
-import requests
-import json
-import os
-from typing import List, Dict, Any, Optional
+import asyncio
+import httpx
+import random
+import re
+from typing import Callable, List, Dict, Any, Optional, Tuple
 import time
+from llm_cache import PromptCache
+from ollama_client import create_clients, default_ollama_url, json_dumps, json_loads
+
+_WARNING_SUFFIX = "\n  ⚠ Warning: Consider adding additional validation"
+
+_GENERATED_CODE = """def example_function(param):
+    \"\"\"Generated function based on requirements.\"\"\"
+    try:
+        # Implementation logic here
+        result = process(param)
+        return result
+    except Exception as e:
+        raise ValueError(f"Error processing: {e}")"""
+
+
+# Simulated step handlers: each fills in the result dict in place
+def _handle_analyze(result: Dict[str, Any], step: str) -> None:
+    result["output"] = f"✓ Completed: {step}\n  → Analysis complete, ready for implementation"
+    result["context"]["analyzed"] = True
+
+
+def _handle_implement(result: Dict[str, Any], step: str) -> None:
+    # Generate a simple code snippet
+    result["code"] = _GENERATED_CODE
+    result["output"] = f"✓ Completed: {step}\n  → Code generated successfully"
+    result["context"]["implemented"] = True
+
+
+def _handle_test(result: Dict[str, Any], step: str) -> None:
+    result["output"] = f"✓ Completed: {step}\n  → All tests passed (5/5)\n  → Coverage: 95%"
+    result["context"]["tested"] = True
+
+
+def _handle_document(result: Dict[str, Any], step: str) -> None:
+    result["output"] = f"✓ Completed: {step}\n  → Documentation generated\n  → README.md updated"
+    result["context"]["documented"] = True
+
+
+def _handle_error_handling(result: Dict[str, Any], step: str) -> None:
+    result["output"] = f"✓ Completed: {step}\n  → Error handling added\n  → Validation implemented"
+    result["context"]["error_handling"] = True
+
+
+# Keyword dispatch table for execute_step, in priority order
+_STEP_ACTIONS: List[Tuple["re.Pattern[str]", Callable[[Dict[str, Any], str], None]]] = [
+    (re.compile(r'analyze|design'), _handle_analyze),
+    (re.compile(r'implement|create|write'), _handle_implement),
+    (re.compile(r'test'), _handle_test),
+    (re.compile(r'document'), _handle_document),
+    (re.compile(r'error|handling'), _handle_error_handling),
+]
 
 
 class SimpleAgent:
@@ -20,7 +72,8 @@ class SimpleAgent:
     - Set OLLAMA_URL environment variable to override default
     """
     
-    def __init__(self, ollama_url: str = None, model: str = "llama2"):
+    def __init__(self, ollama_url: str = None, model: str = "llama2",
+                 prompt_cache_size: int = 1024, seed: Optional[int] = None):
         """
         Initialize the SimpleAgent.
         
@@ -30,34 +83,31 @@ class SimpleAgent:
                        2. host.docker.internal:11434 (for Docker)
                        3. localhost:11434 (fallback)
             model: Name of the Ollama model to use
+            prompt_cache_size: Max cached LLM responses for cacheable prompts
+            seed: Seed for the simulated-warning RNG (for reproducible runs)
         """
         # Determine Ollama URL with intelligent defaults
+        # (resolution of host.docker.internal is done once per process)
         if ollama_url is None:
-            ollama_url = os.getenv('OLLAMA_URL')
-            if ollama_url is None:
-                # Try host.docker.internal first (works in Docker Desktop)
-                # Falls back to localhost for non-Docker environments
-                try:
-                    # Test if we can resolve host.docker.internal
-                    import socket
-                    socket.gethostbyname('host.docker.internal')
-                    ollama_url = "http://host.docker.internal:11434/api/generate"
-                except (socket.gaierror, OSError):
-                    # Fallback to localhost (native execution)
-                    ollama_url = "http://localhost:11434/api/generate"
+            ollama_url = default_ollama_url()
         
         self.ollama_url = ollama_url
         self.model = model
-        self.session = requests.Session()
+        self.session, self._aclient = create_clients(timeout=60)
+        self._prompt_cache = PromptCache(max_entries=prompt_cache_size)
+        self._rng = random.Random(seed)
         print(f"🦉 SimpleAgent initialized with Ollama URL: {self.ollama_url}")
         
-    def _call_ollama(self, prompt: str, stream: bool = False) -> str:
+    def _call_ollama(self, prompt: str, stream: bool = False, cacheable: bool = False) -> str:
         """
-        Make a request to the Ollama API.
+        Make a blocking request to the Ollama API.
+        
+        Kept for synchronous callers; async code should use _call_ollama_async.
         
         Args:
             prompt: The prompt to send to the LLM
             stream: Whether to stream the response
+            cacheable: Reuse a previous response for an identical prompt
             
         Returns:
             The generated text response
@@ -65,6 +115,12 @@ class SimpleAgent:
         Raises:
             Exception: If the API call fails
         """
+        key = PromptCache.make_key(self.model, prompt) if cacheable else None
+        if key is not None:
+            cached = self._prompt_cache.get(key)
+            if cached is not None:
+                return cached
+        
         payload = {
             "model": self.model,
             "prompt": prompt,
@@ -72,33 +128,96 @@ class SimpleAgent:
         }
         
         try:
-            response = self.session.post(
-                self.ollama_url,
-                json=payload,
-                timeout=60
-            )
-            response.raise_for_status()
+            if stream:
+                # Handle streaming response
+                full_response = ""
+                with self.session.stream("POST", self.ollama_url, content=json_dumps(payload)) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines():
+                        if line:
+                            data = json_loads(line)
+                            if "response" in data:
+                                full_response += data["response"]
+                            if data.get("done", False):
+                                break
+                text = full_response
+            else:
+                # Handle non-streaming response
+                response = self.session.post(self.ollama_url, content=json_dumps(payload))
+                response.raise_for_status()
+                data = json_loads(response.content)
+                text = data.get("response", "")
+                
+        except httpx.HTTPError as e:
+            raise Exception(f"Failed to call Ollama API: {str(e)}")
+        
+        if key is not None:
+            self._prompt_cache.put(key, text)
+        return text
+    
+    async def _call_ollama_async(self, prompt: str, stream: bool = False,
+                                 cacheable: bool = False) -> str:
+        """
+        Make a non-blocking request to the Ollama API.
+        
+        Args:
+            prompt: The prompt to send to the LLM
+            stream: Whether to stream the response
+            cacheable: Reuse a previous response for an identical prompt
             
+        Returns:
+            The generated text response
+            
+        Raises:
+            Exception: If the API call fails
+        """
+        key = PromptCache.make_key(self.model, prompt) if cacheable else None
+        if key is not None:
+            cached = self._prompt_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream
+        }
+        
+        try:
             if stream:
                 # Handle streaming response
                 full_response = ""
-                for line in response.iter_lines():
-                    if line:
-                        data = json.loads(line)
-                        if "response" in data:
-                            full_response += data["response"]
-                        if data.get("done", False):
-                            break
-                return full_response
+                async with self._aclient.stream("POST", self.ollama_url,
+                                                content=json_dumps(payload)) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if line:
+                            data = json_loads(line)
+                            if "response" in data:
+                                full_response += data["response"]
+                            if data.get("done", False):
+                                break
+                text = full_response
             else:
                 # Handle non-streaming response
-                data = response.json()
-                return data.get("response", "")
+                response = await self._aclient.post(self.ollama_url, content=json_dumps(payload))
+                response.raise_for_status()
+                data = json_loads(response.content)
+                text = data.get("response", "")
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise Exception(f"Failed to call Ollama API: {str(e)}")
+        
+        if key is not None:
+            self._prompt_cache.put(key, text)
+        return text
     
-    def plan(self, task: str) -> List[str]:
+    async def aclose(self) -> None:
+        """Close the underlying HTTP clients."""
+        self.session.close()
+        await self._aclient.aclose()
+    
+    async def plan(self, task: str) -> List[str]:
         """
         Generate a detailed plan for the given task using the LLM.
         
@@ -117,7 +236,7 @@ Task: {task}
 Plan (provide 3-7 specific steps):"""
 
         try:
-            response = self._call_ollama(planning_prompt, stream=False)
+            response = await self._call_ollama_async(planning_prompt, stream=False, cacheable=True)
             
             # Parse the response into individual steps
             lines = response.strip().split('\n')
@@ -156,26 +275,30 @@ Plan (provide 3-7 specific steps):"""
                 "Complete implementation"
             ]
     
-    def execute_step(self, step: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def execute_step(self, step: str, context: Optional[Dict[str, Any]] = None,
+                     simulate_delay: bool = False) -> Dict[str, Any]:
         """
         Simulate execution of a plan step.
         
         Args:
             step: The step description to execute
-            context: Optional context from previous steps
+            context: Optional context from previous steps (updated in place)
+            simulate_delay: Sleep 0.5s to mimic real execution time (demo only)
             
         Returns:
             A dictionary containing:
                 - status: 'success' or 'error'
                 - output: The simulated output/result
                 - code: Optional code snippet generated
-                - context: Updated context for next steps
+                - context: Updated context for next steps (the same dict
+                  that was passed in, as in AutonomousAgent.execute_step)
         """
         if context is None:
             context = {}
         
-        # Simulate execution time
-        time.sleep(0.5)
+        # Simulate execution time (opt-in, the result does not depend on it)
+        if simulate_delay:
+            time.sleep(0.5)
         
         # Generate simulated output based on the step
         step_lower = step.lower()
@@ -184,69 +307,48 @@ Plan (provide 3-7 specific steps):"""
             "status": "success",
             "output": "",
             "code": None,
-            "context": context.copy()
+            "context": context
         }
         
-        # Simulate different types of steps
-        if "analyze" in step_lower or "design" in step_lower:
-            result["output"] = f"✓ Completed: {step}\n  → Analysis complete, ready for implementation"
-            result["context"]["analyzed"] = True
-            
-        elif "implement" in step_lower or "create" in step_lower or "write" in step_lower:
-            # Generate a simple code snippet
-            result["code"] = """def example_function(param):
-    \"\"\"Generated function based on requirements.\"\"\"
-    try:
-        # Implementation logic here
-        result = process(param)
-        return result
-    except Exception as e:
-        raise ValueError(f"Error processing: {e}")"""
-            result["output"] = f"✓ Completed: {step}\n  → Code generated successfully"
-            result["context"]["implemented"] = True
-            
-        elif "test" in step_lower:
-            result["output"] = f"✓ Completed: {step}\n  → All tests passed (5/5)\n  → Coverage: 95%"
-            result["context"]["tested"] = True
-            
-        elif "document" in step_lower:
-            result["output"] = f"✓ Completed: {step}\n  → Documentation generated\n  → README.md updated"
-            result["context"]["documented"] = True
-            
-        elif "error" in step_lower or "handling" in step_lower:
-            result["output"] = f"✓ Completed: {step}\n  → Error handling added\n  → Validation implemented"
-            result["context"]["error_handling"] = True
-            
+        # Simulate different types of steps (first matching action wins)
+        for pattern, handler in _STEP_ACTIONS:
+            if pattern.search(step_lower):
+                handler(result, step)
+                break
         else:
             result["output"] = f"✓ Completed: {step}\n  → Step executed successfully"
         
         # Simulate occasional warnings (10% chance)
-        import random
-        if random.random() < 0.1:
-            result["output"] += "\n  ⚠ Warning: Consider adding additional validation"
+        if self._rng.random() < 0.1:
+            result["output"] += _WARNING_SUFFIX
         
         return result
 
 
 # Example usage
 if __name__ == "__main__":
-    agent = SimpleAgent()
-    
-    # Test planning
-    task = "Create a Python function to calculate fibonacci numbers"
-    print(f"Task: {task}\n")
-    
-    plan = agent.plan(task)
-    print("Plan:")
-    for i, step in enumerate(plan, 1):
-        print(f"  {i}. {step}")
+    async def main():
+        agent = SimpleAgent()
+        
+        # Test planning
+        task = "Create a Python function to calculate fibonacci numbers"
+        print(f"Task: {task}\n")
+        
+        plan = await agent.plan(task)
+        print("Plan:")
+        for i, step in enumerate(plan, 1):
+            print(f"  {i}. {step}")
+        
+        print("\nExecution:")
+        context = {}
+        for i, step in enumerate(plan, 1):
+            print(f"\n[Step {i}] {step}")
+            result = agent.execute_step(step, context)
+            print(result["output"])
+            if result["code"]:
+                print(f"\nGenerated code:\n{result['code']}")
+            context = result["context"]
+        
+        await agent.aclose()
     
-    print("\nExecution:")
-    context = {}
-    for i, step in enumerate(plan, 1):
-        print(f"\n[Step {i}] {step}")
-        result = agent.execute_step(step, context)
-        print(result["output"])
-        if result["code"]:
-            print(f"\nGenerated code:\n{result['code']}")
-        context = result["context"]
+    asyncio.run(main())
@@ -3,15 +3,144 @@ ArbiterAI 2.0 - Enhanced Agent Framework
 Autonomous code executor with real tool execution, reflection, and memory.
 """
 
-import requests
+import asyncio
 import json
 import os
 import re
-from typing import List, Dict, Any, Optional
+import stat
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, Iterator, List, Dict, Any, Optional, Tuple
 from pathlib import Path
+from llm_cache import GenerativeCache, PromptCache, SemanticCache
+from ollama_client import create_clients, default_ollama_url, json_dumps, json_loads
 from toolbox import Toolbox, ToolExecutionResult
 
 
+# Pattern used on every line of every plan response, compiled once
+_STEP_PREFIX_RE = re.compile(r'^(\d+[\.\):]?\s*|Step\s+\d+[\.\):]?\s*|-\s*|\*\s*)', re.IGNORECASE)
+
+# System prompts are static, so Ollama can reuse their prefix across calls
+_PLAN_SYSTEM_PROMPT = """You are an expert coding assistant. Create detailed, executable plans.
+Each step should be specific and actionable. Focus on concrete actions like:
+- "Create file X with content Y"
+- "Run command Z"
+- "Install package A"
+Keep steps clear and sequential."""
+
+_TOOL_SYSTEM_PROMPT = """You are a tool selector. Analyze the step and choose the right tool.
+
+Available tools:
+- shell: Execute shell commands (args: command)
+- write_file: Create/update files (args: filepath, content)
+- read_file: Read file contents (args: filepath)
+- delete_file: Delete a file (args: filepath)
+- list_files: List directory contents (args: directory)
+- web_fetch: HTTP request (args: url, method, data)
+
+Respond ONLY with JSON: {"tool": "tool_name", "args": {...}}"""
+
+_REFLECT_SYSTEM_PROMPT = """You are an expert debugger. Analyze errors and create correction plans.
+Focus on fixing the root cause, not just symptoms."""
+
+
+# Fallback tool guesses: build tool args from (step, step_lower)
+def _guess_write_file(step: str, step_lower: str) -> Dict[str, Any]:
+    return {"tool": "write_file", "args": {"filepath": "output.txt", "content": "# TODO"}}
+
+
+def _guess_shell(step: str, step_lower: str) -> Dict[str, Any]:
+    # Extract command
+    cmd = step.split('run')[-1].strip() if 'run' in step_lower else step
+    return {"tool": "shell", "args": {"command": cmd}}
+
+
+def _guess_list_files(step: str, step_lower: str) -> Dict[str, Any]:
+    return {"tool": "list_files", "args": {"directory": "."}}
+
+
+# Keyword dispatch table for _guess_tool, in priority order
+_TOOL_GUESSES: List[Tuple["re.Pattern[str]", Callable[[str, str], Dict[str, Any]]]] = [
+    (re.compile(r'create file|write file|save'), _guess_write_file),
+    (re.compile(r'run|execute|install|npm|pip|python'), _guess_shell),
+    (re.compile(r'read|check'), _guess_list_files),
+]
+
+
+class LazyFile:
+    """
+    Workspace file in the agent context, read only when its content is needed.
+    
+    Context keeps one of these per file instead of the file text, so memory
+    stays proportional to the number of files rather than their total size.
+    """
+    
+    __slots__ = ("path", "size")
+    
+    # Files larger than this are never inlined into prompts or results
+    MAX_INLINE = 64 * 1024
+    
+    def __init__(self, path: Path, size: Optional[int] = None):
+        self.path = path
+        self.size = path.stat().st_size if size is None else size
+    
+    def read(self) -> Optional[str]:
+        """Read the file as UTF-8, or None if too large, binary or unreadable."""
+        if self.size > self.MAX_INLINE:
+            return None
+        try:
+            return self.path.read_bytes().decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __repr__(self) -> str:
+        return f"LazyFile({str(self.path)!r}, size={self.size})"
+
+
+class _JsonObjectScanner:
+    """
+    Incremental brace counter that finds the first complete JSON object
+    in streamed text, ignoring braces inside string literals.
+    """
+    
+    def __init__(self):
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, chunk: str) -> Optional[str]:
+        """Consume a chunk; return the object text once its closing brace arrives."""
+        for char in chunk:
+            if self._depth == 0 and char != '{':
+                continue  # Prose before the object
+            self._buffer.append(char)
+            
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == '{':
+                self._depth += 1
+            elif char == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    return "".join(self._buffer)
+        return None
+
+
+def _extract_first_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} object in text, or None."""
+    return _JsonObjectScanner().feed(text)
+
+
 class AutonomousAgent:
     """
     Autonomous agent that executes real tasks using tools, reflects on errors,
@@ -21,7 +150,10 @@ class AutonomousAgent:
     def __init__(self, 
                  ollama_url: str = None,
                  model: str = "deepseek-coder",
-                 workspace: str = "/tmp/arbiter_workspace"):
+                 workspace: str = "/tmp/arbiter_workspace",
+                 prompt_cache_size: int = 1024,
+                 semantic_cache_threshold: Optional[float] = 0.92,
+                 generative_cache_threshold: Optional[float] = 0.85):
         """
         Initialize the Autonomous Agent.
         
@@ -29,22 +161,38 @@ class AutonomousAgent:
             ollama_url: URL of Ollama API (auto-detected if None)
             model: LLM model to use (deepseek-coder recommended for code tasks)
             workspace: Directory for file operations and command execution
+            prompt_cache_size: Max cached LLM responses for cacheable prompts
+            semantic_cache_threshold: Cosine similarity at which a near-duplicate
+                plan prompt reuses a cached response (None disables)
+            generative_cache_threshold: Cosine similarity at which a cached response
+                for the same prompt template is adapted to a new task/step (None disables)
         """
         # Determine Ollama URL
         if ollama_url is None:
-            ollama_url = os.getenv('OLLAMA_URL')
-            if ollama_url is None:
-                try:
-                    import socket
-                    socket.gethostbyname('host.docker.internal')
-                    ollama_url = "http://host.docker.internal:11434/api/generate"
-                except (socket.gaierror, OSError):
-                    ollama_url = "http://localhost:11434/api/generate"
+            ollama_url = default_ollama_url()
         
         self.ollama_url = ollama_url
         self.model = model
+        self.temperature = 0.7
         self.workspace = workspace
-        self.session = requests.Session()
+        self._prompt_cache = PromptCache(max_entries=prompt_cache_size)
+        
+        # Semantic cache for plan(), using Ollama embeddings. Tool selection only
+        # uses exact prompt hits: a near-duplicate step would replay another
+        # step's arguments (file contents, paths, commands).
+        self.embed_model = os.getenv('OLLAMA_EMBED_MODEL', 'nomic-embed-text')
+        self.embed_url = ollama_url.rsplit('/api/', 1)[0] + "/api/embeddings"
+        self._embeddings_available = (semantic_cache_threshold is not None or
+                                      generative_cache_threshold is not None)
+        self._semantic_enabled = semantic_cache_threshold is not None
+        self._plan_cache = SemanticCache(threshold=semantic_cache_threshold or 1.0)
+        
+        # Generative cache adapts responses across prompts sharing a template
+        self._generative_enabled = generative_cache_threshold is not None
+        self._gen_cache = GenerativeCache(threshold=generative_cache_threshold or 1.0)
+        
+        self.session, self._aclient = create_clients(timeout=120)
+        self._files_listing_cache: tuple = ((), "[]")
         self.toolbox = Toolbox(workspace=workspace)
         
         print(f"🦉 AutonomousAgent initialized")
@@ -52,14 +200,14 @@ class AutonomousAgent:
         print(f"   Ollama: {self.ollama_url}")
         print(f"   Workspace: {self.workspace}")
     
-    def _call_ollama(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Call Ollama LLM with a prompt."""
+    def _build_payload(self, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Build the Ollama generate request body."""
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
             "options": {
-                "temperature": 0.7,
+                "temperature": self.temperature,
                 "top_p": 0.9,
             }
         }
@@ -67,18 +215,189 @@ class AutonomousAgent:
         if system_prompt:
             payload["system"] = system_prompt
         
+        return payload
+    
+    def _cache_key(self, prompt: str, system_prompt: Optional[str], cacheable: bool) -> Optional[bytes]:
+        """
+        Get the prompt cache key for a call, or None if it must not be cached.
+        
+        Sampled (temperature > 0) calls are only cached when the caller opts in,
+        so stochastic generations are not silently deduplicated.
+        """
+        if not (cacheable or self.temperature == 0):
+            return None
+        return PromptCache.make_key(self.model, system_prompt, prompt, self.temperature)
+    
+    def _iter_ollama(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[str]:
+        """Yield response tokens from Ollama as they are generated (blocking)."""
+        with self.session.stream(
+            "POST", self.ollama_url, content=json_dumps(self._build_payload(prompt, system_prompt))
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json_loads(line)
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done", False):
+                    break
+    
+    async def _stream_ollama(self, prompt: str,
+                             system_prompt: Optional[str] = None) -> AsyncIterator[str]:
+        """Yield response tokens from Ollama as they are generated."""
+        async with self._aclient.stream(
+            "POST", self.ollama_url, content=json_dumps(self._build_payload(prompt, system_prompt))
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = json_loads(line)
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done", False):
+                    break
+    
+    def _call_ollama(self, prompt: str, system_prompt: Optional[str] = None,
+                     cacheable: bool = False) -> str:
+        """Call Ollama LLM with a prompt (blocking)."""
+        key = self._cache_key(prompt, system_prompt, cacheable)
+        if key is not None:
+            cached = self._prompt_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        try:
+            text = "".join(self._iter_ollama(prompt, system_prompt)).strip()
+        except Exception as e:
+            raise Exception(f"Ollama API call failed: {str(e)}")
+        
+        if key is not None:
+            self._prompt_cache.put(key, text)
+        return text
+    
+    async def _call_ollama_async(self, prompt: str, system_prompt: Optional[str] = None,
+                                 cacheable: bool = False, json_object: bool = False) -> str:
+        """
+        Call Ollama LLM with a prompt without blocking the event loop.
+        
+        With json_object=True, generation is abandoned as soon as the first
+        complete JSON object has streamed in, and only that object is returned
+        (falling back to the full text if no object closes).
+        """
+        key = self._cache_key(prompt, system_prompt, cacheable)
+        if key is not None:
+            cached = self._prompt_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        scanner = _JsonObjectScanner() if json_object else None
+        tokens = []
+        text = None
         try:
-            response = self.session.post(
-                self.ollama_url,
-                json=payload,
-                timeout=120
+            async with aclosing(self._stream_ollama(prompt, system_prompt)) as stream:
+                async for token in stream:
+                    tokens.append(token)
+                    if scanner is not None:
+                        text = scanner.feed(token)
+                        if text is not None:
+                            break  # Closing the stream stops the generation
+        except Exception as e:
+            raise Exception(f"Ollama API call failed: {str(e)}")
+        
+        if text is None:
+            text = "".join(tokens).strip()
+        
+        if key is not None:
+            self._prompt_cache.put(key, text)
+        return text
+    
+    async def _embed_async(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text with the Ollama embedding model.
+        
+        Returns None (and stops trying) if the embedding model is unavailable,
+        so the semantic cache degrades to a no-op instead of failing calls.
+        """
+        if not self._embeddings_available:
+            return None
+        
+        try:
+            response = await self._aclient.post(
+                self.embed_url,
+                content=json_dumps({"model": self.embed_model, "prompt": text})
             )
             response.raise_for_status()
-            return response.json().get("response", "").strip()
+            embedding = json_loads(response.content).get("embedding")
+            if embedding:
+                return embedding
         except Exception as e:
-            raise Exception(f"Ollama API call failed: {str(e)}")
+            print(f"⚠️ Embeddings unavailable ({e}), semantic cache disabled")
+        
+        self._embeddings_available = False
+        return None
+    
+    async def _call_ollama_semantic(self, prompt: str, system_prompt: Optional[str],
+                                    cache: SemanticCache, slot: str,
+                                    slot_context: str = "", json_object: bool = False) -> str:
+        """
+        Call Ollama, reusing cached responses for similar prompts.
+        
+        Lookups go from cheapest to most expensive: exact prompt match, then
+        semantic match on the whole prompt, then generative adaptation of a
+        response from the same template (the prompt with slot and slot_context
+        masked out) whose slot is close to this one.
+        
+        Args:
+            prompt: Full prompt text
+            system_prompt: System prompt
+            cache: Semantic cache for this call site
+            slot: Variable part of the prompt (task or step text)
+            slot_context: Optional variable context (e.g. file listing) masked
+                out of the template
+            json_object: Stop generating once a complete JSON object arrives
+        """
+        cached = self._prompt_cache.get(self._cache_key(prompt, system_prompt, True))
+        if cached is not None:
+            return cached
+        
+        embedding = None
+        if self._semantic_enabled:
+            embedding = await self._embed_async(SemanticCache.normalize(prompt))
+            if embedding is not None:
+                cached = cache.lookup(embedding)
+                if cached is not None:
+                    return cached
+        
+        slot_embedding = None
+        template_key = None
+        if self._generative_enabled:
+            template = prompt.replace(slot_context, "", 1) if slot_context else prompt
+            template = template.replace(slot, "\x00", 1)
+            template_key = PromptCache.make_key(system_prompt, template)
+            slot_embedding = await self._embed_async(SemanticCache.normalize(slot))
+            if slot_embedding is not None:
+                cached = self._gen_cache.lookup(template_key, slot, slot_embedding)
+                if cached is not None:
+                    return cached
+        
+        response = await self._call_ollama_async(
+            prompt, system_prompt, cacheable=True, json_object=json_object
+        )
+        if embedding is not None:
+            cache.store(embedding, response)
+        if slot_embedding is not None:
+            self._gen_cache.store(template_key, slot, slot_embedding, response)
+        return response
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP clients and the toolbox (sandbox containers)."""
+        self.session.close()
+        await self._aclient.aclose()
+        await self.toolbox.aclose()
     
-    def plan(self, task: str, context: Optional[Dict] = None) -> List[str]:
+    async def plan(self, task: str, context: Optional[Dict] = None) -> List[str]:
         """
         Generate a detailed execution plan for the task.
         
@@ -91,14 +410,9 @@ class AutonomousAgent:
         """
         context_info = ""
         if context and context.get('files'):
-            context_info = f"\n\nCurrent project files:\n{json.dumps(list(context['files'].keys()), indent=2)}"
+            context_info = f"\n\nCurrent project files:\n{self._files_listing(context['files'])}"
         
-        system_prompt = """You are an expert coding assistant. Create detailed, executable plans.
-Each step should be specific and actionable. Focus on concrete actions like:
-- "Create file X with content Y"
-- "Run command Z"
-- "Install package A"
-Keep steps clear and sequential."""
+        system_prompt = _PLAN_SYSTEM_PROMPT
         
         prompt = f"""Task: {task}{context_info}
 
@@ -106,13 +420,28 @@ Create a step-by-step plan (3-7 steps). Each step should be ONE specific action.
 Format as a numbered list."""
         
         try:
-            response = self._call_ollama(prompt, system_prompt)
+            response = await self._call_ollama_semantic(
+                prompt, system_prompt, self._plan_cache,
+                slot=task, slot_context=context_info
+            )
             steps = self._parse_plan(response)
             return steps if steps else self._fallback_plan(task)
         except Exception as e:
             print(f"⚠️ Planning failed: {e}")
             return self._fallback_plan(task)
     
+    def _files_listing(self, files: Dict[str, LazyFile]) -> str:
+        """
+        JSON listing of workspace file names for prompts.
+        
+        Memoized on the set of names, which only changes on write/delete,
+        so plan and select_tool calls in between reuse the same string.
+        """
+        names = tuple(files)
+        if self._files_listing_cache[0] != names:
+            self._files_listing_cache = (names, json.dumps(list(names), indent=2))
+        return self._files_listing_cache[1]
+    
     def _parse_plan(self, response: str) -> List[str]:
         """Parse LLM response into list of steps."""
         steps = []
@@ -121,7 +450,7 @@ Format as a numbered list."""
             if not line:
                 continue
             # Remove numbering
-            cleaned = re.sub(r'^(\d+[\.\):]?\s*|Step\s+\d+[\.\):]?\s*|-\s*|\*\s*)', '', line, flags=re.IGNORECASE)
+            cleaned = _STEP_PREFIX_RE.sub('', line)
             if cleaned:
                 steps.append(cleaned)
         return steps[:7]
@@ -136,7 +465,7 @@ Format as a numbered list."""
             "Complete task"
         ]
     
-    def select_tool(self, step: str, context: Dict) -> Dict[str, Any]:
+    async def select_tool(self, step: str, context: Dict) -> Dict[str, Any]:
         """
         Use LLM to select appropriate tool and extract arguments.
         
@@ -149,30 +478,22 @@ Format as a numbered list."""
         """
         files_info = ""
         if context.get('files'):
-            files_info = f"\nCurrent files:\n{json.dumps(list(context['files'].keys()), indent=2)}"
+            files_info = f"\nCurrent files:\n{self._files_listing(context['files'])}"
         
-        system_prompt = """You are a tool selector. Analyze the step and choose the right tool.
-
-Available tools:
-- shell: Execute shell commands (args: command)
-- write_file: Create/update files (args: filepath, content)
-- read_file: Read file contents (args: filepath)
-- delete_file: Delete a file (args: filepath)
-- list_files: List directory contents (args: directory)
-- web_fetch: HTTP request (args: url, method, data)
-
-Respond ONLY with JSON: {"tool": "tool_name", "args": {...}}"""
+        system_prompt = _TOOL_SYSTEM_PROMPT
         
         prompt = f"""Step: {step}{files_info}
 
 Which tool should be used? Provide JSON response."""
         
         try:
-            response = self._call_ollama(prompt, system_prompt)
-            # Extract JSON from response
-            json_match = re.search(r'\{[^{}]*\}', response)
-            if json_match:
-                return json.loads(json_match.group())
+            response = await self._call_ollama_async(
+                prompt, system_prompt, cacheable=True, json_object=True
+            )
+            # Extract JSON from response (first balanced object, nesting allowed)
+            blob = _extract_first_json_object(response)
+            if blob:
+                return json_loads(blob)
             # Fallback: guess based on keywords
             return self._guess_tool(step)
         except Exception as e:
@@ -183,18 +504,12 @@ Which tool should be used? Provide JSON response."""
         """Fallback tool selection based on keywords."""
         step_lower = step.lower()
         
-        if any(word in step_lower for word in ['create file', 'write file', 'save']):
-            return {"tool": "write_file", "args": {"filepath": "output.txt", "content": "# TODO"}}
-        elif any(word in step_lower for word in ['run', 'execute', 'install', 'npm', 'pip', 'python']):
-            # Extract command
-            cmd = step.split('run')[-1].strip() if 'run' in step_lower else step
-            return {"tool": "shell", "args": {"command": cmd}}
-        elif 'read' in step_lower or 'check' in step_lower:
-            return {"tool": "list_files", "args": {"directory": "."}}
-        else:
-            return {"tool": "shell", "args": {"command": "echo 'Step: " + step + "'"}}
+        for pattern, guess in _TOOL_GUESSES:
+            if pattern.search(step_lower):
+                return guess(step, step_lower)
+        return {"tool": "shell", "args": {"command": "echo 'Step: " + step + "'"}}
     
-    def execute_step(self, step: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_step(self, step: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a single step using real tools.
         
@@ -206,18 +521,18 @@ Which tool should be used? Provide JSON response."""
             {success: bool, output: str, error: str, context: dict, tool_used: str}
         """
         # Select tool
-        tool_selection = self.select_tool(step, context)
+        tool_selection = await self.select_tool(step, context)
         tool_name = tool_selection.get('tool', 'shell')
         tool_args = tool_selection.get('args', {})
         
         print(f"🔧 Tool: {tool_name} | Args: {tool_args}")
         
-        # Execute tool
-        result: ToolExecutionResult = self.toolbox.execute_tool(tool_name, **tool_args)
+        # Execute tool without blocking the event loop
+        result: ToolExecutionResult = await self.toolbox.aexecute_tool(tool_name, **tool_args)
         
-        # Update context with file changes
-        if tool_name in ['write_file', 'delete_file']:
-            context['files'] = self._scan_workspace()
+        # Update context with file changes (only the touched path, no rescan)
+        if result.success and tool_name in ['write_file', 'delete_file']:
+            self._update_file_context(context, tool_name, tool_args)
         
         # Track execution history
         if 'history' not in context:
@@ -238,8 +553,8 @@ Which tool should be used? Provide JSON response."""
             "tool_args": tool_args
         }
     
-    def _scan_workspace(self) -> Dict[str, str]:
-        """Scan workspace and read all files into context."""
+    def _scan_workspace(self) -> Dict[str, LazyFile]:
+        """Scan workspace and index all files into context (contents load lazily)."""
         files = {}
         workspace_path = Path(self.workspace)
         
@@ -247,17 +562,60 @@ Which tool should be used? Provide JSON response."""
             return files
         
         for filepath in workspace_path.rglob('*'):
-            if filepath.is_file():
-                try:
-                    relative_path = filepath.relative_to(workspace_path)
-                    content = filepath.read_text()
-                    files[str(relative_path)] = content
-                except Exception:
-                    pass  # Skip unreadable files
+            try:
+                st = filepath.stat()
+            except OSError:
+                continue  # Skip files removed or unreadable mid-scan
+            if stat.S_ISREG(st.st_mode):
+                relative_path = filepath.relative_to(workspace_path)
+                files[str(relative_path)] = LazyFile(filepath, st.st_size)
         
         return files
     
-    def reflect_on_error(self, 
+    def export_files(self, context: Dict[str, Any]) -> Dict[str, str]:
+        """Read context['files'] into {path: content}, skipping non-inlineable files."""
+        contents = {}
+        for name, lazy_file in context.get('files', {}).items():
+            content = lazy_file.read()
+            if content is not None:
+                contents[name] = content
+        return contents
+    
+    def _update_file_context(self, context: Dict[str, Any], tool_name: str,
+                             tool_args: Dict[str, Any]) -> None:
+        """Apply a successful write_file/delete_file to context['files']."""
+        files = context.setdefault('files', {})
+        key = self._workspace_key(tool_args.get('filepath', ''))
+        if key is None:
+            return
+        
+        if tool_name == 'write_file':
+            try:
+                files[key] = LazyFile(Path(self.workspace).resolve() / key)
+            except OSError:
+                files.pop(key, None)
+        else:
+            files.pop(key, None)
+    
+    def _workspace_key(self, filepath: str) -> Optional[str]:
+        """Map a tool filepath to its context['files'] key (workspace-relative)."""
+        root = Path(self.workspace).resolve()
+        try:
+            return str((root / filepath).resolve().relative_to(root))
+        except (OSError, ValueError):
+            return None
+    
+    def rescan(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reload context['files'] from disk.
+        
+        Needed after changes the agent does not track, e.g. files created by
+        shell commands.
+        """
+        context['files'] = self._scan_workspace()
+        return context
+    
+    async def reflect_on_error(self, 
                         original_task: str,
                         failed_step: str,
                         error: str,
@@ -286,8 +644,7 @@ Which tool should be used? Provide JSON response."""
                 for h in recent
             ])
         
-        system_prompt = """You are an expert debugger. Analyze errors and create correction plans.
-Focus on fixing the root cause, not just symptoms."""
+        system_prompt = _REFLECT_SYSTEM_PROMPT
         
         prompt = f"""Original Task: {original_task}
 
@@ -301,7 +658,7 @@ Analyze the error and create a NEW plan to:
 Provide 2-5 corrective steps as a numbered list."""
         
         try:
-            response = self._call_ollama(prompt, system_prompt)
+            response = await self._call_ollama_async(prompt, system_prompt)
             correction_plan = self._parse_plan(response)
             return correction_plan if correction_plan else [
                 "Investigate error cause",
@@ -324,34 +681,41 @@ Provide 2-5 corrective steps as a numbered list."""
 
 # Example usage
 if __name__ == "__main__":
-    agent = AutonomousAgent()
-    
-    task = "Create a Python hello world script"
-    print(f"\n📋 Task: {task}\n")
+    from logging_config import configure_logging
+    configure_logging()
     
-    # Initialize context
-    context = agent.initialize_context(task)
-    
-    # Generate plan
-    plan = agent.plan(task, context)
-    print("📝 Plan:")
-    for i, step in enumerate(plan, 1):
-        print(f"  {i}. {step}")
-    
-    # Execute plan
-    print("\n⚙️ Execution:")
-    for i, step in enumerate(plan, 1):
-        print(f"\n[Step {i}/{len(plan)}] {step}")
-        result = agent.execute_step(step, context)
+    async def main():
+        agent = AutonomousAgent()
         
-        if result['success']:
-            print(f"✅ {result['output']}")
-        else:
-            print(f"❌ Error: {result['error']}")
-            # Reflect on error
-            correction = agent.reflect_on_error(task, step, result['error'], context)
-            print(f"🤔 Correction plan: {correction}")
+        task = "Create a Python hello world script"
+        print(f"\n📋 Task: {task}\n")
+        
+        # Initialize context
+        context = agent.initialize_context(task)
+        
+        # Generate plan
+        plan = await agent.plan(task, context)
+        print("📝 Plan:")
+        for i, step in enumerate(plan, 1):
+            print(f"  {i}. {step}")
+        
+        # Execute plan (steps share context, so they run in order)
+        print("\n⚙️ Execution:")
+        for i, step in enumerate(plan, 1):
+            print(f"\n[Step {i}/{len(plan)}] {step}")
+            result = await agent.execute_step(step, context)
+            
+            if result['success']:
+                print(f"✅ {result['output']}")
+            else:
+                print(f"❌ Error: {result['error']}")
+                # Reflect on error
+                correction = await agent.reflect_on_error(task, step, result['error'], context)
+                print(f"🤔 Correction plan: {correction}")
+            
+            context = result['context']
         
-        context = result['context']
+        print(f"\n📁 Files created: {list(context.get('files', {}).keys())}")
+        await agent.aclose()
     
-    print(f"\n📁 Files created: {list(context.get('files', {}).keys())}")
+    asyncio.run(main())
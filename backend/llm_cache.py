@@ -0,0 +1,255 @@
+"""
+ArbiterAI LLM Response Caching
+Caches Ollama responses so repeated prompts skip the LLM round-trip.
+"""
+
+import difflib
+import hashlib
+import math
+import re
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def _unit(vector: Sequence[float]) -> List[float]:
+    """Scale a vector to unit length so dot products are cosine similarities."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return list(vector)
+    return [x / norm for x in vector]
+
+
+class PromptCache:
+    """
+    Exact-match LRU cache for LLM responses.
+
+    Keys are BLAKE2b digests of everything that influences the generation
+    (model, system prompt, prompt, sampling options), so two calls only
+    share an entry when the request bodies would be identical.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses (oldest evicted first)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts) -> bytes:
+        """Hash the request components into a compact cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x00")  # Separator so ("ab", "c") != ("a", "bc")
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key: bytes, response: str) -> None:
+        """Store a response, evicting the least recently used entry on overflow."""
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticCache:
+    """
+    Similarity cache for LLM responses to near-duplicate prompts.
+
+    Entries are (unit-length embedding, response) pairs. A lookup returns the
+    closest stored response whose cosine similarity reaches the threshold.
+    The scan is brute force, which is cheap at the few hundred entries an
+    agent session accumulates.
+    """
+
+    # List markers the planner and LLM put in front of steps ("1.", "Step 2:", "-")
+    _NUMBERING_RE = re.compile(
+        r'^\s*(?:\d+[\.\):]|step\s+\d+[\.\):]?|[-*])\s*',
+        re.IGNORECASE | re.MULTILINE
+    )
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum number of cached responses (oldest evicted first)
+        """
+        self.threshold = threshold
+        self._entries: deque = deque(maxlen=max_entries)
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        """Strip list numbering, case and whitespace noise before embedding."""
+        text = cls._NUMBERING_RE.sub("", text)
+        return " ".join(text.lower().split())
+
+    @staticmethod
+    def _unit(vector: Sequence[float]) -> List[float]:
+        return _unit(vector)
+
+    def lookup(self, embedding: Sequence[float]) -> Optional[str]:
+        """Return the most similar cached response, or None below threshold."""
+        query = self._unit(embedding)
+        best_score = self.threshold
+        best_response = None
+
+        for vector, response in self._entries:
+            score = sum(a * b for a, b in zip(query, vector))
+            if score >= best_score:
+                best_score = score
+                best_response = response
+
+        return best_response
+
+    def store(self, embedding: Sequence[float], response: str) -> None:
+        """Add a response under its prompt embedding."""
+        self._entries.append((self._unit(embedding), response))
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class GenerativeCache:
+    """
+    Template-aware cache that adapts a cached response to a new prompt.
+
+    Prompts built from the same template differ only in a slot (the task or
+    step text). For a new slot close to a cached one, the token substitutions
+    that turn the old slot into the new one are applied to the old response,
+    e.g. a plan for "create a flask app" becomes a plan for "create a fastapi
+    app". Slots that differ by inserted or deleted words are not adapted,
+    since a plain substitution cannot account for them. Only whole tokens
+    are replaced, and a substitution of a stopword or a very short token
+    ("a" -> "the") is refused, since it would also hit unrelated text.
+    """
+
+    # Shortest token a substitution may replace
+    MIN_SUBSTITUTION_LENGTH = 3
+
+    _STOPWORDS = frozenset({
+        "a", "an", "the", "and", "or", "but", "if", "of", "to", "in", "on",
+        "at", "by", "for", "with", "from", "as", "is", "it", "be", "are",
+        "was", "this", "that", "these", "those", "my", "our", "your", "its",
+        "their", "some", "any", "all", "no", "not", "into", "onto", "then"
+    })
+
+    def __init__(self, threshold: float = 0.85, max_per_template: int = 64):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity between slot embeddings
+            max_per_template: Cached responses kept per template (oldest evicted first)
+        """
+        self.threshold = threshold
+        self.max_per_template = max_per_template
+        self._templates: Dict[bytes, deque] = {}
+
+    @staticmethod
+    def _substitutions(old: str, new: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        Word-level substitutions turning old into new.
+
+        Returns None if the slots differ by anything other than one-for-one
+        word replacements, or if a replacement is too unspecific to apply.
+        """
+        old_words = old.split()
+        new_words = new.split()
+        matcher = difflib.SequenceMatcher(None, old_words, new_words, autojunk=False)
+
+        substitutions = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            if tag != "replace" or (i2 - i1) != (j2 - j1):
+                return None
+            old_phrase = " ".join(old_words[i1:i2])
+            new_phrase = " ".join(new_words[j1:j2])
+            if (len(old_phrase) < GenerativeCache.MIN_SUBSTITUTION_LENGTH
+                    or old_phrase.lower() in GenerativeCache._STOPWORDS
+                    or new_phrase.lower() in GenerativeCache._STOPWORDS):
+                return None
+            substitutions.append((old_phrase, new_phrase))
+
+        # Longest first so "hello world" is replaced before "hello"
+        substitutions.sort(key=lambda pair: len(pair[0]), reverse=True)
+        return substitutions
+
+    def lookup(self, template_key: bytes, slot: str,
+               embedding: Sequence[float]) -> Optional[str]:
+        """Return a cached response adapted to slot, or None."""
+        entries = self._templates.get(template_key)
+        if not entries:
+            return None
+
+        query = _unit(embedding)
+        best_score = self.threshold
+        best = None
+        for vector, cached_slot, response in entries:
+            score = sum(a * b for a, b in zip(query, vector))
+            if score >= best_score:
+                best_score = score
+                best = (cached_slot, response)
+
+        if best is None:
+            return None
+
+        cached_slot, response = best
+        substitutions = self._substitutions(cached_slot, slot)
+        if substitutions is None:
+            return None
+
+        if not substitutions:
+            return response
+
+        # One pass over whole tokens, so "app" does not hit "apply" and a
+        # replacement is never substituted again
+        replacements = dict(substitutions)
+        pattern = re.compile(
+            r'(?<!\w)(?:' + "|".join(re.escape(old) for old, _ in substitutions) + r')(?!\w)'
+        )
+        return pattern.sub(lambda match: replacements[match.group()], response)
+
+    def store(self, template_key: bytes, slot: str,
+              embedding: Sequence[float], response: str) -> None:
+        """Add a response generated for slot under its template."""
+        entries = self._templates.get(template_key)
+        if entries is None:
+            entries = self._templates[template_key] = deque(maxlen=self.max_per_template)
+        entries.append((_unit(embedding), slot, response))
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._templates.clear()
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._templates.values())
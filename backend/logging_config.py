@@ -0,0 +1,85 @@
+"""
+ArbiterAI Logging Setup
+Buffered root log handler, installed by the entry points (servers, __main__).
+"""
+
+import logging
+import logging.handlers
+import sys
+import threading
+
+# Records held before they are written in one batch
+LOG_BUFFER_CAPACITY = 512
+
+# Longest a buffered record waits before it is written (seconds)
+LOG_FLUSH_INTERVAL = 1.0
+
+
+class BufferedStderrHandler(logging.handlers.MemoryHandler):
+    """
+    Collects records and writes them to stderr in a single write.
+
+    The buffer is flushed when it is full, when a WARNING or worse is
+    logged, by a background timer every flush_interval seconds (so the
+    last lines of a burst are not held back), and when the handler is
+    closed (logging.shutdown at exit).
+    """
+
+    def __init__(self, capacity: int = LOG_BUFFER_CAPACITY,
+                 flush_level: int = logging.WARNING,
+                 flush_interval: float = LOG_FLUSH_INTERVAL):
+        super().__init__(capacity, flushLevel=flush_level)
+        self.flush_interval = flush_interval
+        self._stopped = threading.Event()
+        self._timer = threading.Thread(target=self._flush_periodically,
+                                       name="log-flush", daemon=True)
+        self._timer.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.buffer:
+                return
+            records, self.buffer = self.buffer, []
+            lines = []
+            for record in records:
+                try:
+                    lines.append(self.format(record))
+                except Exception:
+                    self.handleError(record)
+            if not lines:
+                return
+            try:
+                sys.stderr.write("\n".join(lines) + "\n")
+                sys.stderr.flush()
+            except Exception:
+                # Reported like any handler's emit failure
+                self.handleError(records[-1])
+
+    def close(self) -> None:
+        self._stopped.set()
+        super().close()
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Install a BufferedStderrHandler on the root logger.
+
+    Meant for entry points; library modules only create loggers. Does
+    nothing if logging is already configured (by the application or an
+    earlier call).
+
+    Args:
+        level: Root logger level
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    handler = BufferedStderrHandler()
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(level)
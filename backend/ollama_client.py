@@ -0,0 +1,117 @@
+"""
+Ollama HTTP Client Helpers
+Connection setup shared by the agent frameworks.
+"""
+
+import functools
+import json
+import os
+import socket
+import threading
+from typing import Any, Tuple, Union
+
+import httpx
+
+# orjson is optional, fall back to the stdlib json module without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+DOCKER_HOST_URL = "http://host.docker.internal:11434/api/generate"
+LOCALHOST_URL = "http://localhost:11434/api/generate"
+
+# How long to wait for host.docker.internal to resolve before assuming native execution
+DOCKER_HOST_RESOLVE_TIMEOUT = 0.2
+
+# Keep-alive pool sized for concurrent plan/tool-selection/embedding calls
+POOL_LIMITS = httpx.Limits(
+    max_connections=32,
+    max_keepalive_connections=32,
+    keepalive_expiry=30.0
+)
+
+# Retries for failed connection attempts (e.g. Ollama still starting up)
+CONNECT_RETRIES = 2
+
+# Request bodies are pre-encoded with json_dumps and sent as content=
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+if ORJSON_AVAILABLE:
+    def json_dumps(obj: Any) -> bytes:
+        """Encode a request body."""
+        return orjson.dumps(obj)
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """Decode a response body or stream line."""
+        return orjson.loads(data)
+else:
+    def json_dumps(obj: Any) -> bytes:
+        """Encode a request body."""
+        return json.dumps(obj).encode("utf-8")
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """Decode a response body or stream line."""
+        return json.loads(data)
+
+
+def default_ollama_url() -> str:
+    """
+    Pick the Ollama URL when none is passed explicitly.
+
+    Tries, in order:
+        1. OLLAMA_URL environment variable
+        2. host.docker.internal:11434 (for Docker)
+        3. localhost:11434 (fallback)
+    """
+    return os.getenv('OLLAMA_URL') or _probe_docker_host()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_docker_host() -> str:
+    """
+    Resolve host.docker.internal once per process.
+
+    gethostbyname ignores socket timeouts, so the lookup runs on a daemon
+    thread and is abandoned if it has not answered in time (e.g. Linux hosts
+    with a slow resolver and no such name).
+    """
+    resolved = threading.Event()
+
+    def probe():
+        try:
+            socket.gethostbyname('host.docker.internal')
+            resolved.set()
+        except OSError:
+            pass
+
+    threading.Thread(target=probe, daemon=True).start()
+    if resolved.wait(DOCKER_HOST_RESOLVE_TIMEOUT):
+        return DOCKER_HOST_URL
+    return LOCALHOST_URL
+
+
+def create_clients(timeout: float) -> Tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Create the sync and async HTTP clients used to talk to Ollama.
+
+    Args:
+        timeout: Request timeout in seconds
+
+    Returns:
+        (sync_client, async_client) sharing the same pool and retry settings
+    """
+    client = httpx.Client(
+        timeout=timeout,
+        headers=JSON_HEADERS,
+        transport=httpx.HTTPTransport(retries=CONNECT_RETRIES, limits=POOL_LIMITS)
+    )
+    async_client = httpx.AsyncClient(
+        timeout=timeout,
+        headers=JSON_HEADERS,
+        transport=httpx.AsyncHTTPTransport(retries=CONNECT_RETRIES, limits=POOL_LIMITS)
+    )
+    return client, async_client
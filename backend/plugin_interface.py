@@ -3,9 +3,11 @@ ArbiterAI Plugin Interface
 Base classes and metadata for plugin development.
 """
 
+import asyncio
+import functools
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -18,36 +20,46 @@ class PluginPermission(Enum):
     SHELL = "shell"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PluginMetadata:
-    """Plugin metadata."""
+    """
+    Plugin metadata.
+    
+    Immutable, so the dictionary form is built once in __post_init__ and
+    instances can be used as cache keys.
+    """
     name: str
     version: str
     author: str
     description: str
-    dependencies: List[str] = None
-    permissions: List[PluginPermission] = None
+    dependencies: Tuple[str, ...] = ()
+    permissions: Tuple[PluginPermission, ...] = ()
+    _dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if self.dependencies is None:
-            self.dependencies = []
-        if self.permissions is None:
-            self.permissions = []
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+        # Plugins pass lists (or None); store them as tuples
+        object.__setattr__(self, "dependencies", tuple(self.dependencies or ()))
+        object.__setattr__(self, "permissions", tuple(self.permissions or ()))
+        object.__setattr__(self, "_dict", {
             "name": self.name,
             "version": self.version,
             "author": self.author,
             "description": self.description,
-            "dependencies": self.dependencies,
+            "dependencies": list(self.dependencies),
             "permissions": [p.value for p in self.permissions]
-        }
+        })
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictionary form (shared, do not mutate)."""
+        return self._dict
 
 
 class PluginResult:
     """Standardized plugin execution result."""
     
+    # One is allocated per plugin call; no per-instance __dict__
+    __slots__ = ("success", "output", "error", "data")
+    
     def __init__(self, 
                  success: bool,
                  output: str = "",
@@ -91,6 +103,9 @@ class ArbiterPlugin(ABC):
                     success=True,
                     output="Result"
                 )
+        
+        # Lets PluginManager find the class without scanning the module
+        PLUGIN_CLASS = MyPlugin
     """
     
     @property
@@ -117,6 +132,21 @@ class ArbiterPlugin(ABC):
         """
         pass
     
+    async def aexecute(self, **kwargs) -> PluginResult:
+        """
+        Execute plugin action from a coroutine.
+        
+        Runs execute on a worker thread. Plugins whose I/O can be awaited
+        directly (e.g. the shell plugin's aiodocker sandbox) override this.
+        
+        Args:
+            **kwargs: Plugin-specific parameters
+            
+        Returns:
+            PluginResult with success status, output, and optional data
+        """
+        return await asyncio.to_thread(self.execute, **kwargs)
+    
     def validate_input(self, **kwargs) -> tuple[bool, str]:
         """
         Validate input parameters before execution.
@@ -143,12 +173,7 @@ class ArbiterPlugin(ABC):
                 - parameters: Expected parameters with descriptions
                 - examples: Example usage scenarios
         """
-        return {
-            "name": self.metadata.name,
-            "description": self.metadata.description,
-            "parameters": {},
-            "examples": []
-        }
+        return _default_description(self.metadata)
     
     def initialize(self, workspace: str) -> bool:
         """
@@ -173,6 +198,17 @@ class ArbiterPlugin(ABC):
         pass
 
 
+@functools.lru_cache(maxsize=None)
+def _default_description(metadata: PluginMetadata) -> Dict[str, Any]:
+    """Default describe() output, built once per distinct metadata."""
+    return {
+        "name": metadata.name,
+        "description": metadata.description,
+        "parameters": {},
+        "examples": []
+    }
+
+
 class PluginError(Exception):
     """Base exception for plugin errors."""
     pass
@@ -3,10 +3,15 @@ ArbiterAI Plugin Manager
 Discovers, loads, and manages plugins.
 """
 
+import ast
+import asyncio
 import os
 import importlib
 import importlib.util
+import py_compile
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
@@ -14,15 +19,112 @@ import logging
 from plugin_interface import (
     ArbiterPlugin, 
     PluginMetadata, 
+    PluginPermission,
     PluginResult,
     PluginLoadError,
     PluginExecutionError,
     PluginValidationError
 )
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to import/initialize plugins concurrently
+MAX_LOAD_WORKERS = 8
+
+# Namespace plugin modules are registered under in sys.modules, so a
+# plugin file cannot shadow (or be shadowed by) a top-level module
+PLUGIN_NAMESPACE = "arbiter_plugins"
+
+
+def _literal(node: ast.AST) -> Any:
+    """Evaluate a literal node, mapping PluginPermission.X to its value."""
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_literal(item) for item in node.elts]
+    if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+            and node.value.id == "PluginPermission"):
+        return PluginPermission[node.attr].value
+    return ast.literal_eval(node)
+
+
+def read_static_metadata(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a plugin's metadata from its source without importing it.
+    
+    Looks for a class whose `metadata` property returns
+    PluginMetadata(...) with literal arguments, and a `describe` method
+    returning a literal dict. Either may also return a module-level
+    constant assigned that value.
+    
+    Args:
+        path: Plugin source file
+        
+    Returns:
+        Dictionary in PluginManager.list_plugins() form, or None if the
+        metadata is computed at runtime
+    """
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return None
+    
+    # Module-level NAME = <expr> assignments, for methods returning a constant
+    constants = {
+        node.targets[0].id: node.value for node in tree.body
+        if isinstance(node, ast.Assign) and len(node.targets) == 1
+        and isinstance(node.targets[0], ast.Name)
+    }
+    
+    def returned_value(func: ast.FunctionDef) -> Optional[ast.AST]:
+        returned = func.body[-1]
+        if not isinstance(returned, ast.Return):
+            return None
+        if isinstance(returned.value, ast.Name):
+            return constants.get(returned.value.id)
+        return returned.value
+    
+    for cls in tree.body:
+        if not isinstance(cls, ast.ClassDef):
+            continue
+        
+        methods = {
+            node.name: node for node in cls.body
+            if isinstance(node, ast.FunctionDef)
+        }
+        metadata_func = methods.get("metadata")
+        if metadata_func is None:
+            continue
+        
+        call = returned_value(metadata_func)
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)
+                and call.func.id == "PluginMetadata" and not call.args):
+            continue
+        
+        try:
+            info = {kw.arg: _literal(kw.value) for kw in call.keywords}
+            if "name" not in info:
+                continue
+            info.setdefault("dependencies", [])
+            info.setdefault("permissions", [])
+            
+            description = None
+            describe_func = methods.get("describe")
+            if describe_func is not None:
+                described = returned_value(describe_func)
+                if described is not None:
+                    description = ast.literal_eval(described)
+        except (ValueError, KeyError, TypeError, SyntaxError):
+            continue
+        
+        info["description_for_llm"] = description or {
+            "name": info["name"],
+            "description": info.get("description", ""),
+            "parameters": {},
+            "examples": []
+        }
+        return info
+    
+    return None
+
 
 class PluginManager:
     """
@@ -36,6 +138,20 @@ class PluginManager:
     - Error handling
     """
     
+    __slots__ = (
+        "workspace",
+        "plugins_dir",
+        "plugins",
+        "disabled_plugins",
+        "_plugins_lock",
+        "_lazy_lock",
+        "_lazy",
+        "_lazy_info",
+        "_list_cache",
+        "_discovery_cache",
+        "_discovery_mtime",
+    )
+    
     def __init__(self, workspace: str, plugins_dir: str = None):
         """
         Initialize plugin manager.
@@ -57,40 +173,91 @@ class PluginManager:
         # Loaded plugins: {name: plugin_instance}
         self.plugins: Dict[str, ArbiterPlugin] = {}
         
+        # Guards self.plugins while plugins load in parallel
+        self._plugins_lock = threading.Lock()
+        
+        # Indexed but not yet imported plugins: {name: module_name},
+        # with their statically read list_plugins() entries
+        self._lazy: Dict[str, str] = {}
+        self._lazy_info: Dict[str, Dict[str, Any]] = {}
+        # Serializes first-use imports (tool calls run on worker threads)
+        self._lazy_lock = threading.Lock()
+        
+        # list_plugins() result, reset whenever the plugin set changes
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
+        
         # Disabled plugins
         self.disabled_plugins: set = set()
         
-        logger.info(f"🔌 PluginManager initialized")
-        logger.info(f"   Plugins directory: {self.plugins_dir}")
-        logger.info(f"   Workspace: {self.workspace}")
+        # Last discovery result, valid while the directory mtime is unchanged
+        self._discovery_cache: Optional[List[str]] = None
+        self._discovery_mtime: float = 0.0
+        
+        logger.info("🔌 PluginManager initialized")
+        logger.info("   Plugins directory: %s", self.plugins_dir)
+        logger.info("   Workspace: %s", self.workspace)
     
     def discover_plugins(self) -> List[str]:
         """
         Discover all plugins in plugins directory.
         
+        The result is cached until the directory changes (adding or removing
+        a file updates its mtime) or invalidate_discovery() is called.
+        
         Returns:
             List of discovered plugin module names
         """
-        discovered = []
-        
-        if not self.plugins_dir.exists():
-            logger.warning(f"⚠️ Plugins directory not found: {self.plugins_dir}")
-            return discovered
+        try:
+            mtime = self.plugins_dir.stat().st_mtime
+        except OSError:
+            logger.warning("⚠️ Plugins directory not found: %s", self.plugins_dir)
+            return []
         
-        # Add plugins directory to Python path
-        if str(self.plugins_dir) not in sys.path:
-            sys.path.insert(0, str(self.plugins_dir))
+        if self._discovery_cache is not None and mtime == self._discovery_mtime:
+            return list(self._discovery_cache)
         
         # Find all Python files in plugins directory
-        for file_path in self.plugins_dir.glob("*.py"):
-            if file_path.name.startswith("_"):
-                continue  # Skip __init__.py and private files
-            
-            module_name = file_path.stem
-            discovered.append(module_name)
+        # (skip __init__.py and private files)
+        with os.scandir(self.plugins_dir) as entries:
+            discovered = [
+                entry.name[:-3]
+                for entry in entries
+                if entry.name.endswith(".py") and not entry.name.startswith("_")
+            ]
+        
+        self._discovery_cache = discovered
+        self._discovery_mtime = mtime
+        
+        logger.info("🔍 Discovered %s plugin(s): %s", len(discovered), discovered)
+        return list(discovered)
+    
+    def precompile_all(self) -> int:
+        """
+        Byte-compile every plugin ahead of its first import.
+        
+        Writes the __pycache__ .pyc files so the first load_plugin() only
+        has to unmarshal them. Meant for install/build steps.
+        
+        Returns:
+            Number of plugin files compiled successfully
+        """
+        files = [self.plugins_dir / f"{name}.py" for name in self.discover_plugins()]
+        if not files:
+            return 0
         
-        logger.info(f"🔍 Discovered {len(discovered)} plugin(s): {discovered}")
-        return discovered
+        def compile_file(path: Path) -> bool:
+            return py_compile.compile(str(path), doraise=False) is not None
+        
+        workers = min(MAX_LOAD_WORKERS, len(files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            compiled = sum(executor.map(compile_file, files))
+        
+        logger.info("🗜️ Precompiled %s/%s plugin(s)", compiled, len(files))
+        return compiled
+    
+    def invalidate_discovery(self) -> None:
+        """Forget the cached discovery result so the next call rescans."""
+        self._discovery_cache = None
     
     def load_plugin(self, module_name: str) -> Optional[ArbiterPlugin]:
         """
@@ -103,22 +270,24 @@ class PluginManager:
             Loaded plugin instance or None if failed
         """
         if module_name in self.disabled_plugins:
-            logger.info(f"⏭️ Plugin '{module_name}' is disabled, skipping")
+            logger.info("⏭️ Plugin '%s' is disabled, skipping", module_name)
             return None
         
         try:
             # Import the module
-            module = importlib.import_module(module_name)
+            module = self._import_plugin_module(module_name)
             
-            # Find plugin class (subclass of ArbiterPlugin)
-            plugin_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and 
-                    issubclass(attr, ArbiterPlugin) and 
-                    attr is not ArbiterPlugin):
-                    plugin_class = attr
-                    break
+            # Find plugin class: the module's PLUGIN_CLASS entry point, or
+            # failing that the first ArbiterPlugin subclass it defines
+            plugin_class = getattr(module, "PLUGIN_CLASS", None)
+            if plugin_class is None:
+                for attr_name in dir(module):
+                    attr = getattr(module, attr_name)
+                    if (isinstance(attr, type) and 
+                        issubclass(attr, ArbiterPlugin) and 
+                        attr is not ArbiterPlugin):
+                        plugin_class = attr
+                        break
             
             if plugin_class is None:
                 raise PluginLoadError(f"No ArbiterPlugin subclass found in {module_name}")
@@ -130,33 +299,117 @@ class PluginManager:
             if not plugin.initialize(self.workspace):
                 raise PluginLoadError(f"Plugin initialization failed: {module_name}")
             
-            # Store plugin
-            plugin_name = plugin.metadata.name
-            self.plugins[plugin_name] = plugin
+            # Store plugin (metadata properties may build a new object per access)
+            metadata = plugin.metadata
+            plugin_name = metadata.name
+            with self._plugins_lock:
+                self.plugins[plugin_name] = plugin
+                self._list_cache = None
             
-            logger.info(f"✅ Loaded plugin: {plugin_name} v{plugin.metadata.version}")
+            logger.info("✅ Loaded plugin: %s v%s", plugin_name, metadata.version)
             return plugin
             
         except Exception as e:
-            logger.error(f"❌ Failed to load plugin '{module_name}': {str(e)}")
+            logger.error("❌ Failed to load plugin '%s': %s", module_name, e)
             return None
     
-    def load_all_plugins(self) -> int:
+    def _import_plugin_module(self, module_name: str):
+        """
+        Import a plugin straight from its file in plugins_dir.
+        
+        Loading from an explicit spec skips the sys.path finder walk and
+        keeps plugins out of the top-level module namespace.
+        
+        Args:
+            module_name: Name of the plugin module (file name without .py)
+            
+        Returns:
+            The plugin module
+        """
+        qualified_name = f"{PLUGIN_NAMESPACE}.{module_name}"
+        module = sys.modules.get(qualified_name)
+        if module is not None:
+            return module
+        
+        spec = importlib.util.spec_from_file_location(
+            qualified_name, self.plugins_dir / f"{module_name}.py"
+        )
+        if spec is None or spec.loader is None:
+            raise PluginLoadError(f"Cannot load plugin module {module_name}")
+        
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[qualified_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[qualified_name]
+            raise
+        return module
+    
+    def load_all_plugins(self, lazy: bool = False) -> int:
         """
         Discover and load all plugins.
         
+        Imports and initialize() calls are mostly I/O, so plugins are loaded
+        on a small thread pool.
+        
+        Args:
+            lazy: Only index plugins whose metadata can be read from source,
+                  importing each on first use (the rest load immediately)
+        
+        Returns:
+            Number of successfully loaded (or indexed) plugins
+        """
+        # Sorted so log output and name collisions resolve deterministically
+        discovered = sorted(self.discover_plugins())
+        
+        indexed = 0
+        if lazy:
+            discovered, indexed = self._index_plugins(discovered)
+        
+        if not discovered:
+            logger.info("📦 Loaded 0/0 plugin(s), %s deferred", indexed)
+            return indexed
+        
+        workers = min(MAX_LOAD_WORKERS, len(discovered))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.load_plugin, discovered))
+        
+        loaded_count = sum(1 for plugin in results if plugin)
+        
+        logger.info("📦 Loaded %s/%s plugin(s), %s deferred", loaded_count, len(discovered), indexed)
+        return loaded_count + indexed
+    
+    def _index_plugins(self, module_names: List[str]) -> tuple[List[str], int]:
+        """
+        Record plugins for deferred loading from their static metadata.
+        
+        Args:
+            module_names: Discovered plugin modules
+            
         Returns:
-            Number of successfully loaded plugins
+            (modules that must be imported now, number of plugins indexed)
         """
-        discovered = self.discover_plugins()
-        loaded_count = 0
+        remaining = []
+        indexed = 0
+        
+        for module_name in module_names:
+            info = read_static_metadata(self.plugins_dir / f"{module_name}.py")
+            if info is None:
+                remaining.append(module_name)
+                continue
+            
+            name = info["name"]
+            if name in self.plugins or name in self.disabled_plugins:
+                continue
+            
+            self._lazy[name] = module_name
+            self._lazy_info[name] = info
+            indexed += 1
         
-        for module_name in discovered:
-            if self.load_plugin(module_name):
-                loaded_count += 1
+        self._list_cache = None
         
-        logger.info(f"📦 Loaded {loaded_count}/{len(discovered)} plugin(s)")
-        return loaded_count
+        return remaining, indexed
     
     def get_plugin(self, name: str) -> Optional[ArbiterPlugin]:
         """
@@ -168,89 +421,171 @@ class PluginManager:
         Returns:
             Plugin instance or None if not found
         """
-        return self.plugins.get(name)
+        plugin = self.plugins.get(name)
+        if plugin is None and name in self._lazy:
+            with self._lazy_lock:
+                # Another thread may have loaded it while we waited
+                plugin = self.plugins.get(name)
+                module_name = self._lazy.get(name) if plugin is None else None
+                if module_name is not None:
+                    # Deferred plugin: import it on first use. It stays in
+                    # _lazy until loaded, so concurrent callers wait above.
+                    plugin = self.load_plugin(module_name)
+                    self._lazy.pop(name, None)
+                    self._lazy_info.pop(name, None)
+                    self._list_cache = None
+        return plugin
     
     def has_plugin(self, name: str) -> bool:
-        """Check if plugin is loaded."""
-        return name in self.plugins
+        """Check if plugin is loaded (or indexed for deferred loading)."""
+        return name in self.plugins or name in self._lazy
     
     def list_plugins(self) -> List[Dict[str, Any]]:
         """
         List all loaded plugins with metadata.
         
+        The list is built once and reused until a plugin is loaded,
+        enabled, disabled or cleaned up.
+        
         Returns:
-            List of plugin metadata dictionaries
+            List of plugin metadata dictionaries (shared, do not mutate)
         """
-        return [
-            {
-                **plugin.metadata.to_dict(),
-                "description_for_llm": plugin.describe()
-            }
-            for plugin in self.plugins.values()
-        ]
-    
-    def execute_plugin(self, name: str, **kwargs) -> PluginResult:
+        if self._list_cache is None:
+            self._list_cache = [
+                {
+                    **plugin.metadata.to_dict(),
+                    "description_for_llm": plugin.describe()
+                }
+                for plugin in self.plugins.values()
+            ] + list(self._lazy_info.values())
+        return self._list_cache
+    
+    def execute_plugin(self, name: str, skip_validation: bool = False,
+                       **kwargs) -> PluginResult:
         """
         Execute a plugin with validation.
         
         Args:
             name: Plugin name
+            skip_validation: Skip validate_input (for internal callers that
+                             already validated these parameters)
             **kwargs: Plugin-specific parameters
             
         Returns:
             PluginResult
         """
-        # Check if plugin exists
-        plugin = self.get_plugin(name)
+        # Check if plugin exists (loaded plugins skip the lazy-load path)
+        plugin = self.plugins.get(name) or self.get_plugin(name)
         if plugin is None:
             return PluginResult(
                 success=False,
                 error=f"Plugin '{name}' not found"
             )
         
+        # Bind once, outside the try block
+        validate = plugin.validate_input
+        execute = plugin.execute
+        
         try:
             # Validate input
-            is_valid, error_msg = plugin.validate_input(**kwargs)
-            if not is_valid:
-                return PluginResult(
-                    success=False,
-                    error=f"Validation failed: {error_msg}"
-                )
+            if not skip_validation:
+                is_valid, error_msg = validate(**kwargs)
+                if not is_valid:
+                    return PluginResult(
+                        success=False,
+                        error=f"Validation failed: {error_msg}"
+                    )
             
             # Execute plugin
-            logger.info(f"🔧 Executing plugin: {name}")
-            result = plugin.execute(**kwargs)
+            logger.info("🔧 Executing plugin: %s", name)
+            return self._log_result(name, execute(**kwargs))
+            
+        except Exception as e:
+            logger.error("❌ Plugin '%s' execution error: %s", name, e)
+            return PluginResult(
+                success=False,
+                error=f"Execution error: {str(e)}"
+            )
+    
+    async def aexecute_plugin(self, name: str, skip_validation: bool = False,
+                              **kwargs) -> PluginResult:
+        """
+        Execute a plugin with validation, from a coroutine.
+        
+        Same checks as execute_plugin, but the plugin's aexecute is
+        awaited, so plugins with async I/O don't tie up a worker thread.
+        
+        Args:
+            name: Plugin name
+            skip_validation: Skip validate_input
+            **kwargs: Plugin-specific parameters
             
-            if result.success:
-                logger.info(f"✅ Plugin '{name}' executed successfully")
-            else:
-                logger.warning(f"⚠️ Plugin '{name}' execution failed: {result.error}")
+        Returns:
+            PluginResult
+        """
+        # A first use imports the plugin, which is done off the loop
+        plugin = self.plugins.get(name) or await asyncio.to_thread(self.get_plugin, name)
+        if plugin is None:
+            return PluginResult(
+                success=False,
+                error=f"Plugin '{name}' not found"
+            )
+        
+        try:
+            if not skip_validation:
+                is_valid, error_msg = plugin.validate_input(**kwargs)
+                if not is_valid:
+                    return PluginResult(
+                        success=False,
+                        error=f"Validation failed: {error_msg}"
+                    )
             
-            return result
+            logger.info("🔧 Executing plugin: %s", name)
+            return self._log_result(name, await plugin.aexecute(**kwargs))
             
         except Exception as e:
-            logger.error(f"❌ Plugin '{name}' execution error: {str(e)}")
+            logger.error("❌ Plugin '%s' execution error: %s", name, e)
             return PluginResult(
                 success=False,
                 error=f"Execution error: {str(e)}"
             )
     
+    @staticmethod
+    def _log_result(name: str, result: PluginResult) -> PluginResult:
+        """Log a plugin's outcome and pass the result through."""
+        if result.success:
+            logger.info("✅ Plugin '%s' executed successfully", name)
+        else:
+            logger.warning("⚠️ Plugin '%s' execution failed: %s", name, result.error)
+        return result
+    
     def enable_plugin(self, name: str) -> bool:
         """Enable a disabled plugin."""
         if name in self.disabled_plugins:
             self.disabled_plugins.remove(name)
-            logger.info(f"✅ Enabled plugin: {name}")
+            self._list_cache = None
+            logger.info("✅ Enabled plugin: %s", name)
             return True
         return False
     
     def disable_plugin(self, name: str) -> bool:
         """Disable a plugin."""
+        if name in self._lazy:
+            # Never imported, nothing to clean up
+            self.disabled_plugins.add(name)
+            del self._lazy[name]
+            self._lazy_info.pop(name, None)
+            self._list_cache = None
+            logger.info("🚫 Disabled plugin: %s", name)
+            return True
+        
         if name in self.plugins:
             self.disabled_plugins.add(name)
             # Cleanup and remove
             self.plugins[name].cleanup()
             del self.plugins[name]
-            logger.info(f"🚫 Disabled plugin: {name}")
+            self._list_cache = None
+            logger.info("🚫 Disabled plugin: %s", name)
             return True
         return False
     
@@ -264,8 +599,11 @@ class PluginManager:
                 break
         
         if module_name:
+            self.invalidate_discovery()
             self.disable_plugin(name)
-            return self.load_plugin(module_name) is not None
+            # Drop the old module so the file is executed again
+            sys.modules.pop(module_name, None)
+            return self.load_plugin(module_name.rpartition(".")[2]) is not None
         
         return False
     
@@ -275,14 +613,25 @@ class PluginManager:
             try:
                 plugin.cleanup()
             except Exception as e:
-                logger.error(f"Error cleaning up plugin {plugin.metadata.name}: {e}")
+                logger.error("Error cleaning up plugin %s: %s", plugin.metadata.name, e)
         
         self.plugins.clear()
+        self._lazy.clear()
+        self._lazy_info.clear()
+        self._list_cache = None
         logger.info("🧹 All plugins cleaned up")
 
 
 # Example usage
 if __name__ == "__main__":
+    from logging_config import configure_logging
+    configure_logging()
+    
+    # `python plugin_manager.py precompile` warms the plugin bytecode cache
+    if sys.argv[1:] == ["precompile"]:
+        PluginManager(workspace="/tmp/test_workspace").precompile_all()
+        sys.exit(0)
+    
     # Create plugin manager
     manager = PluginManager(workspace="/tmp/test_workspace")
     
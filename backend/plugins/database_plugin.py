@@ -3,11 +3,18 @@ Database Plugin for ArbiterAI
 Executes SQL queries on SQLite databases.
 """
 
+import functools
+import json
+import os
+import re
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Union
 import sys
-sys.path.append(str(Path(__file__).parent.parent))
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
 
 from plugin_interface import (
     ArbiterPlugin,
@@ -16,6 +23,48 @@ from plugin_interface import (
     PluginPermission
 )
 
+# apsw is optional: a thinner SQLite wrapper used for full-result reads
+try:
+    import apsw
+    APSW_AVAILABLE = True
+except ImportError:
+    apsw = None
+    APSW_AVAILABLE = False
+
+# Errors reported as "Database error"
+DB_ERRORS = (sqlite3.Error, apsw.Error) if APSW_AVAILABLE else (sqlite3.Error,)
+
+
+# Built once and shared by every instance (do not mutate)
+_DATABASE_METADATA = PluginMetadata(
+    name="database",
+    version="1.0.0",
+    author="ArbiterAI",
+    description="Execute SQL queries on SQLite databases",
+    dependencies=["sqlite3"],
+    permissions=[PluginPermission.FILESYSTEM, PluginPermission.DATABASE]
+)
+
+_DATABASE_DESCRIPTION = {
+    "name": "database",
+    "description": "Execute SQL queries on SQLite databases in the workspace",
+    "parameters": {
+        "query": "SQL query to execute (string)",
+        "database": "Database filename (optional, default: database.db)",
+        "params": "Values for ? placeholders (optional, tuple, or list of tuples to run the query once per tuple)",
+        "fetch_all": "Return all rows of a SELECT instead of the first 10 (optional, default: false)",
+        "queries": "List of SQL statements to run in a single transaction (optional, instead of query)",
+        "format": "SELECT output format: 'pretty' table, 'tsv' or 'json' (optional, default: pretty; use tsv/json with fetch_all for large results)"
+    },
+    "examples": [
+        "Create a users table with id, name, and email columns",
+        "Insert a user with name 'John' and email 'john@example.com'",
+        "Select all users from the users table",
+        "Update user email where name is 'John'",
+        "Count the number of users in the database"
+    ]
+}
+
 
 class DatabasePlugin(ArbiterPlugin):
     """
@@ -24,25 +73,41 @@ class DatabasePlugin(ArbiterPlugin):
     Features:
     - Execute SELECT queries
     - Execute INSERT/UPDATE/DELETE
+    - Run a batch of statements in one transaction
     - Create tables
     - List tables
     - Describe table schema
+    
+    SELECTs with fetch_all run through apsw when it is installed, since it
+    iterates large results faster than the sqlite3 module.
     """
     
+    # Leading keyword check without copying/uppercasing the whole query
+    _SELECT_RE = re.compile(r'\s*SELECT', re.IGNORECASE)
+    
+    # Rows shown in the output table (and returned unless fetch_all is set)
+    DISPLAY_ROWS = 10
+    
+    # SELECT output formats: aligned table, tab-separated, JSON document
+    OUTPUT_FORMATS = ("pretty", "tsv", "json")
+    
+    # Basic SQL injection prevention, one pass over the original query
+    # (";--" is covered by "--", any whitespace run counts as a separator)
+    _DANGEROUS_SQL_RE = re.compile(r'\bDROP\s+(?:DATABASE|SCHEMA)\b|--', re.IGNORECASE)
+    
     def __init__(self):
         self.workspace_path = None
         self.db_path = None
+        # Open connections, reused across calls and closed in cleanup()
+        self._conn_cache: Dict[Path, sqlite3.Connection] = {}
+        # Read connections for the apsw fast path, keyed the same way
+        self._apsw_cache: Dict[Path, Any] = {}
+        # Connections are shared between threads, so queries are serialized
+        self._conn_lock = threading.Lock()
     
     @property
     def metadata(self) -> PluginMetadata:
-        return PluginMetadata(
-            name="database",
-            version="1.0.0",
-            author="ArbiterAI",
-            description="Execute SQL queries on SQLite databases",
-            dependencies=["sqlite3"],
-            permissions=[PluginPermission.FILESYSTEM, PluginPermission.DATABASE]
-        )
+        return _DATABASE_METADATA
     
     def initialize(self, workspace: str) -> bool:
         """Initialize with workspace."""
@@ -50,60 +115,66 @@ class DatabasePlugin(ArbiterPlugin):
         self.db_path = self.workspace_path / "database.db"
         return True
     
+    def _get_connection(self, db_path: Path) -> sqlite3.Connection:
+        """Return the cached connection for db_path, opening it on first use."""
+        conn = self._conn_cache.get(db_path)
+        if conn is None:
+            # Statements are compiled once per connection and reused from its
+            # statement cache (cached_statements, default 128)
+            conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            # Rows carry their column names (indexable by name, dict(row))
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn_cache[db_path] = conn
+        return conn
+    
     def execute(self, 
-                query: str,
+                query: Optional[str] = None,
                 database: str = "database.db",
+                params: Optional[Union[tuple, List[tuple]]] = None,
+                fetch_all: bool = False,
+                format: str = "pretty",
+                queries: Optional[List[str]] = None,
                 **kwargs) -> PluginResult:
         """
         Execute SQL query.
         
         Args:
-            query: SQL query to execute
+            query: SQL query to execute (ignored when queries is given)
             database: Database filename (default: database.db)
+            params: Values for the query's placeholders; a list of tuples
+                    runs the query once per tuple via executemany
+            fetch_all: Return every row of a SELECT instead of the first
+                       DISPLAY_ROWS (the rest of the result is never read)
+            format: SELECT output format, one of OUTPUT_FORMATS; "tsv" and
+                    "json" render every fetched row, "pretty" at most 10
+            queries: Statements to run in order in a single transaction
+                     (one commit for the whole batch, rolled back on error)
             
         Returns:
             PluginResult with query results
         """
+        conn = None
         try:
             # Resolve database path
             db_path = self.workspace_path / database
             
-            # Connect to database
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-            
-            # Execute query
-            cursor.execute(query)
-            
-            # Get results
-            if query.strip().upper().startswith("SELECT"):
-                results = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description]
+            with self._conn_lock:
+                if queries is not None:
+                    conn = self._get_connection(db_path)
+                    return self._run_batch(conn, queries)
                 
-                # Format results
-                output = self._format_results(columns, results)
-                data = {
-                    "columns": columns,
-                    "rows": results,
-                    "row_count": len(results)
-                }
-            else:
-                # INSERT/UPDATE/DELETE
-                conn.commit()
-                output = f"Query executed successfully. Rows affected: {cursor.rowcount}"
-                data = {
-                    "rows_affected": cursor.rowcount
-                }
-            
-            conn.close()
-            
-            return PluginResult(
-                success=True,
-                output=output,
-                data=data
-            )
+                if fetch_all and self._use_apsw(query, params):
+                    return self._run_select_apsw(db_path, query, params, format)
+                
+                conn = self._get_connection(db_path)
+                return self._run_query(conn, query, params, fetch_all, format)
             
-        except sqlite3.Error as e:
+        except DB_ERRORS as e:
+            # Don't leave a half-finished transaction on the shared connection
+            if conn is not None and conn.in_transaction:
+                conn.rollback()
             return PluginResult(
                 success=False,
                 error=f"Database error: {str(e)}"
@@ -114,69 +185,270 @@ class DatabasePlugin(ArbiterPlugin):
                 error=f"Execution error: {str(e)}"
             )
     
+    def _run_query(self, conn: sqlite3.Connection, query: str,
+                   params: Optional[Union[tuple, List[tuple]]] = None,
+                   fetch_all: bool = False,
+                   output_format: str = "pretty") -> PluginResult:
+        """Execute query on an open connection and format the result."""
+        cursor = conn.cursor()
+        
+        # Execute query (a batch of parameter tuples runs in one transaction).
+        # Tool calls decoded from JSON pass rows as lists, so a flat list is
+        # still a single row of values.
+        if isinstance(params, list) and params and isinstance(params[0], (list, tuple)):
+            cursor.executemany(query, params)
+        else:
+            cursor.execute(query, params or ())
+            
+        # Get results
+        if self._is_select(query):
+            if fetch_all:
+                results = cursor.fetchall()
+                truncated = False
+            else:
+                # One extra row tells whether the result was truncated
+                # without materializing (or counting) the rest of it
+                results = cursor.fetchmany(self.DISPLAY_ROWS + 1)
+                truncated = len(results) > self.DISPLAY_ROWS
+                results = results[:self.DISPLAY_ROWS]
+            
+            # Column names come with the rows; only an empty result needs
+            # cursor.description
+            if results:
+                columns = list(results[0].keys())
+            else:
+                columns = [desc[0] for desc in cursor.description]
+            cursor.close()  # Release any unread rows on the shared connection
+            
+            # Format results
+            output = self._render_results(columns, results, output_format, truncated)
+            data = {
+                "columns": columns,
+                "rows": [tuple(row) for row in results]
+            }
+            if fetch_all:
+                data["row_count"] = len(results)
+            else:
+                data["row_count_hint"] = f">{self.DISPLAY_ROWS}" if truncated else len(results)
+        else:
+            # INSERT/UPDATE/DELETE
+            conn.commit()
+            output = f"Query executed successfully. Rows affected: {cursor.rowcount}"
+            data = {
+                "rows_affected": cursor.rowcount
+            }
+        
+        return PluginResult(
+            success=True,
+            output=output,
+            data=data
+        )
+    
+    def _run_batch(self, conn: sqlite3.Connection, queries: List[str]) -> PluginResult:
+        """Run statements in one transaction and commit once."""
+        cursor = conn.cursor()
+        rows_affected = 0
+        
+        conn.execute("BEGIN")
+        try:
+            for statement in queries:
+                cursor.execute(statement)
+                if cursor.rowcount > 0:
+                    rows_affected += cursor.rowcount
+            conn.commit()
+        except BaseException:
+            # Any failure (not only sqlite3.Error) must not leave the
+            # shared connection inside the transaction
+            conn.rollback()
+            raise
+        
+        return PluginResult(
+            success=True,
+            output=f"Executed {len(queries)} statement(s) in one transaction. Rows affected: {rows_affected}",
+            data={
+                "statements": len(queries),
+                "rows_affected": rows_affected
+            }
+        )
+    
+    def _use_apsw(self, query: str, params) -> bool:
+        """Check whether a fetch_all query can take the apsw path."""
+        if not APSW_AVAILABLE or not self._is_select(query):
+            return False
+        if isinstance(params, list) and params and isinstance(params[0], (list, tuple)):
+            return False
+        # apsw runs every statement in the string, sqlite3 rejects more
+        # than one; keep that guarantee by sending those to sqlite3
+        return ";" not in query.rstrip().rstrip(";")
+    
+    def _run_select_apsw(self, db_path: Path, query: str, params,
+                         output_format: str = "pretty") -> PluginResult:
+        """Run a SELECT with apsw and return every row."""
+        conn = self._apsw_cache.get(db_path)
+        if conn is None:
+            conn = apsw.Connection(str(db_path))
+            self._apsw_cache[db_path] = conn
+        
+        columns: List[str] = []
+        
+        def read_columns(cursor, sql, bindings) -> bool:
+            # Runs once the statement is prepared, before its first step:
+            # after execute() a SELECT with no rows has already completed
+            # and getdescription() raises ExecutionCompleteError
+            columns[:] = [desc[0] for desc in cursor.getdescription()]
+            return True
+        
+        cursor = conn.cursor()
+        cursor.setexectrace(read_columns)
+        cursor.execute(query, params or ())
+        results = list(cursor)
+        
+        output = self._render_results(columns, results, output_format)
+        return PluginResult(
+            success=True,
+            output=output,
+            data={
+                "columns": columns,
+                "rows": results,
+                "row_count": len(results)
+            }
+        )
+    
+    @classmethod
+    def _is_select(cls, query: str) -> bool:
+        """Check whether the query is a SELECT (only the leading keyword is scanned)."""
+        return cls._SELECT_RE.match(query) is not None
+    
+    def _render_results(self, columns, rows, output_format: str = "pretty",
+                        truncated: bool = False) -> str:
+        """
+        Render SELECT results in the requested format.
+        
+        Args:
+            columns: Column names
+            rows: Fetched rows (sqlite3.Row or tuples)
+            output_format: "pretty", "tsv" or "json"
+            truncated: More rows exist than were fetched
+            
+        Returns:
+            Formatted output
+        """
+        if output_format == "json":
+            # One object per row, keyed by column name
+            document = {"columns": columns, "rows": [dict(zip(columns, row)) for row in rows]}
+            if truncated:
+                document["truncated"] = True
+            return json.dumps(document, default=str)
+        
+        if output_format == "tsv":
+            # Plain joins, no width computation or padding
+            if not rows:
+                return "No results found."
+            lines = ["\t".join(columns)]
+            lines.extend("\t".join(map(str, row)) for row in rows)
+            output = "\n".join(lines)
+        else:
+            output = self._format_results(columns, rows)
+        
+        if truncated:
+            output += "\n... (more rows; use LIMIT or fetch_all)"
+        return output
+    
     def _format_results(self, columns, rows) -> str:
-        """Format query results as table."""
+        """
+        Format query results as table.
+        
+        Only the first DISPLAY_ROWS rows are stringified and padded, so the
+        cost does not grow with the size of the result.
+        """
         if not rows:
             return "No results found."
         
-        # Calculate column widths
-        widths = [len(col) for col in columns]
-        for row in rows:
-            for i, val in enumerate(row):
-                widths[i] = max(widths[i], len(str(val)))
+        limit = self.DISPLAY_ROWS
         
-        # Build table
-        lines = []
+        # Stringify the displayed rows once
+        table = [list(columns)]
+        table.extend([str(val) for val in row] for row in rows[:limit])
         
-        # Header
-        header = " | ".join(col.ljust(widths[i]) for i, col in enumerate(columns))
-        lines.append(header)
-        lines.append("-" * len(header))
+        # Column widths over the header and displayed rows
+        widths = [max(map(len, col)) for col in zip(*table)]
+        
+        # Build table
+        lines = [" | ".join(cell.ljust(w) for cell, w in zip(line, widths)) for line in table]
         
-        # Rows (limit to 10 for display)
-        for row in rows[:10]:
-            line = " | ".join(str(val).ljust(widths[i]) for i, val in enumerate(row))
-            lines.append(line)
+        # Separator under the header
+        lines.insert(1, "-" * (sum(widths) + 3 * (len(widths) - 1)))
         
-        if len(rows) > 10:
-            lines.append(f"... ({len(rows) - 10} more rows)")
+        if len(rows) > limit:
+            lines.append(f"... ({len(rows) - limit} more rows)")
         
         return "\n".join(lines)
     
     def validate_input(self, **kwargs) -> tuple[bool, str]:
         """Validate SQL query input."""
+        if "queries" in kwargs:
+            queries = kwargs["queries"]
+            if not isinstance(queries, list) or not queries:
+                return False, "Parameter 'queries' must be a non-empty list of SQL statements"
+            for statement in queries:
+                is_valid, error = self._check_query(statement)
+                if not is_valid:
+                    return False, error
+            return True, ""
+        
         if "query" not in kwargs:
             return False, "Parameter 'query' is required"
         
-        query = kwargs["query"].strip()
-        if not query:
+        output_format = kwargs.get("format", "pretty")
+        if output_format not in self.OUTPUT_FORMATS:
+            return False, f"Unknown format '{output_format}' (expected one of: {', '.join(self.OUTPUT_FORMATS)})"
+        
+        return self._check_query(kwargs["query"])
+    
+    @staticmethod
+    def _check_query(query: Any) -> tuple[bool, str]:
+        """Validate a query argument (LLM args may be lists or numbers)."""
+        if not isinstance(query, str):
+            return False, "Query must be a string of SQL"
+        return DatabasePlugin._check_query_text(query)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _check_query_text(query: str) -> tuple[bool, str]:
+        """
+        Validate the query text.
+        
+        Cached per query, so an agent retrying the same query after a tool
+        error does not rescan it. The result depends only on the text, so
+        the cache is shared by all instances and never needs clearing.
+        """
+        if not query or query.isspace():
             return False, "Query cannot be empty"
         
         # Basic SQL injection prevention
-        dangerous_keywords = ["DROP DATABASE", "DROP SCHEMA", "--", ";--"]
-        query_upper = query.upper()
-        for keyword in dangerous_keywords:
-            if keyword in query_upper:
-                return False, f"Potentially dangerous query: contains '{keyword}'"
+        match = DatabasePlugin._DANGEROUS_SQL_RE.search(query)
+        if match:
+            keyword = " ".join(match.group().upper().split())
+            return False, f"Potentially dangerous query: contains '{keyword}'"
         
         return True, ""
     
+    def cleanup(self) -> None:
+        """Close all cached connections."""
+        with self._conn_lock:
+            for conn in self._conn_cache.values():
+                conn.close()
+            self._conn_cache.clear()
+            for conn in self._apsw_cache.values():
+                conn.close()
+            self._apsw_cache.clear()
+    
     def describe(self) -> Dict[str, Any]:
-        return {
-            "name": "database",
-            "description": "Execute SQL queries on SQLite databases in the workspace",
-            "parameters": {
-                "query": "SQL query to execute (string)",
-                "database": "Database filename (optional, default: database.db)"
-            },
-            "examples": [
-                "Create a users table with id, name, and email columns",
-                "Insert a user with name 'John' and email 'john@example.com'",
-                "Select all users from the users table",
-                "Update user email where name is 'John'",
-                "Count the number of users in the database"
-            ]
-        }
+        return _DATABASE_DESCRIPTION
+
+
+# Entry point looked up by PluginManager.load_plugin
+PLUGIN_CLASS = DatabasePlugin
 
 
 # Test the plugin
@@ -209,6 +481,13 @@ if __name__ == "__main__":
         print(f"Success: {result.success}")
         print(f"Output: {result.output}\n")
         
+        result = plugin.execute(
+            query="INSERT INTO users (name, email) VALUES (?, ?)",
+            params=[("Carol", "carol@example.com"), ("Dave", "dave@example.com")]
+        )
+        print(f"Success: {result.success}")
+        print(f"Output: {result.output}\n")
+        
         # Test 3: Select data
         print("Test 3: Select data")
         result = plugin.execute(query="SELECT * FROM users")
@@ -224,5 +503,6 @@ if __name__ == "__main__":
         
     finally:
         # Cleanup
+        plugin.cleanup()
         shutil.rmtree(workspace)
         print("Workspace cleaned up")
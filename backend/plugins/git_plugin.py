@@ -11,14 +11,27 @@ Phase 2: Remote Operations
 - Remote repository management
 """
 
+import asyncio
+import functools
 import subprocess
 import os
+import platform
+import re
+import selectors
+import shlex
+import shutil
+import signal
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 import json
 
-sys.path.append(str(Path(__file__).parent.parent))
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
 
 from plugin_interface import (
     ArbiterPlugin,
@@ -28,6 +41,463 @@ from plugin_interface import (
 )
 
 
+# pygit2 is optional: in-process libgit2 for the local actions (status, add,
+# commit, log, branch, checkout); without it they run the git CLI
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    pygit2 = None
+    PYGIT2_AVAILABLE = False
+
+# Resolved once instead of searching PATH on every spawn
+GIT_EXECUTABLE = shutil.which("git") or "git"
+
+# Diff algorithm for diff output; histogram is usually faster than the
+# default myers on source code and gives cleaner hunks
+DIFF_ALGORITHM = os.getenv("ARBITER_DIFF_ALGO", "histogram")
+if DIFF_ALGORITHM not in ("myers", "minimal", "patience", "histogram"):
+    DIFF_ALGORITHM = "histogram"
+
+if PYGIT2_AVAILABLE:
+    # libgit2 status flags counted as staged / unstaged (matching _parse_status)
+    _LG_STAGED = (pygit2.GIT_STATUS_INDEX_NEW | pygit2.GIT_STATUS_INDEX_MODIFIED
+                  | pygit2.GIT_STATUS_INDEX_DELETED | pygit2.GIT_STATUS_INDEX_RENAMED)
+    _LG_UNSTAGED = pygit2.GIT_STATUS_WT_MODIFIED | pygit2.GIT_STATUS_WT_DELETED
+
+
+def _git_action(failure: str, timeout_error: Optional[str] = None):
+    """
+    Error boundary for GitPlugin action handlers.
+    
+    Turns an exception escaping the handler into a failed PluginResult,
+    so the handlers themselves carry no try/except.
+    
+    Args:
+        failure: Error prefix, e.g. "Failed to get status"
+        timeout_error: Error to report when git timed out (default: failure message)
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs) -> PluginResult:
+            try:
+                return method(self, *args, **kwargs)
+            except subprocess.TimeoutExpired as e:
+                return PluginResult(
+                    success=False,
+                    error=timeout_error or f"{failure}: {str(e)}"
+                )
+            except Exception as e:
+                return PluginResult(
+                    success=False,
+                    error=f"{failure}: {str(e)}"
+                )
+        return wrapper
+    return decorator
+
+
+def _run_coroutine(coro):
+    """
+    asyncio.run that also works when the calling thread's loop is running.
+    
+    A synchronous action called from a coroutine (e.g. the websocket
+    server) cannot start a second loop on that thread, so the coroutine
+    then runs on its own loop in a worker thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class _CatFileBatch:
+    """
+    Persistent `git cat-file --batch` (or `--batch-check`) process for
+    object lookups.
+    
+    Spawned on first use and kept alive, so each lookup is a pipe
+    round-trip instead of a new git process. In --batch-check mode only
+    the header is returned, without the object content.
+    """
+    
+    def __init__(self, mode: str = "--batch"):
+        self.mode = mode
+        self._process: Optional[subprocess.Popen] = None
+        self._repo_path: Optional[str] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_process(self, repo_path: str) -> subprocess.Popen:
+        """Start (or restart, after a repo change or exit) the cat-file process."""
+        if (self._process is None or self._process.poll() is not None
+                or self._repo_path != repo_path):
+            self.shutdown()
+            self._process = subprocess.Popen(
+                [GIT_EXECUTABLE, "-C", repo_path, "cat-file", self.mode],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            self._repo_path = repo_path
+        return self._process
+    
+    def read(self, repo_path: str, rev: str) -> Optional[Tuple[str, str, bytes]]:
+        """
+        Look up an object by any revision expression (e.g. "HEAD:README.md").
+        
+        Args:
+            repo_path: Repository to read from
+            rev: Revision expression
+            
+        Returns:
+            (sha, type, content), or None if the object does not exist
+            (content is empty in --batch-check mode)
+        """
+        if "\n" in rev:
+            raise ValueError("Revision must not contain newlines")
+        
+        with self._lock:
+            process = self._ensure_process(repo_path)
+            process.stdin.write(rev.encode("utf-8") + b"\n")
+            process.stdin.flush()
+            
+            # "<sha> <type> <size>" or "<rev> missing"/"<rev> ambiguous";
+            # rev may contain spaces, so the status is the last word
+            header = process.stdout.readline().decode("utf-8", errors="replace").rstrip("\n")
+            fields = header.rsplit(" ", 2)
+            if len(fields) != 3 or fields[-1] in ("missing", "ambiguous"):
+                return None
+            
+            sha, object_type, size = fields
+            if self.mode == "--batch-check":
+                return sha, object_type, b""
+            content = process.stdout.read(int(size))
+            process.stdout.read(1)  # Trailing newline
+            return sha, object_type, content
+    
+    def shutdown(self) -> None:
+        """Stop the cat-file process."""
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.stdin.close()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+class _ShellSession:
+    """
+    Persistent bash process that runs command chains sent over its stdin.
+    
+    Saves starting a new shell for every batch. Each chain runs in a
+    subshell with stdin from /dev/null, so cd, exit or a command reading
+    input cannot disturb the session. The end of a chain is marked by a
+    sentinel on stdout (followed by the exit status) and on stderr.
+    A chain still running after TIMEOUT seconds is killed together with
+    the shell, and the next chain starts a fresh one.
+    """
+    
+    _SENTINEL = b"\0ARBITER-END\0"
+    
+    # Seconds a chain may run (the limit used for network commands)
+    TIMEOUT = 300
+    
+    def __init__(self):
+        self._process: Optional[subprocess.Popen] = None
+        self._cwd: Optional[str] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_process(self, cwd: str) -> subprocess.Popen:
+        """Start (or restart, after a directory change or exit) the shell."""
+        if (self._process is None or self._process.poll() is not None
+                or self._cwd != cwd):
+            self.shutdown()
+            self._process = subprocess.Popen(
+                ["/bin/bash", "-s"],
+                cwd=cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True  # Own process group, killed as a whole on timeout
+            )
+            self._cwd = cwd
+        return self._process
+    
+    def run(self, cwd: str, script: str,
+            timeout: Optional[float] = None) -> Tuple[int, bytes, bytes]:
+        """
+        Run a shell command line in the session.
+        
+        Args:
+            cwd: Directory the command runs in
+            script: Command line (already shell-quoted)
+            timeout: Seconds before the chain is killed (default: TIMEOUT)
+            
+        Returns:
+            (exit status, stdout, stderr)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the chain did not finish in time
+        """
+        timeout = self.TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        request = (
+            f"( {script}\n) </dev/null\n"
+            "printf '\\0ARBITER-END\\0%d\\0' $?; printf '\\0ARBITER-END\\0' >&2\n"
+        ).encode("utf-8")
+        
+        with self._lock:
+            process = self._ensure_process(cwd)
+            try:
+                process.stdin.write(request)
+                process.stdin.flush()
+            except BrokenPipeError:
+                # Died since the poll; nothing ran yet, so retry on a fresh shell
+                self.shutdown()
+                process = self._ensure_process(cwd)
+                process.stdin.write(request)
+                process.stdin.flush()
+            
+            try:
+                return self._read_response(process, deadline)
+            except subprocess.TimeoutExpired:
+                self._kill()
+                raise subprocess.TimeoutExpired(script, timeout)
+    
+    def _read_response(self, process: subprocess.Popen,
+                       deadline: float) -> Tuple[int, bytes, bytes]:
+        """Drain stdout and stderr together until both sentinels arrived."""
+        stdout_fd = process.stdout.fileno()
+        stderr_fd = process.stderr.fileno()
+        buffers = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+        done = {stdout_fd: False, stderr_fd: False}
+        
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdout_fd, selectors.EVENT_READ)
+            selector.register(stderr_fd, selectors.EVENT_READ)
+            while not (done[stdout_fd] and done[stderr_fd]):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(process.args, 0)
+                for key, _ in selector.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        self.shutdown()
+                        raise RuntimeError("Shell session exited unexpectedly")
+                    buffer = buffers[key.fd]
+                    buffer += chunk
+                    if key.fd == stderr_fd:
+                        done[stderr_fd] = buffer.endswith(self._SENTINEL)
+                    else:
+                        marker = buffer.rfind(self._SENTINEL)
+                        done[stdout_fd] = (
+                            marker >= 0
+                            and buffer.find(b"\0", marker + len(self._SENTINEL)) >= 0
+                        )
+                    if done[key.fd]:
+                        selector.unregister(key.fd)
+        
+        stdout = buffers[stdout_fd]
+        marker = stdout.rfind(self._SENTINEL)
+        returncode = int(stdout[marker + len(self._SENTINEL):-1])
+        stderr = buffers[stderr_fd][:-len(self._SENTINEL)]
+        return returncode, bytes(stdout[:marker]), bytes(stderr)
+    
+    def _kill(self) -> None:
+        """Kill the shell and everything it started."""
+        process, self._process = self._process, None
+        if process is not None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            process.wait()
+            process.stdin.close()
+            process.stdout.close()
+            process.stderr.close()
+    
+    def shutdown(self) -> None:
+        """Stop the shell."""
+        process, self._process = self._process, None
+        if process is not None:
+            if process.poll() is None:
+                try:
+                    process.stdin.close()
+                    process.wait(timeout=5)
+                except (BrokenPipeError, subprocess.TimeoutExpired):
+                    process.kill()
+                    process.wait()
+            process.stdout.close()
+            process.stderr.close()
+
+
+class _GitStatusDaemon:
+    """
+    Optional gitstatusd co-process (https://github.com/romkatv/gitstatus).
+    
+    gitstatusd keeps per-repository state between requests, so repeated
+    polls of the same workspace are far cheaper than a git status run.
+    It reports counts rather than paths, so it can answer "is anything
+    dirty?" but not replace the file lists of the status action.
+    """
+    
+    _NAMES = (
+        "gitstatusd",
+        f"gitstatusd-{sys.platform}-{platform.machine().lower()}"
+    )
+    
+    # Seconds to wait for a response before giving up on the daemon
+    TIMEOUT = 5.0
+    
+    def __init__(self):
+        self.executable = next(filter(None, map(shutil.which, self._NAMES)), None)
+        self._process: Optional[subprocess.Popen] = None
+        self._request_id = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def available(self) -> bool:
+        return self.executable is not None
+    
+    def _ensure_process(self) -> subprocess.Popen:
+        """Start (or restart, after an exit) the daemon."""
+        if self._process is None or self._process.poll() is not None:
+            self.shutdown()
+            self._process = subprocess.Popen(
+                [self.executable, "-p", str(os.getpid())],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        return self._process
+    
+    def query(self, repo_path: str) -> Optional[Dict[str, int]]:
+        """
+        Ask the daemon for the change counts of a repository.
+        
+        Args:
+            repo_path: Repository directory
+            
+        Returns:
+            {"staged", "unstaged", "conflicted", "untracked"} counts, or None
+            if the daemon is unavailable, failed or the path is not a repository
+        """
+        if self.executable is None:
+            return None
+        
+        with self._lock:
+            try:
+                process = self._ensure_process()
+                self._request_id += 1
+                request_id = str(self._request_id).encode()
+                # "<id> US <dir> US <dont-compute-dirty> RS"
+                process.stdin.write(request_id + b"\x1f" + os.fsencode(repo_path) + b"\x1f0\x1e")
+                process.stdin.flush()
+                
+                response = bytearray()
+                fd = process.stdout.fileno()
+                with selectors.DefaultSelector() as selector:
+                    selector.register(fd, selectors.EVENT_READ)
+                    while not response.endswith(b"\x1e"):
+                        if not selector.select(self.TIMEOUT):
+                            raise TimeoutError("gitstatusd did not respond")
+                        chunk = os.read(fd, 65536)
+                        if not chunk:
+                            raise EOFError("gitstatusd exited")
+                        response += chunk
+                
+                # id, is-repo, workdir, HEAD, branch, upstream, remote, url,
+                # action, index size, staged, unstaged, conflicted, untracked, ...
+                fields = bytes(response[:-1]).split(b"\x1f")
+                if fields[0] != request_id or fields[1] != b"1":
+                    return None
+                return {
+                    "staged": int(fields[10]),
+                    "unstaged": int(fields[11]),
+                    "conflicted": int(fields[12]),
+                    "untracked": int(fields[13])
+                }
+            except (OSError, ValueError, IndexError, EOFError):
+                # Broken or incompatible daemon: stop using it for this plugin
+                self.shutdown()
+                self.executable = None
+                return None
+    
+    def shutdown(self) -> None:
+        """Stop the daemon."""
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.stdin.close()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+# Built once and shared by every instance (do not mutate)
+_GIT_METADATA = PluginMetadata(
+    name="git",
+    version="1.0.0",
+    author="ArbiterAI",
+    description="Git version control operations and state management",
+    dependencies=["git"],
+    permissions=[
+        PluginPermission.FILESYSTEM,
+        PluginPermission.SHELL
+    ]
+)
+
+_GIT_DESCRIPTION = {
+    "name": "git",
+    "description": "Git version control operations for repository management",
+    "parameters": {
+        "action": "Git action (init, status, add, commit, log, diff, branch, checkout, clone, push, pull, fetch, fetch_all, push_all, remote, batch, many, show, dashboard, is_dirty)",
+        "message": "Commit message (for commit action)",
+        "files": "Pathspec or list of pathspecs to stage (for add action, default: '.')",
+        "count": "Number of commits to show (for log/dashboard actions, default: 5)",
+        "branch": "Branch name (for branch/checkout/push/pull/push_all actions)",
+        "create": "Create new branch (for checkout action)",
+        "url": "Repository URL (for clone/remote actions)",
+        "remote": "Remote name (for push/pull/fetch actions, default: 'origin')",
+        "remotes": "Remote names (for fetch_all/push_all actions, default: all configured remotes)",
+        "directory": "Target directory (for clone action)",
+        "commands": "List of local git commands without 'git' (init, add, commit, status, ...; no config or network), run in one process (for batch action)",
+        "requests": "List of action parameter dicts; consecutive read-only ones run concurrently (for many action)",
+        "stop_on_error": "Skip the remaining actions after a failure, like '&&' (for many action, default: False)",
+        "ref": "Revision to read (for show action, default: 'HEAD')",
+        "path": "File or directory at that revision (for show action) or to limit the diff to (for diff action)",
+        "decorate": "Show branch and tag names next to commits (for log action, default: True)",
+        "untracked": "Count untracked files as changes (for is_dirty action, default: True)",
+        "full": "Return the complete diff as raw bytes in data instead of its first 4 KB (for diff action)"
+    },
+    "examples": [
+        "Initialize repository: action='init'",
+        "Check status: action='status'",
+        "Stage all files: action='add', files='.'",
+        "Commit changes: action='commit', message='feat: add feature'",
+        "View history: action='log', count=10",
+        "Show changes: action='diff'",
+        "Create branch: action='branch', name='feature/new'",
+        "Switch branch: action='checkout', branch='main'",
+        "Clone repository: action='clone', url='https://github.com/user/repo'",
+        "Push to remote: action='push', remote='origin', branch='main'",
+        "Pull from remote: action='pull', remote='origin', branch='main'",
+        "Fetch updates: action='fetch', remote='origin'",
+        "Fetch every remote at once: action='fetch_all'",
+        "Push to several remotes at once: action='push_all', remotes=['origin', 'backup']",
+        "List remotes: action='remote'",
+        "Add remote: action='remote', action='add', name='origin', url='https://...'",
+        "Status, history and changes at once: action='dashboard'",
+        "Check for uncommitted tracked changes: action='is_dirty', untracked=False",
+        "Read a file at a revision: action='show', ref='HEAD~1', path='README.md'",
+        "Init, stage and commit at once: action='batch', commands=['init', 'add -A', 'commit -m \"initial\"']"
+    ]
+}
+
+
 class GitPlugin(ArbiterPlugin):
     """
     Git version control plugin.
@@ -42,50 +512,453 @@ class GitPlugin(ArbiterPlugin):
     - Manage remote connections
     """
     
+    # Action name -> handler method name, resolved with getattr in execute
+    _DISPATCH = {
+        "init": "_git_init",
+        "status": "_git_status",
+        "add": "_git_add",
+        "commit": "_git_commit",
+        "log": "_git_log",
+        "diff": "_git_diff",
+        "branch": "_git_branch",
+        "checkout": "_git_checkout",
+        "clone": "_git_clone",
+        "push": "_git_push",
+        "pull": "_git_pull",
+        "fetch": "_git_fetch",
+        "fetch_all": "_git_fetch_all",
+        "push_all": "_git_push_all",
+        "remote": "_git_remote",
+        "batch": "_git_batch",
+        "many": "_git_many",
+        "show": "_git_show",
+        "dashboard": "_git_dashboard",
+        "is_dirty": "_git_is_dirty"
+    }
+    
+    # Porcelain XY codes (as byte values) counted as staged / unstaged
+    _STAGED_CODES = frozenset(b"AMDRC")
+    _UNSTAGED_CODES = frozenset(b"MD")
+    
+    # Logs with more commits than this are streamed from git
+    LOG_STREAM_THRESHOLD = 100
+    
+    # Actions that never change the repository (everything else drops the query cache)
+    _READ_ONLY_ACTIONS = frozenset({"status", "log", "diff", "show", "dashboard", "is_dirty"})
+    
+    # Machine-readable status with the branch header; paths NUL-separated and unquoted
+    _STATUS_ARGS = ("status", "--porcelain=v2", "-z", "--branch")
+    
+    # Plain patch output (no colour codes or external diff tools), DIFF_ALGORITHM hunks
+    _DIFF_ARGS = ("diff", "--no-color", "--no-ext-diff", f"--diff-algorithm={DIFF_ALGORITHM}")
+    
+    # Subcommands a batch may run (no network, config or arbitrary-command ones)
+    _BATCH_SUBCOMMANDS = frozenset({
+        "init", "add", "rm", "mv", "commit", "status", "log", "diff", "show",
+        "branch", "checkout", "switch", "restore", "reset", "tag", "stash",
+        "merge", "rev-parse", "ls-files"
+    })
+    
+    # Batch arguments that set config or name a program for git to run
+    _BATCH_FORBIDDEN_ARG_RE = re.compile(
+        r'^(?:-c|--config|--upload-pack|--receive-pack|--exec|--output|core\.)',
+        re.IGNORECASE
+    )
+    
+    # Summary line printed by git commit: "[main (root-commit) 1a2b3c4] message"
+    _COMMIT_SUMMARY_RE = re.compile(r'^\[[^\]\n]* ([0-9a-f]{4,40})\] ', re.MULTILINE)
+    
     def __init__(self):
         self.repo_path = None
         self.workspace_path = None
+        # String forms of repo_path and its .git, passed to every spawn and stat
+        self._repo_cwd: Optional[str] = None
+        self._git_dir: Optional[str] = None
+        # ("git", "-C", repo, ...): argv prefix of every command run in the repository
+        self._git_base: Tuple[str, ...] = (GIT_EXECUTABLE,)
+        # "-c user.name=... -c user.email=..." passed to commands that commit
+        self._identity: List[str] = []
+        # Long-lived object readers: contents for show, headers for rev lookups
+        self._cat_file = _CatFileBatch()
+        self._cat_check = _CatFileBatch("--batch-check")
+        # Long-lived shell for batch command chains
+        self._shell = _ShellSession()
+        # gitstatusd co-process for dirty checks, when installed (probed once)
+        self._gsd = _GitStatusDaemon()
+        # Whether repo_path holds a repository (None: not checked yet)
+        self._is_repo: Optional[bool] = None
+        # Open pygit2 repository for repo_path (None: not opened yet, False: open failed)
+        self._lg_repo = None
+        # (name, email) for commits made through libgit2
+        self._user: Tuple[str, str] = ("ArbiterAI", "arbiter@ai.local")
+        # Memoized log/branch results: {(action, args...): (HEAD key, result)}
+        self._query_cache: Dict[tuple, Tuple[tuple, PluginResult]] = {}
     
     @property
     def metadata(self) -> PluginMetadata:
-        return PluginMetadata(
-            name="git",
-            version="1.0.0",
-            author="ArbiterAI",
-            description="Git version control operations and state management",
-            dependencies=["git"],
-            permissions=[
-                PluginPermission.FILESYSTEM,
-                PluginPermission.SHELL
-            ]
-        )
+        return _GIT_METADATA
     
     def initialize(self, workspace: str) -> bool:
         """Initialize plugin with workspace."""
         self.workspace_path = Path(workspace)
-        self.repo_path = self.workspace_path
+        self._set_repo_path(self.workspace_path)
+        self._in_repo()
         
         # Configure git user if not set
         self._configure_git_user()
         
         return True
     
+    def _set_repo_path(self, path: Path) -> None:
+        """Point the plugin at a repository, refreshing the derived strings."""
+        self.repo_path = path
+        self._repo_cwd = os.fspath(path)
+        self._git_dir = os.path.join(self._repo_cwd, ".git")
+        self._forget_repo()
+    
+    def _forget_repo(self) -> None:
+        """Drop the cached repository check and handle (after init/clone/batch)."""
+        self._is_repo = None
+        self._lg_repo = None
+        # quotepath off: non-ASCII paths in diff/log output print as-is, not octal-escaped
+        self._git_base = (GIT_EXECUTABLE, "-C", self._repo_cwd, "-c", "core.quotepath=false")
+    
+    def _libgit2(self):
+        """
+        The pygit2 repository for repo_path, or None to use the git CLI.
+        
+        None when pygit2 is not installed, there is no repository yet or
+        libgit2 cannot open it. A failed open is remembered (False) until
+        the repository changes, instead of being retried on every call.
+        """
+        if not PYGIT2_AVAILABLE or not self._in_repo():
+            return None
+        if self._lg_repo is None:
+            try:
+                self._lg_repo = pygit2.Repository(self._repo_cwd)
+            except pygit2.GitError:
+                self._lg_repo = False
+        return self._lg_repo if self._lg_repo is not False else None
+    
+    def _in_repo(self) -> bool:
+        """
+        Whether repo_path is a git repository.
+        
+        A positive answer is cached (init/clone/batch reset it), so the
+        common case costs no stat. A negative one is re-checked, since the
+        repository may have been created outside this plugin.
+        
+        Once a plain .git directory is found, git is told where it is
+        (--git-dir/--work-tree) so later commands skip repository
+        discovery. A .git file (worktree, submodule) is left to git.
+        """
+        if not self._is_repo:
+            self._is_repo = os.path.exists(self._git_dir)
+            if self._is_repo and os.path.isdir(self._git_dir):
+                self._git_base = (
+                    GIT_EXECUTABLE, "-C", self._repo_cwd,
+                    "--git-dir", self._git_dir, "--work-tree", self._repo_cwd,
+                    "-c", "core.quotepath=false"
+                )
+        return self._is_repo
+    
     def _configure_git_user(self):
-        """Configure git user name and email."""
+        """
+        Configure git user name and email.
+        
+        Passed as -c flags on the commands that need them instead of
+        writing the global config, which cost two extra processes.
+        """
         user_name = os.getenv("GIT_USER_NAME", "ArbiterAI")
         user_email = os.getenv("GIT_USER_EMAIL", "arbiter@ai.local")
         
-        try:
-            subprocess.run(
-                ["git", "config", "--global", "user.name", user_name],
-                capture_output=True
+        self._user = (user_name, user_email)
+        self._identity = [
+            "-c", f"user.name={user_name}",
+            "-c", f"user.email={user_email}"
+        ]
+    
+    def _run_chain(self, commands: List[List[str]]) -> subprocess.CompletedProcess:
+        """
+        Run several commands in one shell, stopping at the first failure.
+        
+        Every argument is shell-quoted, so the commands cannot inject shell
+        syntax; only the joining "&&" is interpreted. The shell is the
+        plugin's persistent session, so no new bash is started per chain.
+        
+        Args:
+            commands: Argument lists, e.g. [["git", "add", "-A"], ...]
+            
+        Returns:
+            CompletedProcess of the shell (stdout of all commands, in order)
+        """
+        chain = " && ".join(shlex.join(cmd) for cmd in commands)
+        returncode, stdout, stderr = self._shell.run(self._repo_cwd, chain)
+        return subprocess.CompletedProcess(
+            chain,
+            returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace")
+        )
+    
+    def _spawn_git(self, args: Sequence[str], text: bool = True,
+                   timeout: Optional[float] = None,
+                   in_repo: bool = True,
+                   keep_stdout: bool = True) -> subprocess.CompletedProcess:
+        """
+        Run a git command, capturing its output.
+        
+        Every git call goes through here with the same plain arguments: no
+        preexec_fn, session/process-group/uid changes or pass_fds. That keeps
+        CPython on its vfork launch path on Linux, so spawning does not copy
+        the page tables of a large backend process. Don't add such options.
+        The repository is selected with "git -C" rather than cwd=, so the
+        child does not chdir before exec.
+        
+        close_fds=False is safe because Python creates its descriptors
+        non-inheritable (PEP 446), and the pipes git needs are dup2'd
+        explicitly. With it CPython launches through posix_spawn where it
+        can: on macOS that replaces fork, and on Linux the child no longer
+        walks the parent's descriptor table to close it. The other
+        per-call spawns (_run_many, _stream_lines, _read_head,
+        _run_per_remote) do the same.
+        
+        Args:
+            args: Arguments after "git"
+            text: Decode output as text
+            timeout: Seconds before the command is killed
+            in_repo: Run inside the repository (False: current directory)
+            keep_stdout: Capture stdout (False: send it to /dev/null, saving a
+                         pipe for commands whose output is never read)
+            
+        Returns:
+            CompletedProcess with stdout (None unless kept) and stderr
+        """
+        return subprocess.run(
+            (self._git_base if in_repo else (GIT_EXECUTABLE,)) + tuple(args),
+            stdout=subprocess.PIPE if keep_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+            text=text,
+            timeout=timeout
+        )
+    
+    def _run_many(self, commands: List[List[str]]) -> List[subprocess.CompletedProcess]:
+        """
+        Run independent read-only git commands concurrently.
+        
+        All processes are started up front and their pipes are drained by
+        one epoll/poll loop on the calling thread, so a single wait covers
+        every ready pipe instead of one reader thread (and one poll) per
+        process.
+        
+        Args:
+            commands: Argument lists after "git"
+            
+        Returns:
+            CompletedProcess per command (bytes output), in the same order
+        """
+        # (process, stdout fd, stderr fd); fds stay unique while their pipes are open
+        processes: List[Tuple[subprocess.Popen, int, int]] = []
+        outputs: Dict[int, List[bytes]] = {}
+        with selectors.DefaultSelector() as selector:
+            try:
+                for cmd in commands:
+                    process = subprocess.Popen(
+                        self._git_base + tuple(cmd),
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        close_fds=False
+                    )
+                    processes.append((process, process.stdout.fileno(), process.stderr.fileno()))
+                    for pipe in (process.stdout, process.stderr):
+                        outputs[pipe.fileno()] = []
+                        selector.register(pipe, selectors.EVENT_READ)
+                
+                while selector.get_map():
+                    for key, _ in selector.select():
+                        chunk = os.read(key.fd, 65536)
+                        if chunk:
+                            outputs[key.fd].append(chunk)
+                        else:
+                            selector.unregister(key.fileobj)
+                            key.fileobj.close()
+            except BaseException:
+                for process, _, _ in processes:
+                    process.kill()
+                raise
+            finally:
+                for process, _, _ in processes:
+                    process.stdout.close()
+                    process.stderr.close()
+                    process.wait()
+        
+        return [
+            subprocess.CompletedProcess(
+                self._git_base + tuple(cmd),
+                process.returncode,
+                b"".join(outputs[stdout_fd]),
+                b"".join(outputs[stderr_fd])
+            )
+            for cmd, (process, stdout_fd, stderr_fd) in zip(commands, processes)
+        ]
+    
+    @_git_action("Failed to run git batch")
+    def _git_batch(self, commands: List[Union[str, List[str]]] = None, **kwargs) -> PluginResult:
+        """
+        Run a sequence of git commands in a single process spawn.
+        
+        Args:
+            commands: Git commands without the leading "git", as strings
+                      ("add -A") or argument lists (["commit", "-m", "msg"])
+        """
+        if not commands:
+            return PluginResult(
+                success=False,
+                error="Batch requires a non-empty 'commands' list"
+            )
+        
+        chain = []
+        for command in commands:
+            args = shlex.split(command) if isinstance(command, str) else [str(arg) for arg in command]
+            if args and args[0] == "git":
+                args = args[1:]
+            
+            # The LLM must not reach git's global options or its
+            # command-running config (aliases, hooks via core.*, upload-pack)
+            if not args or args[0] not in self._BATCH_SUBCOMMANDS:
+                return PluginResult(
+                    success=False,
+                    error=f"🚫 Batch command not allowed: {shlex.join(args) or '(empty)'} "
+                          f"(allowed subcommands: {', '.join(sorted(self._BATCH_SUBCOMMANDS))})"
+                )
+            for arg in args[1:]:
+                if self._BATCH_FORBIDDEN_ARG_RE.match(arg):
+                    return PluginResult(
+                        success=False,
+                        error=f"🚫 Batch argument not allowed: {arg}"
+                    )
+            
+            chain.append([*self._git_base, *self._identity, *args])
+        
+        result = self._run_chain(chain)
+        self._forget_repo()  # The batch may have run init
+        
+        if result.returncode == 0:
+            return PluginResult(
+                success=True,
+                output=f"✅ Ran {len(chain)} git command(s)\n{result.stdout}".rstrip()
             )
-            subprocess.run(
-                ["git", "config", "--global", "user.email", user_email],
-                capture_output=True
+        else:
+            return PluginResult(
+                success=False,
+                error=result.stderr or result.stdout
             )
-        except Exception:
-            pass  # Git config is optional
+    
+    @_git_action("Failed to run git actions")
+    def _git_many(self, requests: List[Dict[str, Any]] = None,
+                  stop_on_error: bool = False, **kwargs) -> PluginResult:
+        """
+        Run several plugin actions, overlapping the independent reads.
+        
+        Args:
+            requests: execute() arguments per action ({"action": "log", "count": 3})
+            stop_on_error: Skip the remaining actions once one fails, like
+                           a "&&" chain (default: run them all)
+        """
+        if not requests:
+            return PluginResult(
+                success=False,
+                error="Many requires a non-empty 'requests' list"
+            )
+        
+        results = _run_coroutine(self.execute_many(requests, stop_on_error))
+        failed = sum(not result.success for result in results)
+        
+        lines = []
+        for request, result in zip(requests, results):
+            mark = "✅" if result.success else "❌"
+            lines.append(f"{mark} {request.get('action')}")
+            lines.append(result.output if result.success else result.error)
+        
+        return PluginResult(
+            success=failed == 0,
+            output="\n".join(lines),
+            error=f"{failed} of {len(results)} action(s) failed" if failed else None,
+            data={"results": [result.to_dict() for result in results]}
+        )
+    
+    async def execute_many(self, requests: List[Dict[str, Any]],
+                           stop_on_error: bool = False) -> List[PluginResult]:
+        """
+        Execute several actions, running consecutive read-only ones concurrently.
+        
+        Reads (status, log, diff, show, branch listing, ...) between two
+        writes are independent, so they run on worker threads and their git
+        processes overlap. Every other action waits for the reads before it
+        and runs alone, which keeps writes in request order. With libgit2
+        the reads spawn nothing and simply run in turn.
+        
+        With stop_on_error, the plan behaves like a "&&" chain: after a
+        failure (or a failing read in a concurrent group) the remaining
+        actions are not run and get a failed "Skipped" result.
+        
+        Args:
+            requests: execute() arguments per action ({"action": "log", "count": 3})
+            stop_on_error: Skip the remaining actions once one fails
+            
+        Returns:
+            PluginResult per request, in the same order
+        """
+        results: List[PluginResult] = []
+        reads: List[Dict[str, Any]] = []
+        
+        def failed() -> bool:
+            return stop_on_error and any(not result.success for result in results)
+        
+        async def flush() -> None:
+            if len(reads) > 1 and self._libgit2() is None:
+                results.extend(await asyncio.gather(
+                    *(asyncio.to_thread(self._execute_request, request) for request in reads)
+                ))
+            else:
+                results.extend(self._execute_request(request) for request in reads)
+            reads.clear()
+        
+        for request in requests:
+            if failed():
+                break
+            action = request.get("action")
+            if self._is_read_only(action, request):
+                reads.append(request)
+                continue
+            
+            await flush()
+            if failed():
+                break
+            results.append(self._execute_request(request))
+        else:
+            await flush()
+        
+        if len(results) < len(requests):
+            skipped = PluginResult(
+                success=False,
+                error="Skipped: an earlier action failed"
+            )
+            results.extend(skipped for _ in range(len(requests) - len(results)))
+        return results
+    
+    def _execute_request(self, request: Dict[str, Any]) -> PluginResult:
+        """Validate and execute one execute_many request."""
+        is_valid, error_msg = self.validate_input(**request)
+        if not is_valid:
+            return PluginResult(
+                success=False,
+                error=f"Validation failed: {error_msg}"
+            )
+        
+        params = dict(request)
+        return self.execute(params.pop("action"), **params)
     
     def execute(self, action: str, **kwargs) -> PluginResult:
         """
@@ -98,359 +971,895 @@ class GitPlugin(ArbiterPlugin):
         Returns:
             PluginResult with operation outcome
         """
-        actions = {
-            "init": self._git_init,
-            "status": self._git_status,
-            "add": self._git_add,
-            "commit": self._git_commit,
-            "log": self._git_log,
-            "diff": self._git_diff,
-            "branch": self._git_branch,
-            "checkout": self._git_checkout,
-            "clone": self._git_clone,
-            "push": self._git_push,
-            "pull": self._git_pull,
-            "fetch": self._git_fetch,
-            "remote": self._git_remote
-        }
-        
-        if action not in actions:
+        method_name = self._DISPATCH.get(action)
+        if method_name is None:
             return PluginResult(
                 success=False,
                 error=f"Unknown git action: {action}"
             )
         
+        if not self._is_read_only(action, kwargs):
+            self._query_cache.clear()
+        
         try:
-            return actions[action](**kwargs)
+            return getattr(self, method_name)(**kwargs)
         except Exception as e:
             return PluginResult(
                 success=False,
                 error=f"Git {action} failed: {str(e)}"
             )
     
+    def _current_branch(self) -> str:
+        """
+        Name of the checked-out branch ("" when detached), like
+        `git branch --show-current`.
+        
+        Read straight from .git/HEAD; git is only spawned when .git is not
+        a plain directory (worktrees, submodules).
+        """
+        try:
+            with open(os.path.join(self._git_dir, "HEAD"), "rb") as f:
+                head = f.read().strip()
+        except OSError:
+            return self._spawn_git(["branch", "--show-current"]).stdout.strip()
+        
+        if head.startswith(b"ref: refs/heads/"):
+            return os.fsdecode(head[16:])
+        return ""
+    
+    @_git_action("Failed to initialize repository")
     def _git_init(self, **kwargs) -> PluginResult:
         """Initialize git repository."""
-        try:
-            result = subprocess.run(
-                ["git", "init"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
+        # Name the first branch up front (git >= 2.28) instead of leaving
+        # it to init.defaultBranch and the "master" hint
+        result = self._spawn_git(["init", "--initial-branch=main", "-q"], text=False, keep_stdout=False)
+        self._forget_repo()
+        
+        if result.returncode == 0:
+            return PluginResult(
+                success=True,
+                output=f"✅ Initialized git repository at {self.repo_path}"
             )
-            
-            if result.returncode == 0:
-                return PluginResult(
-                    success=True,
-                    output=f"✅ Initialized git repository at {self.repo_path}"
-                )
-            else:
-                return PluginResult(
-                    success=False,
-                    error=result.stderr
-                )
-        except Exception as e:
+        else:
             return PluginResult(
                 success=False,
-                error=f"Failed to initialize repository: {str(e)}"
+                error=result.stderr.decode("utf-8", errors="replace")
             )
     
+    @_git_action("Failed to get status")
     def _git_status(self, **kwargs) -> PluginResult:
         """Get repository status."""
-        try:
-            # Check if git repo exists
-            if not (self.repo_path / ".git").exists():
-                return PluginResult(
-                    success=False,
-                    error="Not a git repository. Run 'git init' first."
-                )
-            
-            # Get status
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
+        # Check if git repo exists
+        if not self._in_repo():
+            return PluginResult(
+                success=False,
+                error="Not a git repository. Run 'git init' first."
+            )
+        
+        state = self._status_libgit2()
+        if state is None:
+            # Get status (the branch comes in the header, no second process).
+            # The untracked cache lets git skip unchanged directories.
+            result = self._spawn_git(
+                ["-c", "core.untrackedCache=true", *self._STATUS_ARGS],
+                text=False
             )
             
             # Parse status
             state = self._parse_status(result.stdout)
-            
-            # Get current branch
-            branch_result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
-            )
-            state["branch"] = branch_result.stdout.strip() or "main"
-            
-            # Format output
-            output = self._format_status(state)
-            
+        
+        # Format output
+        output = self._format_status(state)
+        
+        return PluginResult(
+            success=True,
+            output=output,
+            data=state
+        )
+    
+    def _status_libgit2(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the status in-process through libgit2.
+        
+        Returns:
+            The same state dict as _parse_status, or None to use the git CLI
+        """
+        repo = self._libgit2()
+        if repo is None:
+            return None
+        
+        try:
+            entries = repo.status(untracked_files="normal")
+        except (pygit2.GitError, TypeError):
+            return None
+        
+        staged = []
+        unstaged = []
+        untracked = []
+        conflicted = []
+        for path in sorted(entries):
+            flags = entries[path]
+            if flags & pygit2.GIT_STATUS_CONFLICTED:
+                conflicted.append(path)
+                continue
+            if flags & _LG_STAGED:
+                staged.append(path)
+            if flags & _LG_UNSTAGED:
+                unstaged.append(path)
+            if flags & pygit2.GIT_STATUS_WT_NEW:
+                untracked.append(path)
+        
+        return {
+            "branch": self._libgit2_branch(repo) or "main",
+            "staged": staged,
+            "unstaged": unstaged,
+            "untracked": untracked,
+            "conflicted": conflicted
+        }
+    
+    @staticmethod
+    def _libgit2_branch(repo) -> str:
+        """Current branch name, "(detached)" on a detached HEAD."""
+        if repo.head_is_detached:
+            return "(detached)"
+        # Symbolic HEAD, resolvable even before the first commit
+        target = repo.references["HEAD"].target
+        return target[len("refs/heads/"):] if target.startswith("refs/heads/") else target
+    
+    @_git_action("Failed to check working tree")
+    def _git_is_dirty(self, untracked: bool = True, **kwargs) -> PluginResult:
+        """
+        Report whether the working tree has any changes.
+        
+        Answered by gitstatusd when it is installed. Otherwise only the
+        first byte of git status is read; git is stopped as soon as one
+        changed entry shows up instead of scanning the whole tree.
+        
+        Args:
+            untracked: Count untracked files (False skips scanning for them)
+        """
+        if not self._in_repo():
             return PluginResult(
-                success=True,
-                output=output,
-                data=state
+                success=False,
+                error="Not a git repository. Run 'git init' first."
             )
-        except Exception as e:
+        
+        counts = self._gsd.query(self._repo_cwd) if self._gsd.available else None
+        if counts is not None:
+            dirty = bool(
+                counts["staged"] or counts["unstaged"] or counts["conflicted"]
+                or (untracked and counts["untracked"])
+            )
+        else:
+            args = ["status", "--porcelain", "--no-renames"]
+            if not untracked:
+                args.append("-uno")
+            head, _, error = self._read_head(args, 1)
+            if error is not None:
+                return PluginResult(success=False, error=error)
+            dirty = bool(head)
+        
+        return PluginResult(
+            success=True,
+            output="⚠️ Working tree has changes" if dirty else "✨ Working tree clean",
+            data={"dirty": dirty}
+        )
+    
+    def _head_key(self) -> tuple:
+        """
+        Cheap fingerprint of HEAD, the index and every ref.
+        
+        One stat per file plus one per directory under .git/refs: refs are
+        updated by lock-and-rename, which bumps the containing directory's
+        mtime, so a moved branch or new tag changes the key.
+        """
+        key = []
+        for name in ("HEAD", "index", "packed-refs"):
+            try:
+                st = os.stat(os.path.join(self._git_dir, name))
+                key.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                key.append(None)
+        
+        stack = [os.path.join(self._git_dir, "refs")]
+        while stack:
+            path = stack.pop()
+            try:
+                key.append((path, os.stat(path).st_mtime_ns))
+                with os.scandir(path) as it:
+                    stack.extend(entry.path for entry in it if entry.is_dir(follow_symlinks=False))
+            except OSError:
+                continue
+        return tuple(key)
+    
+    def _cached_query(self, key: tuple, compute) -> PluginResult:
+        """
+        Return a memoized read-only result while the HEAD key is unchanged.
+        
+        A plain dict keyed by the action arguments; only successful results
+        are kept, and callers get a copy. Skipped when .git is not a
+        directory (worktree, submodule): the HEAD and refs it points to
+        are elsewhere, so the key would never change.
+        
+        Args:
+            key: Action name and arguments
+            compute: Callable producing the PluginResult on a miss
+        """
+        if not os.path.isdir(self._git_dir):
+            return compute()
+        
+        head_key = self._head_key()
+        cached = self._query_cache.get(key)
+        if cached is not None and cached[0] == head_key:
+            result = cached[1]
+        else:
+            result = compute()
+            if result.success:
+                self._query_cache[key] = (head_key, result)
+        
+        return PluginResult(
+            success=result.success,
+            output=result.output,
+            error=result.error,
+            data=self._copy_state(result.data)
+        )
+    
+    @staticmethod
+    def _copy_state(state: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a result data dict so callers cannot mutate the cached one."""
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in state.items()
+        }
+    
+    @_git_action("Failed to build dashboard")
+    def _git_dashboard(self, count: int = 5, **kwargs) -> PluginResult:
+        """Status, recent commits, diff summary and branches in one call."""
+        if not self._in_repo():
             return PluginResult(
                 success=False,
-                error=f"Failed to get status: {str(e)}"
+                error="Not a git repository. Run 'git init' first."
             )
+        
+        count = self._parse_count(count)
+        if count is None:
+            return PluginResult(
+                success=False,
+                error="'count' must be a positive integer"
+            )
+        
+        # Independent read-only commands: wall time is the slowest one
+        status_result, log_result, diff_result, branch_result = self._run_many([
+            list(self._STATUS_ARGS),
+            ["log", f"-{count}", "--oneline", "--decorate"],
+            [*self._DIFF_ARGS, "--stat"],
+            ["branch"]
+        ])
+        
+        state = self._parse_status(status_result.stdout)
+        log = log_result.stdout.decode("utf-8", errors="replace").strip()
+        diff = diff_result.stdout.decode("utf-8", errors="replace").rstrip()
+        branches = branch_result.stdout.decode("utf-8", errors="replace").rstrip()
+        
+        sections = [self._format_status(state)]
+        sections.append(f"📜 Recent commits:\n{log}" if log else "No commits yet")
+        if diff:
+            sections.append(f"📝 Changes:\n{diff[:1000]}")  # Limit output
+        if branches:
+            sections.append(f"🌿 Branches:\n{branches}")
+        
+        return PluginResult(
+            success=True,
+            output="\n\n".join(sections),
+            data={**state, "log": log, "diff_stat": diff}
+        )
     
-    def _parse_status(self, status_output: str) -> Dict[str, List[str]]:
-        """Parse git status --porcelain output."""
+    def _parse_status(self, status_output: bytes) -> Dict[str, Any]:
+        """
+        Parse git status --porcelain=v2 -z --branch output.
+        
+        Records are NUL-separated and paths are unquoted, so only the
+        fields that are used get decoded. Record kinds and XY codes are
+        compared as byte values, which avoids a slice per record.
+        Lookups used per record are bound to locals up front.
+        """
         staged = []
         unstaged = []
         untracked = []
+        conflicted = []
+        branch = ""
+        fsdecode = os.fsdecode
+        staged_codes = self._STAGED_CODES
+        unstaged_codes = self._UNSTAGED_CODES
+        add_staged = staged.append
+        add_unstaged = unstaged.append
         
-        for line in status_output.split('\n'):
-            if not line:
+        records = iter(status_output.split(b"\0"))
+        for record in records:
+            if not record:
                 continue
             
-            status_code = line[:2]
-            filename = line[3:]
-            
-            if status_code[0] in ['A', 'M', 'D', 'R', 'C']:
-                staged.append(filename)
-            if status_code[1] in ['M', 'D']:
-                unstaged.append(filename)
-            if status_code == '??':
-                untracked.append(filename)
+            kind = record[0]
+            if kind == 49 or kind == 50:  # "1" / "2"
+                # "1 XY sub mH mI mW hH hI path"
+                # "2 XY sub mH mI mW hH hI Xscore path", original path in next record
+                if kind == 49:
+                    filename = fsdecode(record.split(b" ", 8)[8])
+                else:
+                    filename = fsdecode(record.split(b" ", 9)[9])
+                    next(records, None)
+                
+                if record[2] in staged_codes:
+                    add_staged(filename)
+                if record[3] in unstaged_codes:
+                    add_unstaged(filename)
+            elif kind == 63:  # "?"
+                untracked.append(fsdecode(record[2:]))
+            elif kind == 117:  # "u"
+                # "u XY sub m1 m2 m3 mW h1 h2 h3 path" (unmerged)
+                conflicted.append(fsdecode(record.split(b" ", 10)[10]))
+            elif kind == 35 and record.startswith(b"# branch.head "):
+                # "# branch.head <name>" (or "(detached)")
+                branch = fsdecode(record[14:])
         
         return {
+            "branch": branch or "main",
             "staged": staged,
             "unstaged": unstaged,
-            "untracked": untracked
+            "untracked": untracked,
+            "conflicted": conflicted
         }
     
     def _format_status(self, state: Dict) -> str:
         """Format status for display."""
-        lines = []
-        lines.append(f"📍 Branch: {state.get('branch', 'unknown')}")
-        
-        if state["staged"]:
-            lines.append(f"\n✅ Staged files ({len(state['staged'])}):")
-            for f in state["staged"]:
-                lines.append(f"  + {f}")
-        
-        if state["unstaged"]:
-            lines.append(f"\n⚠️ Unstaged changes ({len(state['unstaged'])}):")
-            for f in state["unstaged"]:
-                lines.append(f"  M {f}")
-        
-        if state["untracked"]:
-            lines.append(f"\n❓ Untracked files ({len(state['untracked'])}):")
-            for f in state["untracked"][:5]:  # Limit to 5
-                lines.append(f"  ? {f}")
-            if len(state["untracked"]) > 5:
-                lines.append(f"  ... and {len(state['untracked']) - 5} more")
-        
-        if not (state["staged"] or state["unstaged"] or state["untracked"]):
+        staged = state["staged"]
+        unstaged = state["unstaged"]
+        untracked = state["untracked"]
+        conflicted = state.get("conflicted", [])
+        
+        lines = [f"📍 Branch: {state.get('branch', 'unknown')}"]
+        
+        if conflicted:
+            lines.append(f"\n💥 Conflicts ({len(conflicted)}):")
+            lines.extend(["  U " + f for f in conflicted])
+        
+        if staged:
+            lines.append(f"\n✅ Staged files ({len(staged)}):")
+            lines.extend(["  + " + f for f in staged])
+        
+        if unstaged:
+            lines.append(f"\n⚠️ Unstaged changes ({len(unstaged)}):")
+            lines.extend(["  M " + f for f in unstaged])
+        
+        if untracked:
+            lines.append(f"\n❓ Untracked files ({len(untracked)}):")
+            lines.extend(["  ? " + f for f in untracked[:5]])  # Limit to 5
+            if len(untracked) > 5:
+                lines.append(f"  ... and {len(untracked) - 5} more")
+        
+        if not (staged or unstaged or untracked or conflicted):
             lines.append("\n✨ Working tree clean")
         
         return "\n".join(lines)
     
-    def _git_add(self, files: str = ".", **kwargs) -> PluginResult:
-        """Stage files for commit."""
-        try:
-            result = subprocess.run(
-                ["git", "add", files],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
+    @_git_action("Failed to stage files")
+    def _git_add(self, files: Union[str, List[str]] = ".", **kwargs) -> PluginResult:
+        """
+        Stage files for commit.
+        
+        Staged in-process through libgit2 when available. A plain path that
+        is neither on disk nor in the index goes to the git CLI, since
+        libgit2 would silently stage nothing where git reports the typo.
+        
+        Args:
+            files: One pathspec or a list of them; each is passed to git
+                   as-is (globs are expanded by git, never by a shell)
+        """
+        pathspecs = (files,) if isinstance(files, str) else tuple(files) or (".",)
+        label = ", ".join(pathspecs)
+        
+        repo = self._libgit2()
+        if repo is not None:
+            # Like "git add <pathspec>": new, modified and deleted files
+            index = repo.index
+            index.read()
+            for pathspec in pathspecs:
+                if (pathspec != "." and not any(c in pathspec for c in "*?[")
+                        and pathspec not in index
+                        and not os.path.lexists(os.path.join(self._repo_cwd, pathspec))):
+                    repo = None
+                    break
+        if repo is not None:
+            index.add_all(list(pathspecs))
+            index.write()
+            return PluginResult(
+                success=True,
+                output=f"✅ Staged: {label}"
+            )
+        
+        # "--" so a pathspec starting with "-" is never read as an option
+        result = self._spawn_git(("add", "--") + pathspecs, text=False, keep_stdout=False)
+        
+        if result.returncode == 0:
+            return PluginResult(
+                success=True,
+                output=f"✅ Staged: {label}"
+            )
+        else:
+            return PluginResult(
+                success=False,
+                error=result.stderr.decode("utf-8", errors="replace")
             )
+    
+    @_git_action("Failed to commit")
+    def _git_commit(self, message: str, **kwargs) -> PluginResult:
+        """Create commit with message."""
+        if not message:
+            return PluginResult(
+                success=False,
+                error="Commit message is required"
+            )
+        
+        repo = self._libgit2()
+        if repo is not None:
+            return self._commit_libgit2(repo, message)
+        
+        result = self._spawn_git([*self._identity, "commit", "-m", message])
+        
+        if result.returncode == 0:
+            # Extract commit hash from the summary line, so no second
+            # process is needed (the cat-file reader if the format is unexpected)
+            match = self._COMMIT_SUMMARY_RE.search(result.stdout)
+            if match:
+                commit_hash = match.group(1)
+            else:
+                found = self._cat_check.read(self._repo_cwd, "HEAD")
+                commit_hash = found[0][:7] if found else ""
             
-            if result.returncode == 0:
+            return PluginResult(
+                success=True,
+                output=f"✅ Commit created: {commit_hash}\n{message}",
+                data={"commit_hash": commit_hash}
+            )
+        else:
+            return PluginResult(
+                success=False,
+                error=result.stderr
+            )
+    
+    def _commit_libgit2(self, repo, message: str) -> PluginResult:
+        """
+        Commit the index in-process.
+        
+        Like git commit, refuses when nothing is staged. Commit hooks and
+        signing are not run on this path.
+        """
+        index = repo.index
+        index.read()
+        tree = index.write_tree()
+        
+        if repo.head_is_unborn:
+            parents = []
+            if not len(index):
                 return PluginResult(
-                    success=True,
-                    output=f"✅ Staged: {files}"
+                    success=False,
+                    error="nothing to commit (create/copy files and use \"git add\" to track)"
                 )
-            else:
+        else:
+            head = repo.head.peel(pygit2.Commit)
+            parents = [head.id]
+            if head.tree_id == tree:
                 return PluginResult(
                     success=False,
-                    error=result.stderr
+                    error="nothing to commit, working tree clean"
                 )
-        except Exception as e:
+        
+        signature = pygit2.Signature(*self._user)
+        oid = repo.create_commit("HEAD", signature, signature, message.strip() + "\n", tree, parents)
+        commit_hash = repo[oid].short_id
+        
+        return PluginResult(
+            success=True,
+            output=f"✅ Commit created: {commit_hash}\n{message}",
+            data={"commit_hash": commit_hash}
+        )
+    
+    @_git_action("Failed to get log")
+    def _git_log(self, count: int = 5, decorate: bool = True, **kwargs) -> PluginResult:
+        """
+        View commit history.
+        
+        decorate=False leaves out the branch and tag names, which spares
+        git the ref walk when only hashes and subjects are needed.
+        """
+        if not self._in_repo():
             return PluginResult(
                 success=False,
-                error=f"Failed to stage files: {str(e)}"
+                error="Not a git repository. Run 'git init' first."
             )
-    
-    def _git_commit(self, message: str, **kwargs) -> PluginResult:
-        """Create commit with message."""
-        if not message:
+        
+        count = self._parse_count(count)
+        if count is None:
             return PluginResult(
                 success=False,
-                error="Commit message is required"
+                error="'count' must be a positive integer"
             )
         
+        return self._cached_query(("log", count, decorate),
+                                  lambda: self._read_log(count, decorate))
+    
+    @classmethod
+    def _is_read_only(cls, action: str, kwargs: Dict[str, Any]) -> bool:
+        """Whether an action leaves the repository unchanged (branch without a name lists)."""
+        return action in cls._READ_ONLY_ACTIONS or (action == "branch" and not kwargs.get("name"))
+    
+    @staticmethod
+    def _parse_count(count: Any) -> Optional[int]:
+        """Coerce a commit count (LLM args are often strings), None if invalid."""
         try:
-            result = subprocess.run(
-                ["git", "commit", "-m", message],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
+            count = int(count)
+        except (TypeError, ValueError):
+            return None
+        return count if count > 0 else None
+    
+    def _read_log(self, count: int, decorate: bool = True) -> PluginResult:
+        """Recent commits, from libgit2 when available, else git log."""
+        commits = self._log_libgit2(count, decorate)
+        if commits is not None:
+            return PluginResult(
+                success=True,
+                output="📜 Recent commits:\n" + "\n".join(commits),
+                data={"commits": commits}
             )
+        
+        args = ["log", f"--max-count={count}", "--no-color", "--oneline",
+                "--decorate" if decorate else "--no-decorate"]
+        if count > self.LOG_STREAM_THRESHOLD:
+            returncode, lines, stderr = self._stream_lines(args)
+        else:
+            result = self._spawn_git(args, text=False)
+            returncode, lines, stderr = result.returncode, result.stdout.splitlines(), result.stderr
+        
+        if returncode == 0:
+            commits = [line.decode("utf-8", errors="replace") for line in lines]
+            if commits:
+                output = "📜 Recent commits:\n" + "\n".join(commits)
+            else:
+                output = "No commits yet"
             
-            if result.returncode == 0:
-                # Extract commit hash
-                hash_result = subprocess.run(
-                    ["git", "rev-parse", "--short", "HEAD"],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                commit_hash = hash_result.stdout.strip()
-                
+            return PluginResult(
+                success=True,
+                output=output,
+                data={"commits": commits}
+            )
+        else:
+            return PluginResult(
+                success=False,
+                error=stderr.decode("utf-8", errors="replace")
+            )
+    
+    def _log_libgit2(self, count: int, decorate: bool = True) -> Optional[List[str]]:
+        """
+        Recent commits as "--oneline --decorate" lines, read through libgit2.
+        
+        Args:
+            count: Number of commits
+            decorate: Add ref names (False: "--no-decorate" lines, no ref scan)
+        
+        Returns:
+            The lines, or None to use the git CLI (also before the first
+            commit, so the CLI reports that error)
+        """
+        repo = self._libgit2()
+        if repo is None or repo.head_is_unborn:
+            return None
+        
+        # Decorations per commit in git's order: HEAD first, then the other
+        # refs by full name, descending
+        decorations: Dict[Any, List[str]] = {}
+        head = repo.head
+        for name in sorted(repo.references, reverse=True) if decorate else ():
+            if name.startswith("refs/heads/"):
+                label = name[11:]
+                if not repo.head_is_detached and name == head.name:
+                    label = f"HEAD -> {label}"
+            elif name.startswith("refs/remotes/"):
+                label = name[13:]
+            elif name.startswith("refs/tags/"):
+                label = f"tag: {name[10:]}"
+            else:
+                continue
+            try:
+                target = repo.references[name].peel(pygit2.Commit).id
+            except (pygit2.GitError, ValueError):
+                continue
+            labels = decorations.setdefault(target, [])
+            if label.startswith("HEAD -> "):
+                labels.insert(0, label)
+            else:
+                labels.append(label)
+        if decorate and repo.head_is_detached:
+            decorations.setdefault(head.target, []).insert(0, "HEAD")
+        
+        commits = []
+        for commit in repo.walk(head.target, pygit2.GIT_SORT_TIME):
+            if len(commits) >= count:
+                break
+            labels = decorations.get(commit.id)
+            decoration = f" ({', '.join(labels)})" if labels else ""
+            commits.append(f"{commit.short_id}{decoration} {commit.message.partition(chr(10))[0]}")
+        return commits
+    
+    @_git_action("Failed to get diff")
+    def _git_diff(self, full: bool = False, path: Optional[str] = None,
+                  **kwargs) -> PluginResult:
+        """
+        Show diff of unstaged changes.
+        
+        Only the displayed head of the diff is read unless full is set;
+        git is stopped once it is known there is more. With full, the
+        complete diff is returned in data["diff"]. path limits the diff
+        to one file or directory, so git never produces the rest.
+        """
+        if not self._in_repo():
+            return PluginResult(
+                success=False,
+                error="Not a git repository. Run 'git init' first."
+            )
+        
+        args = list(self._DIFF_ARGS)
+        if path:
+            args += ["--", path]
+        
+        if full:
+            result = self._spawn_git(args, text=False)
+            if result.returncode != 0:
                 return PluginResult(
-                    success=True,
-                    output=f"✅ Commit created: {commit_hash}\n{message}",
-                    data={"commit_hash": commit_hash}
+                    success=False,
+                    error=result.stderr.decode("utf-8", errors="replace")
                 )
-            else:
+            diff = result.stdout.decode("utf-8", errors="replace")
+            head = diff[:4096]
+            truncated = len(diff) > 4096
+        else:
+            head, truncated, error = self._read_head(args, 4096)
+            if error is not None:
+                return PluginResult(success=False, error=error)
+            diff = head
+        
+        if head.strip():
+            output = f"📝 Changes:\n{head[:1000]}"  # Limit output
+            if truncated or len(head) > 1000:
+                output += "\n... (truncated)"
+        else:
+            output = "No changes to show"
+        
+        return PluginResult(
+            success=True,
+            output=output,
+            data={"diff": diff, "truncated": truncated and not full}
+        )
+    
+    @_git_action("Failed to show object")
+    def _git_show(self, ref: str = "HEAD", path: str = None, **kwargs) -> PluginResult:
+        """Show an object: a file at a revision, a commit or a directory listing."""
+        if not self._in_repo():
+            return PluginResult(
+                success=False,
+                error="Not a git repository. Run 'git init' first."
+            )
+        
+        spec = f"{ref}:{path}" if path else ref
+        found = self._cat_file.read(self._repo_cwd, spec)
+        if found is None:
+            return PluginResult(
+                success=False,
+                error=f"Object not found: {spec}"
+            )
+        
+        sha, object_type, content = found
+        if object_type == "tree":
+            text = "\n".join(self._parse_tree(content))
+        else:
+            text = content.decode("utf-8", errors="replace")
+        
+        output = f"📄 {spec} ({object_type} {sha[:7]}):\n{text[:1000]}"  # Limit output
+        if len(text) > 1000:
+            output += "\n... (truncated)"
+        
+        return PluginResult(
+            success=True,
+            output=output,
+            data={"sha": sha, "type": object_type, "content": text}
+        )
+    
+    @staticmethod
+    def _parse_tree(content: bytes) -> List[str]:
+        """Entry names of a raw tree object ("<mode> <name>\\0<20-byte sha>" records)."""
+        names = []
+        pos = 0
+        while pos < len(content):
+            space = content.index(b" ", pos)
+            nul = content.index(b"\0", space)
+            mode = content[pos:space]
+            name = content[space + 1:nul].decode("utf-8", errors="replace")
+            names.append(name + "/" if mode == b"40000" else name)
+            pos = nul + 21
+        return names
+    
+    def _stream_lines(self, args: List[str]) -> Tuple[int, List[bytes], bytes]:
+        """
+        Run a git command and collect its output line by line as it arrives.
+        
+        Avoids holding the whole output and its split copy at once.
+        
+        Args:
+            args: Arguments after "git"
+            
+        Returns:
+            (returncode, lines without newlines, stderr)
+        """
+        process = subprocess.Popen(
+            self._git_base + tuple(args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False
+        )
+        with process:
+            # stderr is only read at the end; git's error messages fit in the pipe
+            lines = [line.rstrip(b"\n") for line in process.stdout]
+            stderr = process.stderr.read()
+        return process.returncode, lines, stderr
+    
+    def _read_head(self, args: List[str], limit: int) -> Tuple[str, bool, Optional[str]]:
+        """
+        Read at most limit bytes of a git command's output.
+        
+        git is only stopped when there is more output than limit; if it
+        ran to completion its exit status is checked, so a failing
+        command is not mistaken for one with empty output.
+        
+        Args:
+            args: Arguments after "git"
+            limit: Bytes to keep
+            
+        Returns:
+            (decoded head, whether output was cut off, git's error message
+            if it failed or None)
+        """
+        process = subprocess.Popen(
+            self._git_base + tuple(args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False
+        )
+        truncated = True
+        try:
+            head = process.stdout.read(limit)
+            truncated = bool(process.stdout.read(1))
+        finally:
+            # Closing the pipe makes git exit on EPIPE; terminate covers the rest
+            process.stdout.close()
+            if truncated and process.poll() is None:
+                process.terminate()
+            # stderr is only read at the end; git's error messages fit in the pipe
+            stderr = process.stderr.read()
+            process.stderr.close()
+            process.wait()
+        
+        error = None
+        if not truncated and process.returncode != 0:
+            error = (stderr.decode("utf-8", errors="replace").strip()
+                     or f"git exited with status {process.returncode}")
+        return head.decode("utf-8", errors="replace"), truncated, error
+    
+    @_git_action("Failed to manage branches")
+    def _git_branch(self, name: str = None, **kwargs) -> PluginResult:
+        """List or create branches."""
+        if not name:
+            if self._in_repo():
+                return self._cached_query(("branch",), self._list_branches)
+            return self._list_branches()
+        
+        repo = self._libgit2()
+        if repo is not None and not repo.head_is_unborn:
+            if name in repo.branches.local:
                 return PluginResult(
                     success=False,
-                    error=result.stderr
+                    error=f"fatal: a branch named '{name}' already exists"
                 )
-        except Exception as e:
+            repo.branches.local.create(name, repo.head.peel(pygit2.Commit))
             return PluginResult(
-                success=False,
-                error=f"Failed to commit: {str(e)}"
+                success=True,
+                output=f"✅ Created branch: {name}"
             )
-    
-    def _git_log(self, count: int = 5, **kwargs) -> PluginResult:
-        """View commit history."""
-        try:
-            result = subprocess.run(
-                ["git", "log", f"-{count}", "--oneline", "--decorate"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
+        
+        # Create branch
+        result = self._spawn_git(["branch", name], text=False, keep_stdout=False)
+        
+        if result.returncode == 0:
+            return PluginResult(
+                success=True,
+                output=f"✅ Created branch: {name}"
             )
-            
-            if result.returncode == 0:
-                if result.stdout.strip():
-                    output = f"📜 Recent commits:\n{result.stdout}"
-                else:
-                    output = "No commits yet"
-                
-                return PluginResult(
-                    success=True,
-                    output=output
-                )
-            else:
-                return PluginResult(
-                    success=False,
-                    error=result.stderr
-                )
-        except Exception as e:
+        else:
             return PluginResult(
                 success=False,
-                error=f"Failed to get log: {str(e)}"
+                error=result.stderr.decode("utf-8", errors="replace")
             )
     
-    def _git_diff(self, **kwargs) -> PluginResult:
-        """Show diff of unstaged changes."""
-        try:
-            result = subprocess.run(
-                ["git", "diff"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
+    def _list_branches(self) -> PluginResult:
+        """List local branches, marking the current one."""
+        repo = self._libgit2()
+        # git describes a detached HEAD from its reflog, so that listing stays with git
+        if repo is not None and not repo.head_is_unborn and not repo.head_is_detached:
+            current = repo.head.shorthand
+            listing = "".join(
+                f"{'*' if branch == current else ' '} {branch}\n"
+                for branch in sorted(repo.branches.local)
             )
-            
-            if result.stdout.strip():
-                output = f"📝 Changes:\n{result.stdout[:1000]}"  # Limit output
-                if len(result.stdout) > 1000:
-                    output += "\n... (truncated)"
-            else:
-                output = "No changes to show"
-            
             return PluginResult(
                 success=True,
-                output=output,
-                data={"diff": result.stdout}
-            )
-        except Exception as e:
-            return PluginResult(
-                success=False,
-                error=f"Failed to get diff: {str(e)}"
+                output=f"🌿 Branches:\n{listing}"
             )
+        
+        # List branches
+        result = self._spawn_git(["branch"])
+        
+        return PluginResult(
+            success=True,
+            output=f"🌿 Branches:\n{result.stdout}"
+        )
     
-    def _git_branch(self, name: str = None, **kwargs) -> PluginResult:
-        """List or create branches."""
-        try:
-            if name:
-                # Create branch
-                result = subprocess.run(
-                    ["git", "branch", name],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode == 0:
-                    return PluginResult(
-                        success=True,
-                        output=f"✅ Created branch: {name}"
-                    )
-                else:
+    @_git_action("Failed to checkout")
+    def _git_checkout(self, branch: str, create: bool = False, **kwargs) -> PluginResult:
+        """Switch branches."""
+        repo = self._libgit2()
+        # Local branches only; anything else (commits, remote branches) goes to git
+        if (repo is not None and not repo.head_is_unborn
+                and (create or branch in repo.branches.local)):
+            if create:
+                if branch in repo.branches.local:
                     return PluginResult(
                         success=False,
-                        error=result.stderr
+                        error=f"fatal: a branch named '{branch}' already exists"
                     )
-            else:
-                # List branches
-                result = subprocess.run(
-                    ["git", "branch"],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                
+                repo.branches.local.create(branch, repo.head.peel(pygit2.Commit))
+            try:
+                repo.checkout(repo.branches.local[branch])
+            except pygit2.GitError as e:
+                # E.g. local changes the switch would overwrite
                 return PluginResult(
-                    success=True,
-                    output=f"🌿 Branches:\n{result.stdout}"
+                    success=False,
+                    error=str(e)
                 )
-        except Exception as e:
+            
+            action = "Created and switched to" if create else "Switched to"
             return PluginResult(
-                success=False,
-                error=f"Failed to manage branches: {str(e)}"
+                success=True,
+                output=f"✅ {action} branch: {branch}"
             )
-    
-    def _git_checkout(self, branch: str, create: bool = False, **kwargs) -> PluginResult:
-        """Switch branches."""
-        try:
-            cmd = ["git", "checkout"]
-            if create:
-                cmd.append("-b")
-            cmd.append(branch)
-            
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
+        
+        cmd = ["checkout"]
+        if create:
+            cmd.append("-b")
+        cmd.append(branch)
+        
+        result = self._spawn_git(cmd, text=False, keep_stdout=False)
+        
+        if result.returncode == 0:
+            action = "Created and switched to" if create else "Switched to"
+            return PluginResult(
+                success=True,
+                output=f"✅ {action} branch: {branch}"
             )
-            
-            if result.returncode == 0:
-                action = "Created and switched to" if create else "Switched to"
-                return PluginResult(
-                    success=True,
-                    output=f"✅ {action} branch: {branch}"
-                )
-            else:
-                return PluginResult(
-                    success=False,
-                    error=result.stderr
-                )
-        except Exception as e:
+        else:
             return PluginResult(
                 success=False,
-                error=f"Failed to checkout: {str(e)}"
+                error=result.stderr.decode("utf-8", errors="replace")
             )
     
+    @_git_action("Failed to clone", timeout_error="Clone operation timed out (>5 minutes)")
     def _git_clone(self, url: str, directory: str = None, **kwargs) -> PluginResult:
         """Clone remote repository."""
         if not url:
@@ -459,255 +1868,285 @@ class GitPlugin(ArbiterPlugin):
                 error="Repository URL is required"
             )
         
-        try:
-            target = directory or self.workspace_path
-            
-            result = subprocess.run(
-                ["git", "clone", url, str(target)],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout for large repos
-            )
+        target = directory or self.workspace_path
+        
+        result = self._spawn_git(
+            ["clone", url, str(target)],
+            timeout=300,  # 5 minute timeout for large repos
+            in_repo=False
+        )
+        
+        if result.returncode == 0:
+            # Update repo path if cloned to workspace
+            if not directory:
+                self._set_repo_path(Path(target))
             
-            if result.returncode == 0:
-                # Update repo path if cloned to workspace
-                if not directory:
-                    self.repo_path = Path(target)
-                
-                return PluginResult(
-                    success=True,
-                    output=f"✅ Cloned repository from {url}"
-                )
-            else:
-                return PluginResult(
-                    success=False,
-                    error=result.stderr
-                )
-        except subprocess.TimeoutExpired:
             return PluginResult(
-                success=False,
-                error="Clone operation timed out (>5 minutes)"
+                success=True,
+                output=f"✅ Cloned repository from {url}"
             )
-        except Exception as e:
+        else:
             return PluginResult(
                 success=False,
-                error=f"Failed to clone: {str(e)}"
+                error=result.stderr
             )
     
+    @_git_action("Failed to push", timeout_error="Push operation timed out (>5 minutes)")
     def _git_push(self, remote: str = "origin", branch: str = None, **kwargs) -> PluginResult:
         """Push commits to remote."""
-        try:
-            # Get current branch if not specified
-            if not branch:
-                branch_result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                branch = branch_result.stdout.strip()
-            
-            if not branch:
-                return PluginResult(
-                    success=False,
-                    error="No branch specified and could not detect current branch"
-                )
-            
-            result = subprocess.run(
-                ["git", "push", remote, branch],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            if result.returncode == 0:
-                return PluginResult(
-                    success=True,
-                    output=f"✅ Pushed to {remote}/{branch}\n{result.stdout}"
-                )
-            else:
-                return PluginResult(
-                    success=False,
-                    error=result.stderr
-                )
-        except subprocess.TimeoutExpired:
+        # Get current branch if not specified
+        if not branch:
+            branch = self._current_branch()
+        
+        if not branch:
             return PluginResult(
                 success=False,
-                error="Push operation timed out (>5 minutes)"
+                error="No branch specified and could not detect current branch"
             )
-        except Exception as e:
+        
+        result = self._spawn_git(["push", remote, branch], timeout=300)
+        
+        if result.returncode == 0:
+            return PluginResult(
+                success=True,
+                output=f"✅ Pushed to {remote}/{branch}\n{result.stdout}"
+            )
+        else:
             return PluginResult(
                 success=False,
-                error=f"Failed to push: {str(e)}"
+                error=result.stderr
             )
     
+    @_git_action("Failed to pull", timeout_error="Pull operation timed out (>5 minutes)")
     def _git_pull(self, remote: str = "origin", branch: str = None, **kwargs) -> PluginResult:
         """Pull changes from remote."""
-        try:
-            # Get current branch if not specified
-            if not branch:
-                branch_result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
-                )
-                branch = branch_result.stdout.strip()
-            
-            if not branch:
-                return PluginResult(
-                    success=False,
-                    error="No branch specified and could not detect current branch"
-                )
-            
-            result = subprocess.run(
-                ["git", "pull", remote, branch],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            if result.returncode == 0:
-                return PluginResult(
-                    success=True,
-                    output=f"✅ Pulled from {remote}/{branch}\n{result.stdout}"
-                )
-            else:
-                return PluginResult(
-                    success=False,
-                    error=result.stderr
-                )
-        except subprocess.TimeoutExpired:
+        # Get current branch if not specified
+        if not branch:
+            branch = self._current_branch()
+        
+        if not branch:
             return PluginResult(
                 success=False,
-                error="Pull operation timed out (>5 minutes)"
+                error="No branch specified and could not detect current branch"
             )
-        except Exception as e:
+        
+        # Identity flags since pull may create a merge commit
+        result = self._spawn_git([*self._identity, "pull", remote, branch], timeout=300)
+        
+        if result.returncode == 0:
+            return PluginResult(
+                success=True,
+                output=f"✅ Pulled from {remote}/{branch}\n{result.stdout}"
+            )
+        else:
             return PluginResult(
                 success=False,
-                error=f"Failed to pull: {str(e)}"
+                error=result.stderr
             )
     
+    @_git_action("Failed to fetch", timeout_error="Fetch operation timed out (>5 minutes)")
     def _git_fetch(self, remote: str = "origin", **kwargs) -> PluginResult:
         """Fetch updates from remote."""
-        try:
-            result = subprocess.run(
-                ["git", "fetch", remote],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=300
+        result = self._spawn_git(["fetch", remote], timeout=300)
+        
+        if result.returncode == 0:
+            return PluginResult(
+                success=True,
+                output=f"✅ Fetched from {remote}\n{result.stdout or 'Up to date'}"
             )
+        else:
+            return PluginResult(
+                success=False,
+                error=result.stderr
+            )
+    
+    async def _run_per_remote(self, remotes: List[str],
+                              make_args) -> List[Tuple[str, int, str, str]]:
+        """
+        Run one network git command per remote concurrently.
+        
+        The commands are network-bound, so they overlap instead of paying
+        each remote's round-trips in turn. A semaphore caps how many run
+        at once.
+        
+        Args:
+            remotes: Remote names
+            make_args: Callable returning the arguments after "git" for a remote
             
-            if result.returncode == 0:
-                return PluginResult(
-                    success=True,
-                    output=f"✅ Fetched from {remote}\n{result.stdout or 'Up to date'}"
+        Returns:
+            (remote, returncode, stdout, stderr) per remote, in the same order
+        """
+        limit = max(1, min(len(remotes), (os.cpu_count() or 4) * 3 // 4))
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def run(remote: str) -> Tuple[str, int, str, str]:
+            async with semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    *self._git_base, *make_args(remote),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    close_fds=False
                 )
-            else:
-                return PluginResult(
-                    success=False,
-                    error=result.stderr
+                try:
+                    stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    return remote, -1, "", "Operation timed out (>5 minutes)"
+                return (
+                    remote,
+                    process.returncode,
+                    stdout.decode("utf-8", errors="replace"),
+                    stderr.decode("utf-8", errors="replace")
                 )
-        except subprocess.TimeoutExpired:
+        
+        return await asyncio.gather(*(run(remote) for remote in remotes))
+    
+    def _list_remotes(self) -> List[str]:
+        """Names of the configured remotes."""
+        result = self._spawn_git(["remote"])
+        return result.stdout.split()
+    
+    def _remotes_result(self, verb: str, results: List[Tuple[str, int, str, str]]) -> PluginResult:
+        """Summarize per-remote results; fails if any remote failed."""
+        lines = []
+        failed = []
+        for remote, returncode, stdout, stderr in results:
+            if returncode == 0:
+                lines.append(f"✅ {verb} {remote}")
+            else:
+                lines.append(f"❌ {remote}: {stderr.strip() or stdout.strip()}")
+                failed.append(remote)
+        
+        data = {
+            remote: {"success": returncode == 0, "stdout": stdout, "stderr": stderr}
+            for remote, returncode, stdout, stderr in results
+        }
+        output = "\n".join(lines)
+        
+        if failed:
             return PluginResult(
                 success=False,
-                error="Fetch operation timed out (>5 minutes)"
+                output=output,
+                error=f"Failed for remote(s): {', '.join(failed)}",
+                data=data
             )
-        except Exception as e:
+        return PluginResult(
+            success=True,
+            output=output,
+            data=data
+        )
+    
+    @_git_action("Failed to fetch")
+    def _git_fetch_all(self, remotes: List[str] = None, **kwargs) -> PluginResult:
+        """Fetch from several remotes (default: all configured) concurrently."""
+        remotes = remotes or self._list_remotes()
+        if not remotes:
+            return PluginResult(
+                success=False,
+                error="No remotes configured"
+            )
+        
+        results = _run_coroutine(self._run_per_remote(remotes, lambda remote: ["fetch", remote]))
+        return self._remotes_result("Fetched from", results)
+    
+    @_git_action("Failed to push")
+    def _git_push_all(self, remotes: List[str] = None, branch: str = None, **kwargs) -> PluginResult:
+        """Push a branch to several remotes (default: all configured) concurrently."""
+        # Get current branch if not specified
+        if not branch:
+            branch = self._current_branch()
+        
+        if not branch:
+            return PluginResult(
+                success=False,
+                error="No branch specified and could not detect current branch"
+            )
+        
+        remotes = remotes or self._list_remotes()
+        if not remotes:
             return PluginResult(
                 success=False,
-                error=f"Failed to fetch: {str(e)}"
+                error="No remotes configured"
             )
+        
+        results = _run_coroutine(
+            self._run_per_remote(remotes, lambda remote: ["push", remote, branch])
+        )
+        return self._remotes_result(f"Pushed {branch} to", results)
     
+    @_git_action("Failed to manage remotes")
     def _git_remote(self, action: str = "list", name: str = None, url: str = None, **kwargs) -> PluginResult:
         """Manage remote repositories."""
-        try:
-            if action == "list":
-                # List remotes
-                result = subprocess.run(
-                    ["git", "remote", "-v"],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
+        if action == "list":
+            # List remotes
+            result = self._spawn_git(["remote", "-v"])
+            
+            if result.stdout.strip():
+                output = f"🌐 Remotes:\n{result.stdout}"
+            else:
+                output = "No remotes configured"
+            
+            return PluginResult(
+                success=True,
+                output=output
+            )
+        
+        elif action == "add":
+            # Add remote
+            if not name or not url:
+                return PluginResult(
+                    success=False,
+                    error="Both 'name' and 'url' are required to add remote"
                 )
-                
-                if result.stdout.strip():
-                    output = f"🌐 Remotes:\n{result.stdout}"
-                else:
-                    output = "No remotes configured"
-                
+            
+            result = self._spawn_git(["remote", "add", name, url], text=False, keep_stdout=False)
+            
+            if result.returncode == 0:
                 return PluginResult(
                     success=True,
-                    output=output
+                    output=f"✅ Added remote '{name}': {url}"
                 )
-            
-            elif action == "add":
-                # Add remote
-                if not name or not url:
-                    return PluginResult(
-                        success=False,
-                        error="Both 'name' and 'url' are required to add remote"
-                    )
-                
-                result = subprocess.run(
-                    ["git", "remote", "add", name, url],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
+            else:
+                return PluginResult(
+                    success=False,
+                    error=result.stderr.decode("utf-8", errors="replace")
                 )
-                
-                if result.returncode == 0:
-                    return PluginResult(
-                        success=True,
-                        output=f"✅ Added remote '{name}': {url}"
-                    )
-                else:
-                    return PluginResult(
-                        success=False,
-                        error=result.stderr
-                    )
-            
-            elif action == "remove":
-                # Remove remote
-                if not name:
-                    return PluginResult(
-                        success=False,
-                        error="Remote 'name' is required to remove"
-                    )
-                
-                result = subprocess.run(
-                    ["git", "remote", "remove", name],
-                    cwd=self.repo_path,
-                    capture_output=True,
-                    text=True
+        
+        elif action == "remove":
+            # Remove remote
+            if not name:
+                return PluginResult(
+                    success=False,
+                    error="Remote 'name' is required to remove"
                 )
-                
-                if result.returncode == 0:
-                    return PluginResult(
-                        success=True,
-                        output=f"✅ Removed remote: {name}"
-                    )
-                else:
-                    return PluginResult(
-                        success=False,
-                        error=result.stderr
-                    )
             
+            result = self._spawn_git(["remote", "remove", name], text=False, keep_stdout=False)
+            
+            if result.returncode == 0:
+                return PluginResult(
+                    success=True,
+                    output=f"✅ Removed remote: {name}"
+                )
             else:
                 return PluginResult(
                     success=False,
-                    error=f"Unknown remote action: {action}. Use 'list', 'add', or 'remove'"
+                    error=result.stderr.decode("utf-8", errors="replace")
                 )
         
-        except Exception as e:
+        else:
             return PluginResult(
                 success=False,
-                error=f"Failed to manage remotes: {str(e)}"
+                error=f"Unknown remote action: {action}. Use 'list', 'add', or 'remove'"
             )
     
+    def cleanup(self) -> None:
+        """Stop the cat-file process, the shell session and gitstatusd."""
+        self._cat_file.shutdown()
+        self._cat_check.shutdown()
+        self._shell.shutdown()
+        self._gsd.shutdown()
+    
     def validate_input(self, **kwargs) -> tuple[bool, str]:
         """Validate git operation input."""
         action = kwargs.get("action")
@@ -723,40 +2162,22 @@ class GitPlugin(ArbiterPlugin):
         if action == "checkout" and not kwargs.get("branch"):
             return False, "Branch name is required for checkout"
         
+        # Validate batch
+        if action == "batch" and not kwargs.get("commands"):
+            return False, "Parameter 'commands' is required for batch"
+        
+        # Validate many
+        if action == "many" and not kwargs.get("requests"):
+            return False, "Parameter 'requests' is required for many"
+        
         return True, ""
     
     def describe(self) -> Dict[str, Any]:
-        return {
-            "name": "git",
-            "description": "Git version control operations for repository management",
-            "parameters": {
-                "action": "Git action (init, status, add, commit, log, diff, branch, checkout, clone, push, pull, fetch, remote)",
-                "message": "Commit message (for commit action)",
-                "files": "Files to stage (for add action, default: '.')",
-                "count": "Number of commits to show (for log action, default: 5)",
-                "branch": "Branch name (for branch/checkout/push/pull actions)",
-                "create": "Create new branch (for checkout action)",
-                "url": "Repository URL (for clone/remote actions)",
-                "remote": "Remote name (for push/pull/fetch actions, default: 'origin')",
-                "directory": "Target directory (for clone action)"
-            },
-            "examples": [
-                "Initialize repository: action='init'",
-                "Check status: action='status'",
-                "Stage all files: action='add', files='.'",
-                "Commit changes: action='commit', message='feat: add feature'",
-                "View history: action='log', count=10",
-                "Show changes: action='diff'",
-                "Create branch: action='branch', name='feature/new'",
-                "Switch branch: action='checkout', branch='main'",
-                "Clone repository: action='clone', url='https://github.com/user/repo'",
-                "Push to remote: action='push', remote='origin', branch='main'",
-                "Pull from remote: action='pull', remote='origin', branch='main'",
-                "Fetch updates: action='fetch', remote='origin'",
-                "List remotes: action='remote'",
-                "Add remote: action='remote', action='add', name='origin', url='https://...'"
-            ]
-        }
+        return _GIT_DESCRIPTION
+
+
+# Entry point looked up by PluginManager.load_plugin
+PLUGIN_CLASS = GitPlugin
 
 
 # Test the plugin
@@ -791,15 +2212,17 @@ if __name__ == "__main__":
         result = plugin.execute("status")
         print(f"Output:\n{result.output}\n")
         
-        # Test 4: Stage files
-        print("Test 4: Stage files")
-        result = plugin.execute("add", files=".")
+        # Test 4: Stage and commit in one process
+        print("Test 4: Stage and commit (batch)")
+        result = plugin.execute("batch", commands=[["add", "."], ["commit", "-m", "feat: initial commit"]])
         print(f"Success: {result.success}")
         print(f"Output: {result.output}\n")
         
         # Test 5: Commit
         print("Test 5: Commit")
-        result = plugin.execute("commit", message="feat: initial commit")
+        (Path(workspace) / "test.txt").write_text("Hello again!")
+        plugin.execute("add", files=".")
+        result = plugin.execute("commit", message="feat: second commit")
         print(f"Success: {result.success}")
         print(f"Output: {result.output}\n")
         
@@ -809,7 +2232,14 @@ if __name__ == "__main__":
         print(f"Success: {result.success}")
         print(f"Output:\n{result.output}\n")
         
+        # Test 7: Show file from the previous commit
+        print("Test 7: Show file at HEAD~1")
+        result = plugin.execute("show", ref="HEAD~1", path="test.txt")
+        print(f"Success: {result.success}")
+        print(f"Output:\n{result.output}\n")
+        
     finally:
         # Cleanup
+        plugin.cleanup()
         shutil.rmtree(workspace)
         print("Workspace cleaned up")
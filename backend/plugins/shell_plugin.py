@@ -3,9 +3,13 @@ Shell Execution Plugin for ArbiterAI
 Executes shell commands with MANDATORY Docker isolation.
 """
 
+import asyncio
+import os
+import re
 import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
 
 from plugin_interface import (
     ArbiterPlugin,
@@ -13,7 +17,39 @@ from plugin_interface import (
     PluginResult,
     PluginPermission
 )
-from sandbox_manager import DockerSandbox
+from sandbox_manager import AIODOCKER_AVAILABLE, AsyncDockerSandbox, DockerSandbox
+
+
+# Built once and shared by every instance (do not mutate)
+_SHELL_METADATA = PluginMetadata(
+    name="shell",
+    version="2.0.0",
+    author="ArbiterAI",
+    description="Execute shell commands in Docker containers",
+    dependencies=["docker"],
+    permissions=[
+        PluginPermission.SHELL,
+        PluginPermission.FILESYSTEM
+    ]
+)
+
+_SHELL_DESCRIPTION = {
+    "name": "shell",
+    "description": "Execute shell commands in isolated Docker containers with resource limits",
+    "parameters": {
+        "command": "Shell command to execute (string)",
+        "timeout": "Execution timeout in seconds (optional, default: 30)",
+        "enable_network": "Enable network access (optional, default: False)"
+    },
+    "examples": [
+        "Run 'python script.py'",
+        "Execute 'npm install'",
+        "Run 'git clone repo_url'",
+        "Execute 'pytest tests/'",
+        "Run 'docker build -t image .'",
+        "List files with 'ls -la'"
+    ]
+}
 
 
 class ShellPlugin(ArbiterPlugin):
@@ -46,29 +82,24 @@ class ShellPlugin(ArbiterPlugin):
         'chown root'
     ]
     
+    # All blacklist patterns as one alternation, scanned in a single pass
+    _BLACKLIST_RE = re.compile("|".join(map(re.escape, BLACKLIST)))
+    
     def __init__(self):
         self.sandbox = None
         self.workspace_path = None
     
     @property
     def metadata(self) -> PluginMetadata:
-        return PluginMetadata(
-            name="shell",
-            version="2.0.0",
-            author="ArbiterAI",
-            description="Execute shell commands in Docker containers",
-            dependencies=["docker"],
-            permissions=[
-                PluginPermission.SHELL,
-                PluginPermission.FILESYSTEM
-            ]
-        )
+        return _SHELL_METADATA
     
     def initialize(self, workspace: str) -> bool:
         """Initialize Docker sandbox."""
         try:
             self.workspace_path = workspace
-            self.sandbox = DockerSandbox(
+            # The async sandbox also serves aexecute without a thread per command
+            sandbox_class = AsyncDockerSandbox if AIODOCKER_AVAILABLE else DockerSandbox
+            self.sandbox = sandbox_class(
                 workspace_path=workspace,
                 cpu_limit=1.0,
                 memory_limit="512m",
@@ -103,25 +134,60 @@ class ShellPlugin(ArbiterPlugin):
         
         try:
             # Execute in Docker sandbox
-            result = self.sandbox.execute(command, timeout)
+            return self._to_plugin_result(self.sandbox.execute(command, timeout))
             
+        except Exception as e:
             return PluginResult(
-                success=result.success,
-                output=result.stdout,
-                error=result.stderr,
-                data={
-                    "exit_code": result.exit_code,
-                    "execution_time": result.execution_time,
-                    "sandbox": "docker"
-                }
+                success=False,
+                error=f"Shell execution error: {str(e)}"
             )
+    
+    async def aexecute(self,
+                       command: str,
+                       timeout: int = 30,
+                       enable_network: bool = False,
+                       **kwargs) -> PluginResult:
+        """
+        Execute shell command in Docker container without blocking the event loop.
+        
+        With aiodocker the exec is awaited on the loop; otherwise the blocking
+        call runs on a worker thread.
+        
+        Args:
+            command: Shell command to execute
+            timeout: Execution timeout (default: 30s)
+            enable_network: Enable network access (default: False)
             
+        Returns:
+            PluginResult with command output
+        """
+        if not isinstance(self.sandbox, AsyncDockerSandbox):
+            return await asyncio.to_thread(
+                self.execute, command, timeout, enable_network, **kwargs
+            )
+        
+        try:
+            return self._to_plugin_result(await self.sandbox.aexecute(command, timeout))
         except Exception as e:
             return PluginResult(
                 success=False,
                 error=f"Shell execution error: {str(e)}"
             )
     
+    @staticmethod
+    def _to_plugin_result(result) -> PluginResult:
+        """Wrap a SandboxExecutionResult."""
+        return PluginResult(
+            success=result.success,
+            output=result.stdout,
+            error=result.stderr,
+            data={
+                "exit_code": result.exit_code,
+                "execution_time": result.execution_time,
+                "sandbox": "docker"
+            }
+        )
+    
     def validate_input(self, **kwargs) -> tuple[bool, str]:
         """Validate shell command."""
         if "command" not in kwargs:
@@ -132,9 +198,9 @@ class ShellPlugin(ArbiterPlugin):
             return False, "Command cannot be empty"
         
         # Check blacklist
-        for blocked in self.BLACKLIST:
-            if blocked in command:
-                return False, f"Dangerous command pattern detected: {blocked}"
+        match = self._BLACKLIST_RE.search(command)
+        if match:
+            return False, f"Dangerous command pattern detected: {match.group()}"
         
         # Check whitelist (optional, can be disabled)
         # For now, we rely on Docker isolation
@@ -142,29 +208,17 @@ class ShellPlugin(ArbiterPlugin):
         return True, ""
     
     def describe(self):
-        return {
-            "name": "shell",
-            "description": "Execute shell commands in isolated Docker containers with resource limits",
-            "parameters": {
-                "command": "Shell command to execute (string)",
-                "timeout": "Execution timeout in seconds (optional, default: 30)",
-                "enable_network": "Enable network access (optional, default: False)"
-            },
-            "examples": [
-                "Run 'python script.py'",
-                "Execute 'npm install'",
-                "Run 'git clone repo_url'",
-                "Execute 'pytest tests/'",
-                "Run 'docker build -t image .'",
-                "List files with 'ls -la'"
-            ]
-        }
+        return _SHELL_DESCRIPTION
     
     def cleanup(self):
         """Cleanup Docker sandbox."""
         if self.sandbox:
-            # Docker containers are ephemeral, no cleanup needed
-            pass
+            # Remove the pooled containers and close the aiodocker client
+            self.sandbox.close()
+
+
+# Entry point looked up by PluginManager.load_plugin
+PLUGIN_CLASS = ShellPlugin
 
 
 # Test the plugin
@@ -5,16 +5,112 @@ Enterprise-grade container isolation for code execution.
 
 import docker
 from docker.errors import DockerException, ContainerError, ImageNotFound
+from docker.utils.socket import consume_socket_output, demux_adaptor, frames_iter
+import asyncio
+import atexit
+import functools
+import socket
+import threading
 import time
 import os
-from typing import Dict, Any, Optional
+import uuid
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import logging
 
-logging.basicConfig(level=logging.INFO)
+# aiodocker is optional; without it only the blocking DockerSandbox is available
+try:
+    import aiodocker
+    AIODOCKER_AVAILABLE = True
+except ImportError:
+    AIODOCKER_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _process_start(pid: int) -> str:
+    """Start time of pid in clock ticks since boot ("" without /proc)."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            # Fields after the parenthesized command name; starttime is field 22
+            return f.read().rpartition(b")")[2].split()[19].decode()
+    except (OSError, IndexError):
+        return ""
+
+
+# Labels on pool containers. The owner is a random token per process, so
+# two processes never share one even when both are pid 1 on the same
+# hostname (containers). The process label ("host:pid:start time") lets a
+# later process tell whether the owner is still running and remove
+# containers left behind by one that died without cleaning up.
+POOL_LABEL = "arbiter.sandbox.pool"
+OWNER_LABEL = "arbiter.sandbox.owner"
+PROCESS_LABEL = "arbiter.sandbox.process"
+_OWNER = uuid.uuid4().hex
+_PROCESS = f"{socket.gethostname()}:{os.getpid()}:{_process_start(os.getpid())}"
+
+# Requested image -> image verified (or pulled) for it, shared by all sandboxes
+_RESOLVED_IMAGES: Dict[str, str] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _docker_client():
+    """Docker client shared by all sandboxes in the process (failures are not cached)."""
+    client = docker.from_env()
+    reap_stale_containers(client)
+    return client
+
+
+def reap_stale_containers(client) -> int:
+    """
+    Remove pool containers whose owning process on this host is gone.
+    
+    The owner counts as gone when its pid is not running, or is running
+    with another start time (a restarted container's new pid 1).
+    Containers from other hosts are left to their owners.
+    
+    Args:
+        client: Docker client
+        
+    Returns:
+        Number of containers removed
+    """
+    hostname = socket.gethostname()
+    removed = 0
+    try:
+        containers = client.containers.list(all=True, filters={"label": POOL_LABEL})
+    except Exception as e:
+        logger.warning("⚠️ Failed to list pool containers: %s", e)
+        return 0
+    
+    for container in containers:
+        labels = container.labels
+        if labels.get(OWNER_LABEL) == _OWNER:
+            continue
+        fields = labels.get(PROCESS_LABEL, "").rsplit(":", 2)
+        if len(fields) != 3 or fields[0] != hostname or not fields[1].isdigit():
+            continue
+        if _owner_alive(int(fields[1]), fields[2]):
+            continue
+        ContainerPool._remove(container)
+        removed += 1
+    
+    if removed:
+        logger.info("🧹 Removed %s stale pool container(s)", removed)
+    return removed
+
+
+def _owner_alive(pid: int, start: str) -> bool:
+    """Whether pid runs and (where /proc tells) is the process started at start."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by another user
+    return not start or _process_start(pid) in (start, "")
+
+
 class SandboxExecutionResult:
     """Result of sandbox execution."""
     
@@ -36,14 +132,140 @@ class SandboxExecutionResult:
         }
 
 
+class ContainerPool:
+    """
+    Long-lived sandbox containers reused across executions.
+    
+    Containers idle on "sleep infinity" and each command runs in one of
+    them with exec_run, so an execution costs one exec instead of a
+    container create/start/wait/remove. At most `size` containers exist;
+    callers beyond that wait until one is released. A container is
+    replaced after max_uses commands, or at once after a timeout or error,
+    so state left behind by earlier commands cannot pile up.
+    
+    Isolation is weaker than a fresh container per command: until its
+    container is replaced, a command sees files (outside /workspace) and
+    background processes left by earlier commands of the same sandbox.
+    Use max_uses=1 to get a fresh container for every command.
+    
+    Call close() when done with the pool; containers are also labelled so
+    that reap_stale_containers() removes them after a crash.
+    """
+    
+    def __init__(self, client, container_config: Dict[str, Any],
+                 size: int = 2, max_uses: int = 50):
+        """
+        Initialize the pool (containers are started on first use).
+        
+        Args:
+            client: Docker client
+            container_config: containers.run() arguments for a pool container
+            size: Maximum number of containers
+            max_uses: Commands run in a container before it is replaced
+        """
+        self.client = client
+        self.container_config = container_config
+        self.size = size
+        self.max_uses = max_uses
+        self._idle: List[Any] = []
+        self._uses: Dict[str, int] = {}
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        # Pool containers outlive a single call; don't leave them running
+        atexit.register(self.close)
+    
+    def acquire(self):
+        """Take an idle container, starting one if the pool has room, else wait."""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Container pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._cond.wait()
+        
+        try:
+            container = self.client.containers.run(**self.container_config)
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+        
+        logger.info("🐳 Started pool container %s", container.short_id)
+        return container
+    
+    def take_idle(self):
+        """Take an idle container without waiting, or None if there is none."""
+        with self._cond:
+            if self._closed or not self._idle:
+                return None
+            return self._idle.pop()
+    
+    def release(self, container, reuse: bool = True) -> None:
+        """
+        Return a container to the pool.
+        
+        Args:
+            container: Container from acquire()
+            reuse: False to remove it (after a timeout or error)
+        """
+        if not self.checkin(container, reuse):
+            self._remove(container)
+    
+    def checkin(self, container, reuse: bool = True) -> bool:
+        """
+        Put a container back in the idle list if it is still usable.
+        
+        Returns:
+            False if the caller must remove it with _remove()
+        """
+        with self._cond:
+            uses = self._uses.pop(container.id, 0) + 1
+            keep = reuse and uses < self.max_uses and not self._closed
+            if keep:
+                self._uses[container.id] = uses
+                self._idle.append(container)
+            else:
+                self._created -= 1
+            self._cond.notify()
+        return keep
+    
+    def close(self) -> None:
+        """Remove the idle containers; busy ones are removed when released."""
+        atexit.unregister(self.close)
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._cond.notify_all()
+        
+        for container in idle:
+            self._remove(container)
+    
+    @staticmethod
+    def _remove(container) -> None:
+        try:
+            container.remove(force=True)
+            logger.debug("🗑️ Container removed")
+        except Exception as e:
+            logger.warning("⚠️ Failed to remove container: %s", e)
+
+
 class DockerSandbox:
     """
     Docker-based sandbox for secure code execution.
     
     Features:
-    - Ephemeral containers (created and destroyed per execution)
+    - Pooled containers (reused across executions, recycled regularly;
+      see ContainerPool for what that means for isolation)
     - Resource limits (CPU, memory, disk)
     - Network isolation
+    - tmpfs scratch space
     - Non-root execution
     - Automatic cleanup
     """
@@ -51,12 +273,17 @@ class DockerSandbox:
     DEFAULT_IMAGE = "arbiter-sandbox:latest"
     FALLBACK_IMAGE = "python:3.11-slim"
     
+    # RAM-backed /tmp for scratch files (counted against the memory limit)
+    SCRATCH_TMPFS = {"/tmp": "rw,nosuid,nodev,size=64m,mode=1777"}
+    
     def __init__(self, 
                  workspace_path: str,
                  image: str = None,
                  cpu_limit: float = 1.0,
                  memory_limit: str = "512m",
-                 enable_network: bool = False):
+                 enable_network: bool = False,
+                 pool_size: int = 2,
+                 max_uses: int = 50):
         """
         Initialize Docker sandbox.
         
@@ -66,6 +293,8 @@ class DockerSandbox:
             cpu_limit: CPU cores limit (default: 1.0)
             memory_limit: Memory limit (default: 512m)
             enable_network: Enable network access (default: False)
+            pool_size: Containers kept for concurrent executions (default: 2)
+            max_uses: Executions per container before it is replaced (default: 50)
         """
         self.workspace_path = Path(workspace_path).resolve()
         self.workspace_path.mkdir(parents=True, exist_ok=True)
@@ -77,35 +306,73 @@ class DockerSandbox:
         
         # Initialize Docker client
         try:
-            self.client = docker.from_env()
-            logger.info(f"🐳 Docker client initialized")
+            self.client = _docker_client()
+            logger.info("🐳 Docker client initialized")
         except DockerException as e:
             raise Exception(f"Failed to connect to Docker: {str(e)}\n"
                           f"Ensure Docker is installed and running.")
         
         # Verify image exists or use fallback
         self._verify_image()
+        
+        self._pool = ContainerPool(
+            self.client,
+            {
+                "image": self.image,
+                "command": ["sleep", "infinity"],
+                "detach": True,
+                "remove": False,  # Removed by the pool
+                "volumes": {
+                    str(self.workspace_path): {
+                        'bind': '/workspace',
+                        'mode': 'rw'
+                    }
+                },
+                "tmpfs": self.SCRATCH_TMPFS,
+                "labels": {POOL_LABEL: "1", OWNER_LABEL: _OWNER, PROCESS_LABEL: _PROCESS},
+                # Resource limits
+                "cpu_quota": int(self.cpu_limit * 100000),
+                "cpu_period": 100000,
+                "mem_limit": self.memory_limit,
+                "memswap_limit": self.memory_limit,  # No swap
+                # Security
+                "network_mode": "bridge" if self.enable_network else "none",
+                "user": "1000:1000",  # Non-root user
+                "read_only": False,  # Need write access to /workspace
+                "security_opt": ["no-new-privileges"],
+            },
+            size=pool_size,
+            max_uses=max_uses
+        )
     
     def _verify_image(self):
         """Verify Docker image exists, use fallback if not."""
+        resolved = _RESOLVED_IMAGES.get(self.image)
+        if resolved is not None:
+            self.image = resolved
+            return
+        
+        requested = self.image
         try:
             self.client.images.get(self.image)
-            logger.info(f"✅ Using image: {self.image}")
+            logger.info("✅ Using image: %s", self.image)
         except ImageNotFound:
-            logger.warning(f"⚠️ Image {self.image} not found, using fallback: {self.FALLBACK_IMAGE}")
+            logger.warning("⚠️ Image %s not found, using fallback: %s", self.image, self.FALLBACK_IMAGE)
             self.image = self.FALLBACK_IMAGE
             try:
                 self.client.images.pull(self.FALLBACK_IMAGE)
-                logger.info(f"✅ Pulled fallback image: {self.FALLBACK_IMAGE}")
+                logger.info("✅ Pulled fallback image: %s", self.FALLBACK_IMAGE)
             except Exception as e:
                 raise Exception(f"Failed to pull fallback image: {str(e)}")
+        
+        _RESOLVED_IMAGES[requested] = self.image
     
     def execute(self, 
                 command: str,
                 timeout: int = 30,
                 working_dir: str = "/workspace") -> SandboxExecutionResult:
         """
-        Execute command in ephemeral Docker container.
+        Execute command in a pooled Docker container.
         
         Args:
             command: Command to execute
@@ -115,107 +382,159 @@ class DockerSandbox:
         Returns:
             SandboxExecutionResult with execution details
         """
+        return self._run(["sh", "-c", command], command, timeout, working_dir)
+    
+    def execute_stdin(self,
+                      argv: List[str],
+                      code: bytes,
+                      timeout: int = 30,
+                      working_dir: str = "/workspace") -> SandboxExecutionResult:
+        """
+        Run an interpreter in a pooled container with code fed on its stdin.
+        
+        Args:
+            argv: Command reading its program from stdin (["python", "-"])
+            code: Program source
+            timeout: Execution timeout in seconds
+            working_dir: Working directory inside container
+            
+        Returns:
+            SandboxExecutionResult with execution details
+        """
+        return self._run(argv, " ".join(argv), timeout, working_dir, stdin=code)
+    
+    def _exec(self, container, argv: List[str], working_dir: str,
+              stdin: Optional[bytes]) -> tuple:
+        """
+        Run argv in container.
+        
+        Returns:
+            (exit code, (stdout bytes or None, stderr bytes or None))
+        """
+        if stdin is None:
+            result = container.exec_run(argv, workdir=working_dir, user="1000:1000", demux=True)
+            return result.exit_code, result.output
+        
+        # exec_run cannot write stdin; drive the exec through the API socket
+        api = self.client.api
+        exec_id = api.exec_create(
+            container.id, argv, stdin=True, workdir=working_dir, user="1000:1000"
+        )["Id"]
+        sock = api.exec_start(exec_id, socket=True)
+        try:
+            raw = getattr(sock, "_sock", sock)
+            raw.sendall(stdin)
+            raw.shutdown(socket.SHUT_WR)  # EOF ends the program text
+            frames = (demux_adaptor(*frame) for frame in frames_iter(sock, False))
+            output = consume_socket_output(frames, demux=True)
+        finally:
+            sock.close()
+        return api.exec_inspect(exec_id)["ExitCode"], output
+    
+    @staticmethod
+    def _timeout_argv(argv: List[str], timeout: int) -> List[str]:
+        # exec has no timeout of its own; coreutils timeout sends
+        # TERM, then KILL a second later, and exits 124 (or 137). The
+        # command can exit 124 itself, see _timed_out.
+        return ["timeout", "-k", "1", str(timeout), *argv]
+    
+    def _run(self, argv: List[str], label: str, timeout: int, working_dir: str,
+             stdin: Optional[bytes] = None) -> SandboxExecutionResult:
+        """Execute argv in a pooled container and collect the result."""
         container = None
+        reuse = False
         start_time = time.time()
         
         try:
-            # Container configuration
-            container_config = {
-                "image": self.image,
-                "command": ["sh", "-c", command],
-                "working_dir": working_dir,
-                "detach": True,
-                "remove": False,  # We'll remove manually for better error handling
-                "volumes": {
-                    str(self.workspace_path): {
-                        'bind': '/workspace',
-                        'mode': 'rw'
-                    }
-                },
-                # Resource limits
-                "cpu_quota": int(self.cpu_limit * 100000),
-                "cpu_period": 100000,
-                "mem_limit": self.memory_limit,
-                "memswap_limit": self.memory_limit,  # No swap
-                # Security
-                "network_mode": "bridge" if self.enable_network else "none",
-                "user": "1000:1000",  # Non-root user
-                "read_only": False,  # Need write access to /workspace
-                "security_opt": ["no-new-privileges"],
-            }
-            
-            logger.info(f"🚀 Executing in container: {command[:50]}...")
-            
-            # Create and start container
-            container = self.client.containers.run(**container_config)
+            container = self._pool.acquire()
             
-            # Wait for completion with timeout
-            try:
-                result = container.wait(timeout=timeout)
-                exit_code = result.get('StatusCode', -1)
-            except Exception as e:
-                logger.error(f"⏱️ Container timeout or error: {str(e)}")
-                container.stop(timeout=1)
-                execution_time = time.time() - start_time
-                return SandboxExecutionResult(
-                    success=False,
-                    stdout="",
-                    stderr=f"Execution timeout after {timeout}s",
-                    exit_code=-1,
-                    execution_time=execution_time
-                )
-            
-            # Get logs
-            stdout = container.logs(stdout=True, stderr=False).decode('utf-8', errors='replace')
-            stderr = container.logs(stdout=False, stderr=True).decode('utf-8', errors='replace')
+            logger.info("🚀 Executing in container: %s...", label[:50])
             
-            execution_time = time.time() - start_time
-            
-            success = exit_code == 0
-            
-            if success:
-                logger.info(f"✅ Execution successful ({execution_time:.2f}s)")
-            else:
-                logger.warning(f"❌ Execution failed with exit code {exit_code}")
-            
-            return SandboxExecutionResult(
-                success=success,
-                stdout=stdout,
-                stderr=stderr,
-                exit_code=exit_code,
-                execution_time=execution_time
+            exec_start = time.time()
+            exit_code, output = self._exec(
+                container,
+                self._timeout_argv(argv, timeout),
+                working_dir,
+                stdin
+            )
+            result = self._result(
+                exit_code, output, time.time() - start_time, timeout,
+                self._timed_out(exit_code, time.time() - exec_start, timeout)
             )
+            reuse = result.exit_code != -1
+            return result
+            
+        except Exception as e:
+            return self._error_result(e, time.time() - start_time)
             
-        except ContainerError as e:
-            execution_time = time.time() - start_time
-            logger.error(f"❌ Container error: {str(e)}")
+        finally:
+            # Back to the pool; a timed-out or failed container is replaced
+            if container:
+                self._pool.release(container, reuse)
+    
+    @staticmethod
+    def _timed_out(exit_code: int, exec_time: float, timeout: int) -> bool:
+        """Whether the timeout wrapper stopped the command (not a command exiting 124)."""
+        return exit_code in (124, 137) and exec_time >= timeout
+    
+    @staticmethod
+    def _result(exit_code: int, output: tuple, execution_time: float,
+                timeout: int, timed_out: bool) -> SandboxExecutionResult:
+        """Build the result of a finished exec (exit_code -1 on timeout)."""
+        if timed_out:
+            logger.error("⏱️ Container timeout after %ss", timeout)
             return SandboxExecutionResult(
                 success=False,
                 stdout="",
-                stderr=f"Container error: {str(e)}",
-                exit_code=e.exit_status,
+                stderr=f"Execution timeout after {timeout}s",
+                exit_code=-1,
                 execution_time=execution_time
             )
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"❌ Unexpected error: {str(e)}")
+        
+        stdout_bytes, stderr_bytes = output
+        stdout = (stdout_bytes or b"").decode('utf-8', errors='replace')
+        stderr = (stderr_bytes or b"").decode('utf-8', errors='replace')
+        
+        success = exit_code == 0
+        
+        if success:
+            logger.info("✅ Execution successful (%.2fs)", execution_time)
+        else:
+            logger.warning("❌ Execution failed with exit code %s", exit_code)
+        
+        return SandboxExecutionResult(
+            success=success,
+            stdout=stdout,
+            stderr=stderr,
+            exit_code=exit_code,
+            execution_time=execution_time
+        )
+    
+    @staticmethod
+    def _error_result(e: Exception, execution_time: float) -> SandboxExecutionResult:
+        """Build the result of an exec that raised."""
+        if isinstance(e, ContainerError):
+            logger.error("❌ Container error: %s", e)
             return SandboxExecutionResult(
                 success=False,
                 stdout="",
-                stderr=f"Sandbox error: {str(e)}",
-                exit_code=-1,
+                stderr=f"Container error: {str(e)}",
+                exit_code=e.exit_status,
                 execution_time=execution_time
             )
-            
-        finally:
-            # Cleanup container
-            if container:
-                try:
-                    container.remove(force=True)
-                    logger.debug("🗑️ Container removed")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to remove container: {str(e)}")
+        
+        logger.error("❌ Unexpected error: %s", e)
+        return SandboxExecutionResult(
+            success=False,
+            stdout="",
+            stderr=f"Sandbox error: {str(e)}",
+            exit_code=-1,
+            execution_time=execution_time
+        )
+    
+    def close(self) -> None:
+        """Remove the pooled containers."""
+        self._pool.close()
     
     def execute_python(self, code: str, timeout: int = 30) -> SandboxExecutionResult:
         """
@@ -228,17 +547,8 @@ class DockerSandbox:
         Returns:
             SandboxExecutionResult
         """
-        # Write code to temp file
-        temp_file = self.workspace_path / "_temp_script.py"
-        temp_file.write_text(code)
-        
-        try:
-            result = self.execute(f"python /workspace/_temp_script.py", timeout)
-            return result
-        finally:
-            # Cleanup temp file
-            if temp_file.exists():
-                temp_file.unlink()
+        # Piped on stdin, so no script file is written to the workspace
+        return self.execute_stdin(["python", "-"], code.encode("utf-8"), timeout)
     
     def execute_node(self, code: str, timeout: int = 30) -> SandboxExecutionResult:
         """
@@ -251,17 +561,8 @@ class DockerSandbox:
         Returns:
             SandboxExecutionResult
         """
-        # Write code to temp file
-        temp_file = self.workspace_path / "_temp_script.js"
-        temp_file.write_text(code)
-        
-        try:
-            result = self.execute(f"node /workspace/_temp_script.js", timeout)
-            return result
-        finally:
-            # Cleanup temp file
-            if temp_file.exists():
-                temp_file.unlink()
+        # Piped on stdin, so no script file is written to the workspace
+        return self.execute_stdin(["node", "-"], code.encode("utf-8"), timeout)
     
     def health_check(self) -> bool:
         """
@@ -277,8 +578,187 @@ class DockerSandbox:
             return False
 
 
+class AsyncDockerSandbox(DockerSandbox):
+    """
+    DockerSandbox with coroutine versions of the execute methods.
+    
+    Execs go through aiodocker, so waiting for a command is an open HTTP
+    stream on the event loop instead of a blocked thread, and one loop can
+    gather many executions. Container start/removal (rare with the pool)
+    and execs that need stdin (aexecute_stdin/python/node, since the
+    aiodocker exec stream cannot half-close stdin through its public API)
+    still use the blocking client on a worker thread.
+    
+    The aiodocker client is bound to the event loop that first ran a
+    coroutine, so the coroutines must all run on that loop. The blocking
+    methods can still be used from other threads; close() closes the
+    aiodocker client on its loop.
+    """
+    
+    def __init__(self, workspace_path: str, **kwargs):
+        """
+        Initialize the sandbox.
+        
+        Args:
+            workspace_path: Path to workspace directory
+            **kwargs: DockerSandbox options
+        """
+        if not AIODOCKER_AVAILABLE:
+            raise Exception("aiodocker is required for AsyncDockerSandbox. "
+                          "Install with: pip install aiodocker")
+        super().__init__(workspace_path, **kwargs)
+        self._aclient = None
+        self._aloop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Optional[asyncio.Task] = None
+        # One slot per pool container, so acquiring never blocks the loop
+        self._slots = asyncio.Semaphore(self._pool.size)
+    
+    async def aexecute(self,
+                       command: str,
+                       timeout: int = 30,
+                       working_dir: str = "/workspace") -> SandboxExecutionResult:
+        """
+        Execute command in a pooled Docker container.
+        
+        Args:
+            command: Command to execute
+            timeout: Execution timeout in seconds
+            working_dir: Working directory inside container
+            
+        Returns:
+            SandboxExecutionResult with execution details
+        """
+        return await self._arun(["sh", "-c", command], command, timeout, working_dir)
+    
+    async def aexecute_stdin(self,
+                             argv: List[str],
+                             code: bytes,
+                             timeout: int = 30,
+                             working_dir: str = "/workspace") -> SandboxExecutionResult:
+        """
+        Run an interpreter in a pooled container with code fed on its stdin.
+        
+        Args:
+            argv: Command reading its program from stdin (["python", "-"])
+            code: Program source
+            timeout: Execution timeout in seconds
+            working_dir: Working directory inside container
+            
+        Returns:
+            SandboxExecutionResult with execution details
+        """
+        return await self._arun(argv, " ".join(argv), timeout, working_dir, stdin=code)
+    
+    async def aexecute_python(self, code: str, timeout: int = 30) -> SandboxExecutionResult:
+        """Execute Python code in sandbox."""
+        return await self.aexecute_stdin(["python", "-"], code.encode("utf-8"), timeout)
+    
+    async def aexecute_node(self, code: str, timeout: int = 30) -> SandboxExecutionResult:
+        """Execute Node.js code in sandbox."""
+        return await self.aexecute_stdin(["node", "-"], code.encode("utf-8"), timeout)
+    
+    async def _aexec(self, container, argv: List[str], working_dir: str,
+                     stdin: Optional[bytes]) -> tuple:
+        """
+        Run argv in container through aiodocker.
+        
+        Returns:
+            (exit code, (stdout bytes, stderr bytes))
+        """
+        if stdin is not None:
+            # The program text must end with EOF while the output is still
+            # read; only the blocking client's socket can half-close
+            return await asyncio.to_thread(self._exec, container, argv, working_dir, stdin)
+        
+        if self._aclient is None:
+            self._aclient = aiodocker.Docker()
+            self._aloop = asyncio.get_running_loop()
+        
+        execution = await self._aclient.containers.container(container.id).exec(
+            argv, workdir=working_dir, user="1000:1000"
+        )
+        stdout, stderr = bytearray(), bytearray()
+        async with execution.start(detach=False) as stream:
+            while True:
+                message = await stream.read_out()
+                if message is None:
+                    break
+                (stdout if message.stream == 1 else stderr).extend(message.data)
+        
+        exit_code = (await execution.inspect())["ExitCode"]
+        return exit_code, (bytes(stdout), bytes(stderr))
+    
+    async def _arun(self, argv: List[str], label: str, timeout: int, working_dir: str,
+                    stdin: Optional[bytes] = None) -> SandboxExecutionResult:
+        """Async version of _run."""
+        async with self._slots:
+            container = None
+            reuse = False
+            start_time = time.time()
+            
+            try:
+                container = self._pool.take_idle()
+                if container is None:
+                    # Starts a container, or waits for one held by a
+                    # blocking execute() call, off the loop either way
+                    container = await asyncio.to_thread(self._pool.acquire)
+                
+                logger.info("🚀 Executing in container: %s...", label[:50])
+                
+                exec_start = time.time()
+                exit_code, output = await self._aexec(
+                    container,
+                    self._timeout_argv(argv, timeout),
+                    working_dir,
+                    stdin
+                )
+                result = self._result(
+                    exit_code, output, time.time() - start_time, timeout,
+                    self._timed_out(exit_code, time.time() - exec_start, timeout)
+                )
+                reuse = result.exit_code != -1
+                return result
+                
+            except Exception as e:
+                return self._error_result(e, time.time() - start_time)
+                
+            finally:
+                if container and not self._pool.checkin(container, reuse):
+                    await asyncio.to_thread(self._pool._remove, container)
+    
+    async def aclose(self) -> None:
+        """Close the aiodocker client and remove the pooled containers."""
+        client, self._aclient = self._aclient, None
+        if client is not None:
+            await client.close()
+        await asyncio.to_thread(self.close)
+    
+    def close(self) -> None:
+        """Close the aiodocker client (on its event loop) and remove the pooled containers."""
+        client, self._aclient = self._aclient, None
+        loop = self._aloop
+        if client is not None and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            
+            if running is loop:
+                # Called from a coroutine on the client's loop: can't block it
+                self._closing = loop.create_task(client.close())
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.close(), loop).result(timeout=5)
+            else:
+                loop.run_until_complete(client.close())
+        
+        super().close()
+
+
 # Example usage
 if __name__ == "__main__":
+    from logging_config import configure_logging
+    configure_logging()
+    
     # Create sandbox
     sandbox = DockerSandbox(workspace_path="/tmp/sandbox_test")
     
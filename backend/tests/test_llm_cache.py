@@ -0,0 +1,49 @@
+"""
+Tests for the LLM response caches.
+
+Run from backend/: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_cache import GenerativeCache
+
+
+class GenerativeCacheTest(unittest.TestCase):
+
+    TEMPLATE = b"plan-template"
+    EMBEDDING = [1.0, 0.0]
+
+    def setUp(self):
+        self.cache = GenerativeCache(threshold=0.5)
+
+    def test_adapts_whole_tokens_only(self):
+        self.cache.store(self.TEMPLATE, "create a flask app", self.EMBEDDING,
+                         "1. Install flask\n2. Write app.py for the flask app\n3. Read the flaskr tutorial")
+        adapted = self.cache.lookup(self.TEMPLATE, "create a fastapi app", self.EMBEDDING)
+        self.assertEqual(
+            adapted,
+            "1. Install fastapi\n2. Write app.py for the fastapi app\n3. Read the flaskr tutorial"
+        )
+
+    def test_refuses_stopword_substitution(self):
+        response = "1. Create the test file\n2. Start pytest and wait"
+        self.cache.store(self.TEMPLATE, "Run a test", self.EMBEDDING, response)
+        self.assertIsNone(self.cache.lookup(self.TEMPLATE, "Run the test", self.EMBEDDING))
+
+    def test_refuses_short_token_substitution(self):
+        self.cache.store(self.TEMPLATE, "write to db", self.EMBEDDING, '{"tool": "write_file"}')
+        self.assertIsNone(self.cache.lookup(self.TEMPLATE, "write to fs", self.EMBEDDING))
+
+    def test_substitutions_are_not_chained(self):
+        self.cache.store(self.TEMPLATE, "copy alpha to beta", self.EMBEDDING, "alpha then beta")
+        adapted = self.cache.lookup(self.TEMPLATE, "copy beta to gamma", self.EMBEDDING)
+        self.assertEqual(adapted, "beta then gamma")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,21 +5,33 @@ Provides safe execution of shell commands, file operations, and web requests.
 Each tool includes error handling, sanitization, and result capture.
 """
 
+import asyncio
 import subprocess
 import os
 import json
-import requests
-from typing import Dict, Any, List, Optional
+import re
+import httpx
+import selectors
+import time
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 import shlex
 
 # Try to import DockerSandbox, fallback if not available
 try:
-    from sandbox_manager import DockerSandbox
+    from sandbox_manager import AIODOCKER_AVAILABLE, AsyncDockerSandbox, DockerSandbox
     DOCKER_AVAILABLE = True
 except ImportError:
     DOCKER_AVAILABLE = False
-    DockerSandbox = None
+    AIODOCKER_AVAILABLE = False
+    DockerSandbox = AsyncDockerSandbox = None
+
+# HTTP/2 needs the h2 package (httpx[http2]); without it httpx speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Try to import PluginManager, fallback if not available
 try:
@@ -66,12 +78,18 @@ class ShellExecutor:
     ]
     
     # Commands that are allowed (whitelist mode - more secure)
-    WHITELIST = [
+    WHITELIST = frozenset([
         'npm', 'node', 'python', 'python3', 'pip', 'pip3',
         'git', 'ls', 'cat', 'echo', 'mkdir', 'touch',
-        'curl', 'wget', 'grep', 'find', 'cd', 'pwd',
+        'curl', 'wget', 'grep', 'find', 'pwd',
         'docker', 'docker-compose'
-    ]
+    ])
+    
+    # All blacklist patterns as one alternation, scanned in a single pass
+    _BLACKLIST_RE = re.compile("|".join(map(re.escape, BLACKLIST)))
+    
+    # Bytes kept per stream of a direct command; the rest is read and dropped
+    MAX_OUTPUT_BYTES = 1024 * 1024
     
     def __init__(self, workspace: str = "/tmp/arbiter_workspace", 
                  use_whitelist: bool = True,
@@ -97,48 +115,81 @@ class ShellExecutor:
         
         if self.use_docker:
             try:
-                self.docker_sandbox = DockerSandbox(str(workspace))
+                # The async sandbox also serves aexecute without a thread per command
+                sandbox_class = AsyncDockerSandbox if AIODOCKER_AVAILABLE else DockerSandbox
+                self.docker_sandbox = sandbox_class(str(workspace))
                 print(f"🐳 Docker sandbox enabled for shell execution")
             except Exception as e:
                 print(f"⚠️ Docker sandbox failed to initialize: {e}")
                 print(f"   Falling back to direct execution")
                 self.use_docker = False
     
-    def _is_safe_command(self, command: str) -> tuple[bool, str]:
+    def close(self) -> None:
+        """Remove the Docker sandbox's pooled containers."""
+        if self.docker_sandbox:
+            self.docker_sandbox.close()
+    
+    def _is_safe_command(self, command: str,
+                         shell: bool = False) -> tuple[bool, str, List[str]]:
         """
         Check if command is safe to execute.
         
+        Args:
+            command: Command line
+            shell: The command will run through a shell (or the Docker sandbox)
+        
         Returns:
-            (is_safe, reason)
+            (is_safe, reason, argv) with the command split once by shlex
         """
         # Check blacklist
-        for blocked in self.BLACKLIST:
-            if blocked in command:
-                return False, f"Command contains blocked pattern: {blocked}"
+        match = self._BLACKLIST_RE.search(command)
+        if match:
+            return False, f"Command contains blocked pattern: {match.group()}", []
+        
+        try:
+            cmd_parts = shlex.split(command)
+        except ValueError as e:
+            return False, f"Cannot parse command: {e}", []
+        if not cmd_parts:
+            return False, "Empty command", []
+        
+        # cd is a shell builtin: there is no program to exec without a shell
+        if cmd_parts[0] == "cd":
+            if not shell:
+                return False, ("'cd' is a shell builtin and needs shell=True "
+                               "(commands already start in the workspace)"), []
+            return True, "OK", cmd_parts
         
         # Check whitelist if enabled
         if self.use_whitelist:
-            cmd_parts = shlex.split(command)
-            if cmd_parts:
-                base_cmd = cmd_parts[0]
-                if base_cmd not in self.WHITELIST:
-                    return False, f"Command '{base_cmd}' not in whitelist"
+            base_cmd = cmd_parts[0]
+            if base_cmd not in self.WHITELIST:
+                return False, f"Command '{base_cmd}' not in whitelist", []
         
-        return True, "OK"
+        return True, "OK", cmd_parts
     
-    def execute(self, command: str, timeout: int = 30) -> ToolExecutionResult:
+    def execute(self, command: str, timeout: int = 30,
+                shell: bool = False) -> ToolExecutionResult:
         """
         Execute a shell command.
         
+        Without shell the command is split with shlex and run directly, so
+        the whitelisted program is the one that runs: ";", "&&", pipes and
+        redirections are passed to it as plain arguments.
+        
         Args:
             command: Shell command to execute
             timeout: Maximum execution time in seconds
+            shell: Run through /bin/sh for pipes, redirects and chaining
+                   (opt-in; only the first word is checked against the whitelist)
             
         Returns:
             ToolExecutionResult with command output
         """
         # Safety check
-        is_safe, reason = self._is_safe_command(command)
+        is_safe, reason, argv = self._is_safe_command(
+            command, shell or bool(self.use_docker and self.docker_sandbox)
+        )
         if not is_safe:
             return ToolExecutionResult(
                 success=False,
@@ -149,44 +200,82 @@ class ShellExecutor:
         # Use Docker sandbox if available
         if self.use_docker and self.docker_sandbox:
             try:
-                result = self.docker_sandbox.execute(command, timeout)
-                return ToolExecutionResult(
-                    success=result.success,
-                    output=result.stdout,
-                    error=result.stderr,
-                    data={
-                        "exit_code": result.exit_code,
-                        "execution_time": result.execution_time,
-                        "sandbox": "docker"
-                    }
-                )
+                return self._sandbox_result(self.docker_sandbox.execute(command, timeout))
             except Exception as e:
                 # Fallback to direct execution on Docker error
                 print(f"⚠️ Docker execution failed: {e}, falling back to direct")
         
         # Direct execution (fallback or default)
+        return self._execute_direct(command, argv, timeout, shell)
+    
+    async def aexecute(self, command: str, timeout: int = 30,
+                       shell: bool = False) -> ToolExecutionResult:
+        """
+        Execute a shell command without blocking the event loop.
+        
+        With the aiodocker sandbox the exec is awaited on the loop; direct
+        execution and the blocking sandbox run execute on a worker thread.
+        
+        Args:
+            command: Shell command to execute
+            timeout: Maximum execution time in seconds
+            shell: Run through /bin/sh (see execute)
+            
+        Returns:
+            ToolExecutionResult with command output
+        """
+        if not (self.use_docker and isinstance(self.docker_sandbox, AsyncDockerSandbox)):
+            return await asyncio.to_thread(self.execute, command, timeout, shell)
+        
+        is_safe, reason, argv = self._is_safe_command(command, True)
+        if not is_safe:
+            return ToolExecutionResult(
+                success=False,
+                output="",
+                error=f"🚫 Command blocked: {reason}"
+            )
+        
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=self.workspace,
-                capture_output=True,
-                text=True,
-                timeout=timeout
+            return self._sandbox_result(await self.docker_sandbox.aexecute(command, timeout))
+        except Exception as e:
+            # Fallback to direct execution on Docker error
+            print(f"⚠️ Docker execution failed: {e}, falling back to direct")
+        return await asyncio.to_thread(self._execute_direct, command, argv, timeout, shell)
+    
+    @staticmethod
+    def _sandbox_result(result) -> ToolExecutionResult:
+        """Wrap a SandboxExecutionResult."""
+        return ToolExecutionResult(
+            success=result.success,
+            output=result.stdout,
+            error=result.stderr,
+            data={
+                "exit_code": result.exit_code,
+                "execution_time": result.execution_time,
+                "sandbox": "docker"
+            }
+        )
+    
+    def _execute_direct(self, command: str, argv: List[str], timeout: int,
+                        shell: bool) -> ToolExecutionResult:
+        """Run an already checked command on the host (see execute)."""
+        try:
+            returncode, stdout, stderr = self._run_capped(
+                command if shell else argv, shell, timeout
             )
             
-            if result.returncode == 0:
+            if returncode == 0:
                 return ToolExecutionResult(
                     success=True,
-                    output=result.stdout,
-                    data={"exit_code": result.returncode, "sandbox": "direct"}
+                    output=stdout,
+                    data={"exit_code": returncode, "sandbox": "direct"}
                 )
             else:
                 return ToolExecutionResult(
                     success=False,
-                    output=result.stdout,
-                    error=result.stderr,
-                    data={"exit_code": result.returncode, "sandbox": "direct"}
+                    output=stdout,
+                    error=stderr,
+                    data={"exit_code": returncode, "sandbox": "direct"}
                 )
                 
         except subprocess.TimeoutExpired:
@@ -201,6 +290,77 @@ class ShellExecutor:
                 output="",
                 error=f"❌ Execution error: {str(e)}"
             )
+    
+    def _run_capped(self, args: Union[str, List[str]], shell: bool,
+                    timeout: float) -> Tuple[int, str, str]:
+        """
+        Run a command, keeping at most MAX_OUTPUT_BYTES of each stream.
+        
+        Both pipes are drained by one selector loop until EOF, so a chatty
+        command never blocks on a full pipe, while memory stays bounded
+        however much it prints. Output is decoded once at the end.
+        
+        Args:
+            args: argv list, or the command string when shell is set
+            shell: Run through /bin/sh
+            timeout: Seconds before the command is killed
+            
+        Returns:
+            (returncode, stdout, stderr)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the command ran past timeout
+        """
+        limit = self.MAX_OUTPUT_BYTES
+        process = subprocess.Popen(
+            args,
+            shell=shell,
+            cwd=self.workspace,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        out_fd = process.stdout.fileno()
+        err_fd = process.stderr.fileno()
+        buffers = {out_fd: bytearray(), err_fd: bytearray()}
+        dropped = dict.fromkeys(buffers, 0)
+        deadline = time.monotonic() + timeout
+        
+        with selectors.DefaultSelector() as selector:
+            try:
+                for pipe in (process.stdout, process.stderr):
+                    selector.register(pipe, selectors.EVENT_READ)
+                
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(args, timeout)
+                    for key, _ in selector.select(remaining):
+                        chunk = os.read(key.fd, 65536)
+                        if not chunk:
+                            selector.unregister(key.fileobj)
+                            continue
+                        buffer = buffers[key.fd]
+                        room = limit - len(buffer)
+                        if room > 0:
+                            buffer += chunk[:room]
+                        dropped[key.fd] += max(0, len(chunk) - max(room, 0))
+                
+                returncode = process.wait(timeout=max(0, deadline - time.monotonic()))
+            except BaseException:
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                process.stdout.close()
+                process.stderr.close()
+        
+        def text(fd: int) -> str:
+            decoded = buffers[fd].decode("utf-8", errors="replace")
+            if dropped[fd]:
+                decoded += f"\n... (truncated, {dropped[fd]} more bytes)"
+            return decoded
+        
+        return returncode, text(out_fd), text(err_fd)
 
 
 class FileManager:
@@ -227,8 +387,8 @@ class FileManager:
         """
         try:
             full_path = (self.workspace / filepath).resolve()
-            # Ensure path is within workspace
-            if self.workspace in full_path.parents or full_path == self.workspace:
+            # Ensure path is within workspace (a prefix check, no parents walk)
+            if full_path.is_relative_to(self.workspace):
                 return full_path
             return None
         except Exception:
@@ -322,8 +482,15 @@ class FileManager:
                 error=f"❌ Delete error: {str(e)}"
             )
     
-    def list_files(self, directory: str = ".") -> ToolExecutionResult:
-        """List files in directory."""
+    def list_files(self, directory: str = ".", include_size: bool = True) -> ToolExecutionResult:
+        """
+        List files in directory.
+        
+        Args:
+            directory: Directory relative to the workspace
+            include_size: Stat regular files for their size; without it the
+                          listing is a single directory read
+        """
         path = self._resolve_path(directory)
         if not path:
             return ToolExecutionResult(
@@ -340,13 +507,16 @@ class FileManager:
                     error=f"📁 Not a directory: {directory}"
                 )
             
+            # scandir entries carry the file type from the directory read,
+            # so only regular files need a stat (for their size)
             files = []
-            for item in path.iterdir():
-                files.append({
-                    "name": item.name,
-                    "type": "dir" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else 0
-                })
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    is_dir = entry.is_dir()
+                    info = {"name": entry.name, "type": "dir" if is_dir else "file"}
+                    if include_size:
+                        info["size"] = entry.stat().st_size if not is_dir and entry.is_file() else 0
+                    files.append(info)
             
             output = "\n".join([f"{'📁' if f['type'] == 'dir' else '📄'} {f['name']}" for f in files])
             
@@ -366,16 +536,39 @@ class FileManager:
 class WebFetcher:
     """
     Fetches content from web URLs.
+    
+    One httpx client keeps connections and TLS sessions alive across
+    fetches, multiplexed over HTTP/2 when h2 is installed; coroutines
+    share a second, async client the same way.
     """
     
+    HEADERS = {'User-Agent': 'ArbiterAI/2.0'}
+    
+    # Keep-alive pool shared by all fetches of a client
+    POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=128)
+    
+    # Bytes read from a body unless the caller asks for all of it
+    HEAD_BYTES = 64 * 1024
+    
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ArbiterAI/2.0'
-        })
+        self.client = httpx.Client(**self._client_options())
+        # Long-lived async client for afetch/fetch_many, bound to _aloop
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._aloop: Optional[asyncio.AbstractEventLoop] = None
     
-    def fetch(self, url: str, method: str = "GET", data: Optional[Dict] = None) -> ToolExecutionResult:
+    def _client_options(self) -> Dict[str, Any]:
+        """Settings shared by the sync and async clients."""
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "timeout": self.timeout,
+            "headers": self.HEADERS,
+            "limits": self.POOL_LIMITS,
+            "follow_redirects": True
+        }
+    
+    def fetch(self, url: str, method: str = "GET", data: Optional[Dict] = None,
+              full: bool = False) -> ToolExecutionResult:
         """
         Fetch content from URL.
         
@@ -383,45 +576,154 @@ class WebFetcher:
             url: URL to fetch
             method: HTTP method (GET, POST, etc.)
             data: Optional data for POST requests
+            full: Read the whole body into data["full_content"] instead of
+                  only the first HEAD_BYTES
         """
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                timeout=self.timeout
-            )
+            with self.client.stream(method=method, url=url, json=data) as response:
+                body = b""
+                if response.status_code < 400:
+                    body = response.read() if full else self._read_head(response.iter_bytes())
+                return self._response_result(response, body, full)
+        except Exception as e:
+            return self._error_result(e)
+    
+    def iter_content(self, url: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Stream a large body without holding it in memory.
+        
+        Args:
+            url: URL to fetch
+            chunk_size: Size of the yielded chunks in bytes
             
-            if response.status_code < 400:
-                return ToolExecutionResult(
-                    success=True,
-                    output=response.text[:1000],  # Limit output
-                    data={
-                        "status_code": response.status_code,
-                        "headers": dict(response.headers),
-                        "full_content": response.text
-                    }
-                )
+        Yields:
+            Body chunks
+            
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        with self.client.stream("GET", url) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes(chunk_size)
+    
+    async def afetch(self, url: str, method: str = "GET", data: Optional[Dict] = None,
+                     full: bool = False) -> ToolExecutionResult:
+        """
+        Async version of fetch, on the shared async client.
+        
+        Args:
+            url: URL to fetch
+            method: HTTP method (GET, POST, etc.)
+            data: Optional data for POST requests
+            full: Read the whole body into data["full_content"]
+        """
+        try:
+            async with self._async_client().stream(method=method, url=url, json=data) as response:
+                body = b""
+                if response.status_code < 400:
+                    if full:
+                        body = await response.aread()
+                    else:
+                        body = await self._aread_head(response.aiter_bytes())
+                return self._response_result(response, body, full)
+        except Exception as e:
+            return self._error_result(e)
+    
+    async def fetch_many(self, urls: List[str]) -> List[ToolExecutionResult]:
+        """
+        GET several URLs concurrently over the shared async client.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            ToolExecutionResult per URL, in the same order
+        """
+        return await asyncio.gather(*(self.afetch(url) for url in urls))
+    
+    def _async_client(self) -> httpx.AsyncClient:
+        """
+        The async client, created on first use.
+        
+        An AsyncClient belongs to the event loop it first ran on, so a
+        call from another loop (a new asyncio.run) gets a new client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aloop is not loop:
+            self._aclient = httpx.AsyncClient(**self._client_options())
+            self._aloop = loop
+        return self._aclient
+    
+    def _read_head(self, chunks: Iterator[bytes]) -> bytes:
+        """Read up to HEAD_BYTES from a body stream and drop the rest."""
+        head = bytearray()
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= self.HEAD_BYTES:
+                break
+        return bytes(head[:self.HEAD_BYTES])
+    
+    async def _aread_head(self, chunks: AsyncIterator[bytes]) -> bytes:
+        """Async version of _read_head."""
+        head = bytearray()
+        async for chunk in chunks:
+            head += chunk
+            if len(head) >= self.HEAD_BYTES:
+                break
+        return bytes(head[:self.HEAD_BYTES])
+    
+    def _response_result(self, response: httpx.Response, body: bytes,
+                         full: bool) -> ToolExecutionResult:
+        """Turn a response and the part of its body that was read into a tool result."""
+        if response.status_code < 400:
+            encoding = response.encoding or "utf-8"
+            result_data = {
+                "status_code": response.status_code,
+                "headers": dict(response.headers)
+            }
+            if full:
+                text = body.decode(encoding, "replace")
+                result_data["full_content"] = text
+                output = text[:1000]  # Limit output
             else:
-                return ToolExecutionResult(
-                    success=False,
-                    output="",
-                    error=f"🌐 HTTP {response.status_code}: {response.reason}",
-                    data={"status_code": response.status_code}
-                )
-                
-        except requests.exceptions.Timeout:
+                # Only decode what is shown; a cut multi-byte char is replaced
+                output = body[:4000].decode(encoding, "replace")[:1000]
+            return ToolExecutionResult(
+                success=True,
+                output=output,
+                data=result_data
+            )
+        else:
             return ToolExecutionResult(
                 success=False,
                 output="",
-                error=f"⏱️ Request timed out after {self.timeout} seconds"
+                error=f"🌐 HTTP {response.status_code}: {response.reason_phrase}",
+                data={"status_code": response.status_code}
             )
-        except Exception as e:
+    
+    def _error_result(self, e: Exception) -> ToolExecutionResult:
+        """Turn a request exception into a tool result."""
+        if isinstance(e, httpx.TimeoutException):
             return ToolExecutionResult(
                 success=False,
                 output="",
-                error=f"❌ Request error: {str(e)}"
+                error=f"⏱️ Request timed out after {self.timeout} seconds"
             )
+        return ToolExecutionResult(
+            success=False,
+            output="",
+            error=f"❌ Request error: {str(e)}"
+        )
+    
+    async def aclose(self) -> None:
+        """Close the async client's connections (on its event loop)."""
+        client, self._aclient = self._aclient, None
+        if client is not None:
+            await client.aclose()
+    
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.client.close()
 
 
 class Toolbox:
@@ -429,6 +731,12 @@ class Toolbox:
     Main toolbox that combines all tools and plugins.
     """
     
+    # Names handled by execute_tool's tool_map (they shadow plugins)
+    CORE_TOOLS = frozenset([
+        "shell", "read_file", "write_file", "delete_file", "list_files",
+        "web_fetch"
+    ])
+    
     def __init__(self, workspace: str = "/tmp/arbiter_workspace", use_docker: bool = None, enable_plugins: bool = True):
         self.workspace = workspace
         self.shell = ShellExecutor(workspace, use_docker=use_docker)
@@ -440,12 +748,25 @@ class Toolbox:
         if enable_plugins and PLUGINS_AVAILABLE:
             try:
                 self.plugin_manager = PluginManager(workspace)
-                loaded = self.plugin_manager.load_all_plugins()
-                print(f"🔌 Loaded {loaded} plugin(s)")
+                # Plugins are imported on first use
+                loaded = self.plugin_manager.load_all_plugins(lazy=True)
+                print(f"🔌 Registered {loaded} plugin(s)")
             except Exception as e:
                 print(f"⚠️ Plugin manager failed to initialize: {e}")
                 self.plugin_manager = None
     
+    def close(self) -> None:
+        """Release sandbox containers, HTTP connections and plugins."""
+        self.shell.close()
+        self.web.close()
+        if self.plugin_manager:
+            self.plugin_manager.cleanup_all()
+    
+    async def aclose(self) -> None:
+        """close() for coroutines: also closes the async HTTP client on its loop."""
+        await self.web.aclose()
+        await asyncio.to_thread(self.close)
+    
     def execute_tool(self, tool_name: str, **kwargs) -> ToolExecutionResult:
         """
         Execute a tool by name (core tools or plugins).
@@ -463,11 +784,15 @@ class Toolbox:
                 kwargs.get("content", "")
             ),
             "delete_file": lambda: self.files.delete_file(kwargs.get("filepath", "")),
-            "list_files": lambda: self.files.list_files(kwargs.get("directory", ".")),
+            "list_files": lambda: self.files.list_files(
+                kwargs.get("directory", "."),
+                kwargs.get("include_size", True)
+            ),
             "web_fetch": lambda: self.web.fetch(
                 kwargs.get("url", ""),
                 kwargs.get("method", "GET"),
-                kwargs.get("data")
+                kwargs.get("data"),
+                kwargs.get("full", False)
             )
         }
         
@@ -477,14 +802,7 @@ class Toolbox:
         
         # Check plugins
         if self.plugin_manager and self.plugin_manager.has_plugin(tool_name):
-            result = self.plugin_manager.execute_plugin(tool_name, **kwargs)
-            # Convert PluginResult to ToolExecutionResult
-            return ToolExecutionResult(
-                success=result.success,
-                output=result.output,
-                error=result.error,
-                data=result.data
-            )
+            return self._tool_result(self.plugin_manager.execute_plugin(tool_name, **kwargs))
         
         # Tool not found
         return ToolExecutionResult(
@@ -492,10 +810,53 @@ class Toolbox:
             output="",
             error=f"❌ Unknown tool: {tool_name}"
         )
+    
+    async def aexecute_tool(self, tool_name: str, **kwargs) -> ToolExecutionResult:
+        """
+        Execute a tool by name from a coroutine.
+        
+        Shell commands, web fetches and plugins are awaited through their
+        async paths (an aiodocker exec or an HTTP request holds no thread);
+        the file tools run execute_tool on a worker thread.
+        
+        Args:
+            tool_name: Name of tool (shell, read_file, write_file, etc.) or plugin
+            **kwargs: Tool-specific arguments
+        """
+        if tool_name == "shell":
+            return await self.shell.aexecute(kwargs.get("command", ""))
+        if tool_name == "web_fetch":
+            return await self.web.afetch(
+                kwargs.get("url", ""),
+                kwargs.get("method", "GET"),
+                kwargs.get("data"),
+                kwargs.get("full", False)
+            )
+        
+        if (tool_name not in self.CORE_TOOLS and self.plugin_manager
+                and self.plugin_manager.has_plugin(tool_name)):
+            return self._tool_result(
+                await self.plugin_manager.aexecute_plugin(tool_name, **kwargs)
+            )
+        
+        return await asyncio.to_thread(self.execute_tool, tool_name, **kwargs)
+    
+    @staticmethod
+    def _tool_result(result) -> ToolExecutionResult:
+        """Convert a PluginResult to a ToolExecutionResult."""
+        return ToolExecutionResult(
+            success=result.success,
+            output=result.output,
+            error=result.error,
+            data=result.data
+        )
 
 
 # Example usage
 if __name__ == "__main__":
+    from logging_config import configure_logging
+    configure_logging()
+    
     toolbox = Toolbox()
     
     # Test file operations
@@ -12,6 +12,10 @@ import json
 import asyncio
 from typing import Dict, Any
 from agent_framework import SimpleAgent
+from logging_config import configure_logging
+
+# Entry point: send backend module logs to stderr
+configure_logging()
 
 app = FastAPI(title="Anti-C Code Agent Server")
 
@@ -129,7 +133,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 
                 # Generate plan using the agent
                 try:
-                    plan = agent.plan(task)
+                    plan = await agent.plan(task)
                     
                     # Send the plan to the client
                     plan_text = "📋 **Generated Plan:**\n\n"
@@ -223,6 +227,9 @@ async def websocket_endpoint(websocket: WebSocket):
         except:
             pass
         manager.disconnect(websocket)
+    
+    finally:
+        await agent.aclose()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,10 @@ import json
 import asyncio
 from typing import Dict, Any
 from agent_framework_v2 import AutonomousAgent
+from logging_config import configure_logging
+
+# Entry point: send backend module logs to stderr
+configure_logging()
 
 app = FastAPI(title="ArbiterAI 2.0 - The Executor")
 
@@ -115,7 +119,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 })
                 
                 try:
-                    plan = agent.plan(task, context)
+                    plan = await agent.plan(task, context)
                     
                     plan_text = "📋 **Execution Plan:**\n\n"
                     for i, step in enumerate(plan, 1):
@@ -154,7 +158,7 @@ async def websocket_endpoint(websocket: WebSocket):
                             })
                             
                             # Execute step
-                            result = agent.execute_step(step, context)
+                            result = await agent.execute_step(step, context)
                             context = result['context']
                             
                             # Send result
@@ -185,7 +189,7 @@ async def websocket_endpoint(websocket: WebSocket):
                                 })
                                 
                                 # Generate correction plan
-                                correction_plan = agent.reflect_on_error(
+                                correction_plan = await agent.reflect_on_error(
                                     original_task=task,
                                     failed_step=step,
                                     error=result.get('error', 'Unknown error'),
@@ -241,7 +245,7 @@ async def websocket_endpoint(websocket: WebSocket):
                         await manager.send_message(websocket, {
                             "type": "complete",
                             "content": completion_msg,
-                            "files": context.get('files', {}),
+                            "files": agent.export_files(context),
                             "history": context.get('history', [])
                         })
                     else:
@@ -281,6 +285,9 @@ async def websocket_endpoint(websocket: WebSocket):
         except:
             pass
         manager.disconnect(websocket)
+    
+    finally:
+        await agent.aclose()
 
 
 if __name__ == "__main__":